@@ -0,0 +1,202 @@
+import os
+import json
+import atexit
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from src.utils.atomic_file import atomic_write
+
+LOGIN_URL = "https://www.linkedin.com/login"
+FEED_URL = "https://www.linkedin.com/feed/"
+STORAGE_STATE_FILE = "data/cache/linkedin_state.json"
+POOL_SIZE = int(os.getenv("LINKEDIN_BROWSER_CONTEXTS", "2"))
+HEADLESS = os.getenv("LINKEDIN_HEADLESS", "false").lower() == "true"
+# A page that proved it was logged in within this window is trusted without reloading the feed
+SESSION_CHECK_INTERVAL = 600.0
+SHARE_BOX_SELECTOR = ".share-box-feed-entry__top-bar"
+
+
+@dataclass
+class _PooledPage:
+    context: BrowserContext
+    page: Page
+    state_version: int
+    checked_at: float = 0.0
+    # Set when the page was left in an unknown state and could not be replaced right away
+    broken: bool = False
+
+
+class LinkedInBrowserPool:
+    """
+    Warm pool of logged-in LinkedIn browser contexts.
+
+    One Chromium instance is launched on first use and kept alive. Contexts
+    are created from the saved `storage_state`, so a fresh process reuses the
+    last session instead of logging in. A context only logs in again when the
+    feed redirects it to the login page; the new state is saved to disk and
+    the other contexts are recreated from it.
+
+    Playwright objects are bound to the event loop that created them, so the
+    pool runs on its own thread and loop; `run` can be awaited from any loop.
+    """
+
+    def __init__(self, email: str, password: str, storage_state_path: str = STORAGE_STATE_FILE,
+                 size: int = POOL_SIZE, headless: bool = HEADLESS):
+        self.email = email
+        self.password = password
+        self.storage_state_path = storage_state_path
+        self.size = size
+        self.headless = headless
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_lock = threading.Lock()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._started: Optional[asyncio.Future] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._state_version = 0
+
+    # --- service loop ---
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="linkedin-browser", daemon=True).start()
+                self._loop = loop
+                atexit.register(self.shutdown)
+            return self._loop
+
+    async def run(self, action: Callable[[Page], Awaitable[Any]]) -> Any:
+        """Run `action(page)` on a warm, logged-in page and return its result."""
+        future = asyncio.run_coroutine_threadsafe(self._run(action), self._ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Close the browser and stop the service loop."""
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(timeout=10)
+        except Exception as e:
+            logging.warning(f"Failed to close the LinkedIn browser cleanly: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+    # --- pool (runs on the service loop) ---
+
+    async def _start(self) -> None:
+        # Callers that arrive while the browser is launching wait for the same launch
+        if self._started is None:
+            self._started = asyncio.ensure_future(self._launch())
+        await self._started
+
+    async def _launch(self) -> None:
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._idle = asyncio.Queue()
+        self._login_lock = asyncio.Lock()
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._new_page())
+        logging.info(f"Started LinkedIn browser with {self.size} warm contexts")
+
+    async def _new_page(self) -> _PooledPage:
+        state = self.storage_state_path if os.path.exists(self.storage_state_path) else None
+        context = await self._browser.new_context(storage_state=state)
+        try:
+            return _PooledPage(context, await context.new_page(), self._state_version)
+        except Exception:
+            await context.close()
+            raise
+
+    async def _recreate(self, pooled: _PooledPage) -> _PooledPage:
+        """Close a pooled context and open a fresh one in its place."""
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logging.warning(f"Failed to close a LinkedIn browser context: {str(e)}")
+        return await self._new_page()
+
+    async def _close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+        self._browser = None
+        self._started = None
+
+    async def _save_state(self, context: BrowserContext) -> None:
+        state = await context.storage_state()
+        # Session cookies: a first save is private to the user
+        with atomic_write(self.storage_state_path, "w", new_file_mode=0o600, encoding="utf-8") as f:
+            json.dump(state, f)
+
+    @staticmethod
+    def _on_login_page(page: Page) -> bool:
+        return any(marker in page.url for marker in ("/login", "/authwall", "/uas/login", "/checkpoint"))
+
+    async def _login(self, pooled: _PooledPage) -> None:
+        logging.info("LinkedIn session expired, logging in again")
+        page = pooled.page
+        await page.goto(LOGIN_URL)
+        await page.fill("#username", self.email)
+        await page.fill("#password", self.password)
+        await page.click("button[type='submit']")
+        await page.wait_for_url(f"{FEED_URL}**", timeout=30000)
+        await self._save_state(pooled.context)
+        self._state_version += 1
+        pooled.state_version = self._state_version
+
+    async def _ensure_session(self, pooled: _PooledPage) -> None:
+        """Make sure the page is on the feed and logged in, logging in only if the session expired."""
+        page = pooled.page
+        if page.url.startswith(FEED_URL) and time.time() - pooled.checked_at < SESSION_CHECK_INTERVAL:
+            return
+        await page.goto(FEED_URL)
+        if self._on_login_page(page):
+            async with self._login_lock:
+                if pooled.state_version < self._state_version:
+                    # Another context logged in while this one waited; reuse its cookies
+                    with open(self.storage_state_path, "r", encoding="utf-8") as f:
+                        await pooled.context.add_cookies(json.load(f)["cookies"])
+                    pooled.state_version = self._state_version
+                    await page.goto(FEED_URL)
+                if self._on_login_page(page):
+                    await self._login(pooled)
+        await page.wait_for_selector(SHARE_BOX_SELECTOR, timeout=30000)
+        pooled.checked_at = time.time()
+
+    async def _acquire(self) -> _PooledPage:
+        pooled = await self._idle.get()
+        if pooled.broken or pooled.state_version < self._state_version or pooled.page.is_closed():
+            # Another context logged in again (or the page broke); pick up the new session
+            try:
+                pooled = await self._recreate(pooled)
+            except Exception:
+                # Keep the slot so the pool never shrinks; the next caller retries
+                self._idle.put_nowait(pooled)
+                raise
+        return pooled
+
+    async def _run(self, action: Callable[[Page], Awaitable[Any]]) -> Any:
+        await self._start()
+        pooled = await self._acquire()
+        try:
+            await self._ensure_session(pooled)
+            result = await action(pooled.page)
+        except Exception:
+            # Don't hand a page in an unknown state to the next caller
+            pooled.broken = True
+            try:
+                pooled = await self._recreate(pooled)
+            except Exception as e:
+                logging.warning(f"Failed to replace a LinkedIn browser context, retrying on next use: {str(e)}")
+            self._idle.put_nowait(pooled)
+            raise
+        self._idle.put_nowait(pooled)
+        return result
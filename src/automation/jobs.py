@@ -0,0 +1,90 @@
+import os
+import logging
+from typing import List, Optional
+
+from src.storage.content_store import ContentStore
+from src.storage.job_store import JobStore
+from src.storage.post_status_store import PostStatusStore
+from src.storage.posting_store import PostingStore
+from src.utils.job_queue import JobQueue
+from src.automation.posting_queue import PostingQueue
+
+# --- CONFIG ---
+DATA_DIR = os.getenv(
+    "CONTENT_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data"),
+)
+GENERATION_STRATEGIES = ("ml_tips", "tech_news")
+# Content type the posting queue and poster use for each strategy's posts
+STRATEGY_CONTENT_TYPES = {"ml_tips": "Tip", "tech_news": "News"}
+# Unposted drafts looked at when picking the next post of a strategy
+NEXT_POST_CANDIDATES = 50
+
+# Shared by the web app and the scheduler daemon. Nothing here starts a
+# thread at import: whichever process calls posting_queue.start() is the one
+# that runs the posting consumer.
+content_stores = {
+    "ml_tips": ContentStore(os.path.join(DATA_DIR, "tips_posts")),
+    "tech_news": ContentStore(os.path.join(DATA_DIR, "news_posts")),
+}
+post_status = PostStatusStore(os.path.join(DATA_DIR, "post_status.db"))
+job_store = JobStore(os.path.join(DATA_DIR, "jobs.db"))
+job_queue = JobQueue(job_store, max_workers=4, limits={"ml_tips": 2, "tech_news": 1})
+
+
+def content_type_of(post_id: str) -> str:
+    return "Tip" if post_id.startswith("TIP_") else "News"
+
+
+def mark_posted(post_id: str, content_type: str) -> None:
+    """Mark a post as posted in the status store."""
+    post_status.mark_posted(post_id, "tip" if content_type == "Tip" else "news")
+
+
+async def publish_post(post_id: str, content_type: str) -> bool:
+    # Imported on first use so processes that never publish don't load Playwright
+    from src.automation.linkedin_poster import post_to_linkedin
+    return await post_to_linkedin(post_id, content_type)
+
+
+# Posts are published in order by a single consumer (one browser session across all processes)
+posting_queue = PostingQueue(PostingStore(os.path.join(DATA_DIR, "posting.db")),
+                             publish_post, on_published=mark_posted)
+
+
+def queue_posts(post_ids: List[str]) -> str:
+    """Queue posts for publishing and return the batch id."""
+    return posting_queue.submit([
+        {"post_id": post_id, "content_type": content_type_of(post_id)}
+        for post_id in post_ids
+    ])
+
+
+def submit_generation(strategy_name: str) -> str:
+    """Queue a generation job for a strategy and return its job id."""
+    if strategy_name == "ml_tips":
+        def job(progress):
+            from src.content_generators.ml_tips import main as generate_ml_tips
+            generate_ml_tips(n=3, progress=progress)
+    else:  # tech_news
+        def job(progress):
+            from src.content_generators.tech_news import generate_tech_news_content
+            generate_tech_news_content(progress=progress)
+
+    job_id = job_queue.submit(strategy_name, job)
+    logging.info(f"Queued {strategy_name} generation as job {job_id}")
+    return job_id
+
+
+def queue_next_post(strategy_name: str) -> Optional[str]:
+    """Queue the newest unposted draft of a strategy; returns the batch id or None if there is none."""
+    content_type = STRATEGY_CONTENT_TYPES[strategy_name]
+    candidates = post_status.unposted("tip" if content_type == "Tip" else "news", NEXT_POST_CANDIDATES)
+    drafts = content_stores[strategy_name].existing(candidates)
+    post_id = next((candidate for candidate in candidates if candidate in drafts), None)
+    if post_id is None:
+        logging.warning(f"No unposted {strategy_name} drafts to publish")
+        return None
+    batch_id = queue_posts([post_id])
+    logging.info(f"Queued {post_id} for publishing (batch {batch_id})")
+    return batch_id
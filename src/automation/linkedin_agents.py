@@ -14,6 +14,7 @@ from playwright.async_api import async_playwright, Page
 from dotenv import load_dotenv
 import openai
 from src.utils.utils import setup_logging
+from src.utils.llm import chat_completion, achat_completion
 import pandas as pd
 
 # --- SETUP ---
@@ -21,6 +22,76 @@ load_dotenv()
 setup_logging("data/logs/linkedin_agents.log")
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# --- FEED EXTRACTION ---
+FEED_POST_SELECTOR = ".feed-shared-update-v2"
+POST_TEXT_SELECTOR = ".update-components-text"
+REACTIONS_SELECTOR = ".social-details-social-counts__reactions-count"
+COMMENTS_SELECTOR = ".social-details-social-counts__comments"
+
+# Reads every feed post not handled by an earlier call in one round trip. Handled
+# nodes are marked with data-collected, and posts are keyed by their activity URN
+# (falling back to data-id, then the text) so re-rendered copies of a post are
+# skipped. Posts with none of these, e.g. image-only posts, are keyed by the
+# order they were collected in on this page load, so they are never merged.
+EXTRACT_POSTS_JS = """
+({selectors, limit}) => {
+    const state = window.__collectedPosts ||
+        (window.__collectedPosts = {keys: new Set(), count: 0, page: performance.timeOrigin});
+    const text = (root, selector) => {
+        const el = root.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+    const posts = [];
+    for (const node of document.querySelectorAll(`${selectors.post}:not([data-collected])`)) {
+        if (posts.length >= limit) break;
+        // Placeholders of posts that are not rendered yet are picked up on a later scroll
+        if (!node.innerText.trim()) continue;
+        const index = state.count++;
+        node.setAttribute("data-collected", String(index));
+        const content = text(node, selectors.text) || "";
+        const holder = node.closest("[data-urn]") || node.querySelector("[data-urn]");
+        const urn = (holder && holder.getAttribute("data-urn")) || node.getAttribute("data-id") ||
+            (content ? `text:${content}` : `node:${state.page}:${index}`);
+        if (state.keys.has(urn)) continue;
+        state.keys.add(urn);
+        posts.push({
+            urn: urn,
+            content: content,
+            likes: text(node, selectors.likes) || "0",
+            comments: text(node, selectors.comments) || "0",
+        });
+    }
+    return posts;
+}
+"""
+
+# Scrolling waits for new posts to render instead of sleeping for a fixed time
+SCROLL_MAX_WAIT_MS = 10000
+# Consecutive scrolls without new posts before the feed is treated as exhausted
+SCROLL_STALL_LIMIT = 2
+
+# Scrolls to the bottom and resolves once an uncollected post with text is in the
+# DOM (watched with a MutationObserver) or after `timeout` ms, with the latency.
+SCROLL_AND_WAIT_JS = """
+({selector, timeout}) => new Promise(resolve => {
+    const start = performance.now();
+    const ready = () => Array.from(document.querySelectorAll(`${selector}:not([data-collected])`))
+        .some(node => node.innerText.trim());
+    let observer = null;
+    let timer = null;
+    const finish = loaded => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve({loaded: loaded, elapsed: performance.now() - start});
+    };
+    observer = new MutationObserver(() => { if (ready()) finish(true); });
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    timer = setTimeout(() => finish(false), timeout);
+    window.scrollTo(0, document.body.scrollHeight);
+    if (ready()) finish(true);
+})
+"""
+
 class LinkedInAgent:
     """Base class for LinkedIn automation agents."""
     
@@ -53,61 +124,53 @@ class ContentStrategyAgent(LinkedInAgent):
         """Scroll through feed and collect post data."""
         try:
             posts_data = []
-            last_height = await page.evaluate('document.body.scrollHeight')
+            seen_urns = set()
+            selectors = {
+                "post": FEED_POST_SELECTOR,
+                "text": POST_TEXT_SELECTOR,
+                "likes": REACTIONS_SELECTOR,
+                "comments": COMMENTS_SELECTOR,
+            }
             scroll_count = 0
+            stalls = 0
             
             print("Starting to scroll and collect posts...")
             while len(posts_data) < num_posts:
                 scroll_count += 1
                 print(f"\nScroll attempt {scroll_count}")
                 
-                # Get all visible posts
-                posts = await page.query_selector_all(".feed-shared-update-v2")
-                print(f"Found {len(posts)} posts on current scroll")
+                # Extract only the posts that appeared since the last scroll, in one round trip
+                new_posts = await page.evaluate(
+                    EXTRACT_POSTS_JS, {"selectors": selectors, "limit": num_posts - len(posts_data)}
+                )
+                for post_data in new_posts:
+                    # The page-side set resets on navigation; keep our own as well
+                    if post_data["urn"] in seen_urns:
+                        continue
+                    seen_urns.add(post_data["urn"])
+                    posts_data.append(post_data)
+                print(f"Collected {len(new_posts)} new posts ({len(posts_data)}/{num_posts})")
                 
-                for post in posts:
-                    if len(posts_data) >= num_posts:
+                # A scroll that brought no new posts counts towards the end of the feed
+                if new_posts:
+                    stalls = 0
+                elif scroll_count > 1:
+                    stalls += 1
+                    if stalls >= SCROLL_STALL_LIMIT:
+                        print("Reached end of feed")
                         break
-                        
-                    try:
-                        # Get post content directly from .update-components-text
-                        content = await post.query_selector(".update-components-text")
-                        content_text = await content.inner_text() if content else ""
-                        
-                        # Get engagement metrics
-                        likes = await post.query_selector(".social-details-social-counts__reactions-count")
-                        comments = await post.query_selector(".social-details-social-counts__comments")
-                        
-                        likes_count = await likes.inner_text() if likes else "0"
-                        comments_count = await comments.inner_text() if comments else "0"
-                        
-                        post_data = {
-                            "content": content_text,
-                            "likes": likes_count,
-                            "comments": comments_count,
-                        }
-                        
-                        # Only add if we haven't seen this post before
-                        if not any(p["content"] == content_text for p in posts_data):
-                            posts_data.append(post_data)
-                            print(f"Collected post {len(posts_data)}/{num_posts}")
-                            
-                    except Exception as e:
-                        logging.error(f"Error processing post: {str(e)}")
-                        print(f"Error processing post: {str(e)}")
-                        continue
+                if len(posts_data) >= num_posts:
+                    break
                 
-                # Scroll down
+                # Scroll down and wait until new posts render (or the wait ceiling)
                 print("Scrolling down...")
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                await page.wait_for_timeout(3000)  # Increased wait time
-                
-                # Check if we've reached the bottom
-                new_height = await page.evaluate('document.body.scrollHeight')
-                if new_height == last_height:
-                    print("Reached end of feed")
-                    break
-                last_height = new_height
+                result = await page.evaluate(
+                    SCROLL_AND_WAIT_JS, {"selector": FEED_POST_SELECTOR, "timeout": SCROLL_MAX_WAIT_MS}
+                )
+                if result["loaded"]:
+                    logging.info(f"Scroll {scroll_count}: new posts after {result['elapsed']:.0f} ms")
+                else:
+                    logging.info(f"Scroll {scroll_count}: no new posts within {SCROLL_MAX_WAIT_MS} ms")
             
             return posts_data
             
@@ -167,7 +230,7 @@ class ContentStrategyAgent(LinkedInAgent):
             4. Hashtag usage
             """
             
-            response = openai.chat.completions.create(
+            response = chat_completion(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": "You are a social media strategy expert."},
@@ -266,7 +329,7 @@ class EngagementAgent(LinkedInAgent):
             4. Be concise (max 2-3 sentences)
             """
             
-            response = openai.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": "You are a professional ML engineer engaging in thoughtful discussion."},
@@ -1,24 +1,52 @@
 import os
 import logging
 import asyncio
-from pathlib import Path
-from playwright.async_api import async_playwright
+from playwright.async_api import Page
 from dotenv import load_dotenv
 from src.utils.utils import setup_logging
-from typing import Optional
+from src.automation.browser_pool import LinkedInBrowserPool, SHARE_BOX_SELECTOR
+from src.automation.jobs import DATA_DIR, STRATEGY_CONTENT_TYPES
+from src.automation.jobs import content_stores as strategy_stores
 
 # --- SETUP ---
 load_dotenv()
-setup_logging("data/logs/linkedin_poster.log")
+setup_logging(os.path.join(DATA_DIR, "logs", "linkedin_poster.log"))
 
 # --- CONFIG ---
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+STORAGE_STATE_FILE = os.path.join(DATA_DIR, "cache", "linkedin_state.json")
+# The generators' own long-lived stores, keyed by content type, so drafts are
+# read from DATA_DIR whatever directory the posting process was started from
+content_stores = {
+    content_type: strategy_stores[strategy]
+    for strategy, content_type in STRATEGY_CONTENT_TYPES.items()
+}
+browser_pool = LinkedInBrowserPool(LINKEDIN_EMAIL, LINKEDIN_PASSWORD, storage_state_path=STORAGE_STATE_FILE)
+
+async def _publish(page: Page, content: str) -> None:
+    """Compose and submit a post from a logged-in feed page."""
+    # Click on "Start a post" button
+    await page.click(SHARE_BOX_SELECTOR)
+    
+    # Wait for post dialog and enter content
+    await page.wait_for_selector(".ql-editor")
+    await page.fill(".ql-editor", content)
+    
+    # Click post button
+    await page.click("button.artdeco-button--primary")
+    
+    # Wait for the dialog to close once the post is published
+    await page.wait_for_selector(".ql-editor", state="detached", timeout=30000)
 
 async def post_to_linkedin(post_id: str, content_type: str) -> bool:
     """
     Post content to LinkedIn using Playwright automation.
     
+    Uses a warm, logged-in page from the shared browser pool, so only the
+    first post of a process pays for the browser start (and a login only
+    when the saved session has expired).
+    
     Args:
         post_id: The ID of the post to publish (e.g., "N_POST_001" or "TIP_abc123")
         content_type: Type of content ("News" or "Tip")
@@ -28,48 +56,14 @@ async def post_to_linkedin(post_id: str, content_type: str) -> bool:
     """
     try:
         # Read post content
-        if content_type == "News":
-            file_path = Path("data/news_posts") / f"{post_id}.txt"
-        else:  # Tips
-            file_path = Path("data/tips_posts") / f"{post_id}.txt"
-            
-        if not file_path.exists():
-            logging.error(f"Content file not found for {post_id}")
+        content = content_stores.get(content_type, content_stores["Tip"]).get(post_id)
+        if content is None:
+            logging.error(f"Content not found for {post_id}")
             return False
-            
-        content = file_path.read_text(encoding="utf-8")
         
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=False)  # Show browser
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            # Login to LinkedIn
-            await page.goto("https://www.linkedin.com/login")
-            await page.fill("#username", LINKEDIN_EMAIL)
-            await page.fill("#password", LINKEDIN_PASSWORD)
-            await page.click("button[type='submit']")
-            
-            # Wait for login to complete
-            await page.wait_for_selector(".feed-shared-update-v2", timeout=30000)
-            
-            # Click on "Start a post" button
-            await page.click(".share-box-feed-entry__top-bar")
-            
-            # Wait for post dialog and enter content
-            await page.wait_for_selector(".ql-editor")
-            await page.fill(".ql-editor", content)
-            
-            # Click post button
-            await page.click("button.artdeco-button--primary")
-            
-            # Wait for post to be published
-            await page.wait_for_selector(".feed-shared-update-v2", timeout=30000)
-            
-            # Keep browser open for review
-            logging.info(f"Successfully posted {post_id} to LinkedIn")
-            return True
+        await browser_pool.run(lambda page: _publish(page, content))
+        logging.info(f"Successfully posted {post_id} to LinkedIn")
+        return True
             
     except Exception as e:
         logging.error(f"Error posting to LinkedIn: {str(e)}")
@@ -0,0 +1,114 @@
+import os
+import uuid
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.storage.posting_store import PostingStore
+
+# Seconds between two consecutive posts
+POST_INTERVAL = float(os.getenv("LINKEDIN_POST_INTERVAL", "60"))
+LEASE_TTL = 300.0
+# How often the lease is renewed while a publish is running
+LEASE_RENEW_INTERVAL = 30.0
+IDLE_POLL = 2.0
+
+
+class PostingQueue:
+    """
+    Single consumer that publishes queued posts in order, one at a time.
+
+    Items are kept in a shared PostingStore, so any process can enqueue.
+    `submit` only enqueues; the consumer thread runs in processes that call
+    `start`, and only the holder of the store's lease publishes, so there is
+    never more than one browser session posting to the account. The lease is
+    renewed while a post is being published, however long that takes, so a
+    slow publish is never mistaken for a dead consumer.
+    """
+
+    def __init__(self, store: PostingStore, publish: Callable[[str, str], Awaitable[bool]],
+                 on_published: Optional[Callable[[str, str], None]] = None,
+                 interval: float = POST_INTERVAL):
+        self.store = store
+        self.publish = publish
+        self.on_published = on_published
+        self.interval = interval
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._consume, name="posting-queue", daemon=True)
+                self._thread.start()
+
+    def submit(self, items: List[Dict]) -> str:
+        """Queue {"post_id", "content_type"} items and return the batch id."""
+        batch_id = self.store.enqueue(items)
+        self._wakeup.set()
+        return batch_id
+
+    def _wait(self, seconds: float) -> None:
+        self._wakeup.wait(seconds)
+        self._wakeup.clear()
+
+    def _consume(self) -> None:
+        holding = False
+        next_post_at = 0.0
+        while True:
+            try:
+                if not self.store.acquire_lease(self.owner, LEASE_TTL):
+                    holding = False
+                    self._wait(IDLE_POLL)
+                    continue
+                if not holding:
+                    self.store.fail_interrupted()
+                    holding = True
+                if time.time() < next_post_at:
+                    self._wait(min(next_post_at - time.time(), IDLE_POLL))
+                    continue
+                item = self.store.claim_next()
+                if item is None:
+                    self._wait(IDLE_POLL)
+                    continue
+                self._publish(item)
+                next_post_at = time.time() + self.interval
+            except Exception as e:
+                logging.error(f"Posting queue error: {str(e)}")
+                self._wait(IDLE_POLL)
+
+    def _renew_lease(self, done: threading.Event) -> None:
+        while not done.wait(LEASE_RENEW_INTERVAL):
+            try:
+                if not self.store.acquire_lease(self.owner, LEASE_TTL):
+                    logging.error("Lost the posting lease while publishing")
+            except Exception as e:
+                logging.error(f"Failed to renew the posting lease: {str(e)}")
+
+    def _publish(self, item: Dict) -> None:
+        post_id = item["post_id"]
+        done = threading.Event()
+        renewer = threading.Thread(target=self._renew_lease, args=(done,), name="posting-lease", daemon=True)
+        renewer.start()
+        try:
+            try:
+                error = None if asyncio.run(self.publish(post_id, item["content_type"])) else "Publishing failed"
+            except Exception as e:
+                error = str(e)
+            if error is None and self.on_published:
+                try:
+                    self.on_published(post_id, item["content_type"])
+                except Exception as e:
+                    logging.error(f"Published {post_id} but failed to record it: {str(e)}")
+            self.store.finish(item["id"], error)
+        finally:
+            done.set()
+            renewer.join()
+        if error:
+            logging.error(f"Failed to publish {post_id}: {error}")
+        else:
+            logging.info(f"Published {post_id} from the posting queue")
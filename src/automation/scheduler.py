@@ -0,0 +1,240 @@
+import os
+import json
+import argparse
+import heapq
+import zlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config.strategy_registry import StrategyRegistry
+from src.utils.atomic_file import atomic_write
+
+# --- CONFIG ---
+SCHEDULER_STATE_FILE = "data/scheduler_state.json"
+DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+# Generation runs ahead of the posting slots, on the days implied by `frequency`
+GENERATION_TIME = os.getenv("SCHEDULER_GENERATION_TIME", "06:00")
+FREQUENCY_DAYS = {"daily": DAYS, "weekly": ["monday"]}
+# Each slot fires up to this many seconds late (stable per slot) so strategies don't all fire at once
+MAX_JITTER = float(os.getenv("SCHEDULER_JITTER", "300"))
+# A slot missed while the scheduler was down runs on start-up if it is at most this old
+CATCH_UP_WINDOW = float(os.getenv("SCHEDULER_CATCH_UP_WINDOW", "3600"))
+# Missed-slot rule; a strategy can override it with `missed_slots` in its content type
+MISSED_SLOTS = os.getenv("SCHEDULER_MISSED_SLOTS", "catch_up")
+RELOAD_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A weekly recurring action of one strategy."""
+    strategy: str
+    action: str
+    weekday: int
+    hour: int
+    minute: int
+    missed: str = "catch_up"
+
+    @property
+    def key(self) -> str:
+        return f"{self.strategy}:{self.action}:{DAYS[self.weekday]}:{self.hour:02d}:{self.minute:02d}"
+
+
+def _parse_time(value) -> Tuple[int, int]:
+    # YAML 1.1 reads unquoted times such as 10:00 as base-60 integers (600)
+    if isinstance(value, int):
+        return value // 60, value % 60
+    hour, minute = str(value).strip().split(":")
+    return int(hour), int(minute)
+
+
+def parse_slots(strategies: Dict) -> List[Slot]:
+    """Posting slots from `posting_schedule` and generation slots from each content type's `frequency`."""
+    content_types = strategies.get("content_types") or {}
+    slots = []
+
+    def add(strategy: str, action: str, day, at) -> None:
+        try:
+            hour, minute = _parse_time(at)
+            missed = (content_types.get(strategy) or {}).get("missed_slots", MISSED_SLOTS)
+            slots.append(Slot(strategy, action, DAYS.index(str(day).lower()), hour, minute, missed))
+        except (ValueError, AttributeError) as e:
+            logging.warning(f"Ignoring invalid {action} slot {day} {at} of {strategy}: {str(e)}")
+
+    for strategy, entries in (strategies.get("posting_schedule") or {}).items():
+        for entry in entries or []:
+            add(strategy, "post", entry.get("day"), entry.get("time"))
+    for strategy, content_type in content_types.items():
+        frequency = (content_type or {}).get("frequency")
+        if frequency is None:
+            continue
+        if frequency not in FREQUENCY_DAYS:
+            logging.warning(f"Unknown frequency {frequency!r} for {strategy}; not scheduling generation")
+            continue
+        for day in FREQUENCY_DAYS[frequency]:
+            add(strategy, "generate", day, GENERATION_TIME)
+    return slots
+
+
+def next_occurrence(slot: Slot, after: datetime) -> datetime:
+    """First local time strictly after `after` that matches the slot."""
+    candidate = after.replace(hour=slot.hour, minute=slot.minute, second=0, microsecond=0)
+    candidate += timedelta(days=(slot.weekday - after.weekday()) % 7)
+    if candidate <= after:
+        candidate += timedelta(days=7)
+    return candidate
+
+
+def slot_jitter(slot: Slot, max_jitter: float) -> float:
+    """Stable per-slot delay in [0, max_jitter), so reloads and restarts don't reshuffle it."""
+    return (zlib.crc32(slot.key.encode("utf-8")) % 10000) / 10000 * max_jitter
+
+
+class PostingScheduler:
+    """
+    Long-running scheduler for the generation and posting slots of every strategy.
+
+    All upcoming slots sit in one heap ordered by fire time, so a single
+    thread sleeps until the earliest one, whatever the number of strategies.
+    The schedule is rebuilt when the strategies file changes. The last fired
+    occurrence of each slot is saved, so after a restart a missed slot is
+    either run once (`catch_up`, if within the catch-up window) or skipped
+    (`skip`).
+
+    `actions` maps an action name ("generate", "post") to a callable taking
+    the strategy name; it should only queue work and return quickly.
+    """
+
+    def __init__(self, registry: StrategyRegistry, actions: Dict[str, Callable[[str], None]],
+                 state_path: str = SCHEDULER_STATE_FILE, max_jitter: float = MAX_JITTER,
+                 catch_up_window: float = CATCH_UP_WINDOW, clock: Callable[[], float] = time.time):
+        self.registry = registry
+        self.actions = actions
+        self.state_path = state_path
+        self.max_jitter = max_jitter
+        self.catch_up_window = catch_up_window
+        self.clock = clock
+        self._heap: List[Tuple[float, int, Slot, float]] = []
+        self._seq = 0
+        self._version = None
+        self._last_fired: Dict[str, float] = self._load_state()
+
+    def _load_state(self) -> Dict[str, float]:
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable scheduler state {self.state_path}: {str(e)}")
+            return {}
+
+    def _save_state(self) -> None:
+        with atomic_write(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(self._last_fired, f)
+
+    def _push(self, slot: Slot, occurrence: datetime, fire_at: Optional[float] = None) -> None:
+        base = occurrence.timestamp()
+        if fire_at is None:
+            fire_at = base + slot_jitter(slot, self.max_jitter)
+        heapq.heappush(self._heap, (fire_at, self._seq, slot, base))
+        self._seq += 1
+
+    def reload(self) -> None:
+        """Rebuild the heap from the strategies file, queueing catch-up runs for missed slots."""
+        now = self.clock()
+        current = datetime.fromtimestamp(now)
+        self._heap = []
+        slots = [s for s in parse_slots(self.registry.load()) if s.action in self.actions]
+        for slot in slots:
+            upcoming = next_occurrence(slot, current)
+            previous = upcoming - timedelta(days=7)
+            last_fired = self._last_fired.get(slot.key)
+            pending = last_fired is not None and last_fired < previous.timestamp()
+            if pending and previous.timestamp() + slot_jitter(slot, self.max_jitter) > now:
+                # Still inside its jitter window
+                self._push(slot, previous)
+            elif pending and slot.missed == "catch_up" and now - previous.timestamp() <= self.catch_up_window:
+                logging.info(f"Catching up missed slot {slot.key} of {previous:%Y-%m-%d %H:%M}")
+                self._push(slot, previous, fire_at=now)
+            else:
+                if pending:
+                    logging.info(f"Skipping missed slot {slot.key} of {previous:%Y-%m-%d %H:%M}")
+                self._push(slot, upcoming)
+            if last_fired is None:
+                # A new slot starts counting from now, so it is never treated as missed
+                self._last_fired[slot.key] = now
+        self._save_state()
+        logging.info(f"Scheduled {len(slots)} slots across {len({s.strategy for s in slots})} strategies")
+
+    def _reload_if_changed(self) -> None:
+        version = self.registry.version()
+        if version != self._version:
+            self._version = version
+            self.reload()
+
+    def run_pending(self) -> float:
+        """Fire every due slot; return the seconds until the next one (or the reload interval)."""
+        self._reload_if_changed()
+        now = self.clock()
+        fired = False
+        while self._heap and self._heap[0][0] <= now:
+            _, _, slot, base = heapq.heappop(self._heap)
+            logging.info(f"Running {slot.action} for {slot.strategy} ({slot.key})")
+            try:
+                self.actions[slot.action](slot.strategy)
+            except Exception as e:
+                logging.error(f"Scheduled {slot.action} for {slot.strategy} failed: {str(e)}")
+            self._last_fired[slot.key] = base
+            self._push(slot, next_occurrence(slot, datetime.fromtimestamp(base)))
+            fired = True
+        if fired:
+            self._save_state()
+        if not self._heap:
+            return RELOAD_INTERVAL
+        return min(max(self._heap[0][0] - now, 0.0), RELOAD_INTERVAL)
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """Run until `stop` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                delay = self.run_pending()
+            except Exception as e:
+                logging.error(f"Scheduler error: {str(e)}")
+                delay = RELOAD_INTERVAL
+            stop.wait(delay)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the generation and posting schedule of every strategy.")
+    parser.add_argument("--consume", action="store_true",
+                        help="Also publish queued posts from this process (when the web app is not running)")
+    args = parser.parse_args()
+
+    from src.automation.jobs import (
+        GENERATION_STRATEGIES, STRATEGY_CONTENT_TYPES, posting_queue, queue_next_post, submit_generation,
+    )
+    if args.consume:
+        posting_queue.start()
+
+    def generate(strategy: str) -> None:
+        if strategy in GENERATION_STRATEGIES:
+            submit_generation(strategy)
+        else:
+            logging.warning(f"No generator for {strategy}; skipping scheduled generation")
+
+    def post(strategy: str) -> None:
+        if strategy in STRATEGY_CONTENT_TYPES:
+            queue_next_post(strategy)
+        else:
+            logging.warning(f"No posts for {strategy}; skipping scheduled posting")
+
+    PostingScheduler(StrategyRegistry(), {"generate": generate, "post": post}).run()
+
+
+if __name__ == "__main__":
+    main()
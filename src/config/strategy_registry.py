@@ -0,0 +1,121 @@
+import os
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+import yaml
+
+# Cross-process file locking is POSIX only; elsewhere only threads are serialized
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+from src.utils.atomic_file import atomic_write
+
+STRATEGIES_FILE = "src/config/content_strategies.yaml"
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed YAML: mappings become mapping proxies and lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Plain, mutable dict/list copy of a frozen snapshot."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class StrategyRegistry:
+    """
+    Cached view of the content strategies YAML file.
+
+    The file is parsed once and re-parsed only when its mtime or size
+    changes. `load` hands every caller the same read-only snapshot, so a
+    request costs no copying; changes go through `update`, which works on a
+    mutable copy. Saves go through a temp file and os.replace, so readers
+    never see a half-written file. Saves and read-modify-write updates hold an
+    exclusive lock on `<path>.lock`, so web workers and the scheduler
+    process never overwrite each other's edits.
+    """
+
+    def __init__(self, path: str = STRATEGIES_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._signature: Optional[Tuple[int, int]] = None
+        self._strategies: Mapping = _freeze({})
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def version(self) -> Optional[Tuple[int, int]]:
+        """Cheap change marker (mtime and size of the strategies file)."""
+        return self._file_signature()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the in-process lock and, outermost only, the lock file shared with other processes."""
+        with self._lock:
+            self._lock_depth += 1
+            try:
+                if self._lock_depth > 1 or fcntl is None:
+                    yield
+                    return
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path + ".lock", "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+            finally:
+                self._lock_depth -= 1
+
+    def load(self) -> Mapping:
+        """Return a read-only snapshot of the strategies, re-reading the file only if it changed."""
+        with self._lock:
+            signature = self._file_signature()
+            if signature != self._signature:
+                if signature is None:
+                    self._strategies = _freeze({})
+                else:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._strategies = _freeze(yaml.load(f, Loader=SafeLoader) or {})
+                self._signature = signature
+            return self._strategies
+
+    def save(self, strategies: Mapping) -> None:
+        """Atomically replace the strategies file and the cache."""
+        with self._locked():
+            with atomic_write(self.path, "w", encoding="utf-8") as f:
+                yaml.dump(_thaw(strategies), f, Dumper=SafeDumper, default_flow_style=False)
+            self._strategies = _freeze(strategies)
+            self._signature = self._file_signature()
+
+    def update(self, change: Callable[[Dict], None]) -> Dict:
+        """Apply `change` to the latest strategies and save them, as one step for concurrent editors."""
+        with self._locked():
+            strategies = _thaw(self.load())
+            change(strategies)
+            self.save(strategies)
+            return strategies
@@ -0,0 +1,95 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+
+from src.content_generators.dedup import canonical_url
+
+
+class ArticleCache:
+    """
+    On-disk cache of extracted article text, keyed by a hash of the canonical URL.
+
+    Entries expire after ``ttl`` seconds. When the stored text exceeds
+    ``max_bytes`` the least recently used entries are evicted first.
+    """
+
+    def __init__(self, path: str, ttl: float, max_bytes: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                title TEXT,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Return the content address for a URL."""
+        return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached title and text for a URL, or None on a miss or expiry."""
+        key = self.key_for(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, text, created_at FROM articles WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            title, text, created_at = row
+            if now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE articles SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return {"title": title, "text": text}
+
+    def put(self, url: str, title: str, text: str) -> None:
+        """Store the extracted title and text for a URL and enforce the size budget."""
+        now = time.time()
+        size = len(text.encode("utf-8")) + len((title or "").encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (key, url, title, text, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.key_for(url), url, title, text, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then LRU entries until under max_bytes (caller holds the lock)."""
+        self._conn.execute("DELETE FROM articles WHERE created_at < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM articles ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logging.debug(f"Evicted {evicted} articles from cache {self.path}")
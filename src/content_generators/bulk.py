@@ -0,0 +1,184 @@
+"""
+Offline bulk jobs for backfills: rescoring articles, generating news posts
+and pre-generating ML tips through a JSONL batch endpoint.
+
+Usage:
+    python -m src.content_generators.bulk score [--limit N] [--backend openai|local]
+    python -m src.content_generators.bulk posts --limit 20
+    python -m src.content_generators.bulk tips --limit 30
+
+Re-running the same command with the same --name resumes the job: requests
+are only written once, the batch is only submitted again if it failed,
+expired or was cancelled, and results that were already merged are skipped.
+"""
+import os
+import hashlib
+import logging
+import argparse
+from datetime import date
+from typing import Callable, Dict, Iterator, Tuple
+
+from src.utils.batch_jobs import BACKENDS, BatchJob
+from src.content_generators.tech_news import (
+    article_store,
+    append_post_csv,
+    fetch_article_content,
+    news_store,
+    parse_score_lines,
+    post_messages,
+    post_status,
+    score_messages,
+)
+from src.content_generators.ml_tips import MLTipsGenerator
+
+JOBS_DIR = "data/jobs"
+MODEL = "gpt-4"
+
+
+def _with_content(row: Dict) -> Dict:
+    fetched = fetch_article_content(row["link"], row["title"])
+    if not fetched or not fetched.get("content"):
+        raise ValueError("no article content")
+    return {**row, "content": fetched["content"]}
+
+
+def build_score_requests(limit: int) -> Iterator[Tuple[str, Dict]]:
+    """Score requests for the most recent `limit` stored articles."""
+    for row in article_store.list_articles(limit):
+        try:
+            article = _with_content(row)
+        except Exception as e:
+            logging.error(f"Skipping {row['link']}: {str(e)}")
+            continue
+        yield f"score:{row['id']}", {"model": MODEL, "messages": score_messages(article), "temperature": 0.3}
+
+
+def merge_score(custom_id: str, content: str) -> None:
+    article_id = int(custom_id.split(":", 1)[1])
+    article_store.update_scores(article_id, *parse_score_lines(content))
+
+
+def build_post_requests(limit: int) -> Iterator[Tuple[str, Dict]]:
+    """Post generation requests for the best `limit` unposted articles."""
+    for row in article_store.best_unposted(limit):
+        try:
+            article = _with_content(row)
+        except Exception as e:
+            logging.error(f"Skipping {row['link']}: {str(e)}")
+            continue
+        yield f"post:{row['id']}", {"model": MODEL, "messages": post_messages(article), "temperature": 0.7}
+
+
+def merge_post(custom_id: str, content: str) -> None:
+    article = article_store.get_article(int(custom_id.split(":", 1)[1]))
+    if article is None or article["post_created"]:
+        return
+    post_status.import_csv_once()
+    post_id = post_status.allocate_id("N_POST_")
+    news_store.put(post_id, content)
+    post_status.register([post_id], "news")
+    post = {
+        "ID": post_id,
+        "Posted": False,
+        "Title": article["title"],
+        "Link": article["link"],
+        "Source": article["source"],
+        "Interest": article["interest"],
+        "Accessibility": article["accessibility"],
+        "Relevance": article["relevance"],
+    }
+    article_store.add_post(post)
+    article_store.mark_post_created(article["link"])
+    append_post_csv(post)
+
+
+def build_tip_requests(limit: int) -> Iterator[Tuple[str, Dict]]:
+    """`limit` tip generation requests, one per scheduled topic."""
+    generator = MLTipsGenerator()
+    for i, topic in enumerate(generator.scheduler.next_topics(limit)):
+        yield f"tip:{i}:{topic}", {
+            "model": generator.config.model,
+            "messages": generator.build_messages(topic),
+            "temperature": generator.config.temperature,
+        }
+
+
+def tip_merger(job_name: str) -> Callable[[str, str], None]:
+    """
+    Merge callback for tip results, sharing one generator across the whole merge.
+
+    Each tip's ID is derived from the job name and its custom_id, and tips
+    already recorded in the tips CSV are skipped, so re-merging after a crash
+    never appends a tip twice.
+    """
+    generator = MLTipsGenerator()
+    saved = generator.saved_tip_ids()
+
+    def merge_tip(custom_id: str, content: str) -> None:
+        tip_id = "TIP_" + hashlib.sha1(f"{job_name}:{custom_id}".encode("utf-8")).hexdigest()[:8]
+        if tip_id in saved:
+            return
+        topic = custom_id.split(":", 2)[2] if custom_id.count(":") >= 2 else ""
+        generator.save_tips([content], [topic], tip_ids=[tip_id])
+        saved.add(tip_id)
+
+    return merge_tip
+
+
+# kind -> (request builder, factory of the merge callback for a job name)
+JOB_TYPES = {
+    "score": (build_score_requests, lambda job_name: merge_score),
+    "posts": (build_post_requests, lambda job_name: merge_post),
+    "tips": (build_tip_requests, tip_merger),
+}
+
+
+def run_job(kind: str, name: str, backend_name: str = "openai", limit: int = 100,
+            poll_interval: float = 60.0) -> None:
+    """Create, submit, wait for and merge a bulk job; every step is skipped if already done."""
+    build_requests, make_merge = JOB_TYPES[kind]
+    job = BatchJob(os.path.join(JOBS_DIR, name))
+
+    if not job.has_requests:
+        count = job.write_requests(build_requests(limit))
+        logging.info(f"Wrote {count} {kind} requests to {job.requests_path}")
+
+    # A pending batch is polled on the backend it was submitted to
+    backend = BACKENDS[backend_name if job.needs_submit else job.state.get("backend", backend_name)]()
+    job.submit(backend)
+    status = job.wait(backend, poll_interval)
+    if status != "completed":
+        logging.error(f"Bulk job {name} ended with status {status}; re-run it to resubmit")
+        return
+
+    merge = make_merge(name)
+    merged = failed = 0
+    for custom_id, content in job.pending_results().items():
+        if content is None:
+            failed += 1
+            continue
+        try:
+            merge(custom_id, content)
+            job.mark_merged(custom_id)
+            merged += 1
+        except Exception as e:
+            failed += 1
+            logging.error(f"Failed to merge {custom_id}: {str(e)}")
+    logging.info(f"Bulk job {name}: merged {merged} results, {failed} failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run offline bulk scoring and generation jobs.")
+    parser.add_argument("kind", choices=sorted(JOB_TYPES))
+    parser.add_argument("--name", help="Job name; re-use it to resume a job (default: <kind>-<date>)")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="openai")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--poll-interval", type=float, default=60.0)
+    args = parser.parse_args()
+
+    name = args.name or f"{args.kind}-{date.today().isoformat()}"
+    run_job(args.kind, name, args.backend, args.limit, args.poll_interval)
+
+
+if __name__ == "__main__":
+    main()
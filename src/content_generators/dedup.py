@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import time
+import hashlib
+import threading
+from typing import Iterable, Set
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only carry tracking information
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "mc_cid", "mc_eid", "igshid", "ref", "ref_src",
+    "source", "_hsenc", "_hsmi",
+}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonicalize an article URL so that trivially different links compare equal.
+
+    Forces https, lower-cases the host, drops ``www.``, default ports, fragments,
+    tracking query parameters and trailing slashes, and sorts the remaining
+    query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+    if scheme in DEFAULT_PORTS:
+        scheme = "https"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> int:
+    """Return a signed 64-bit hash of a URL's canonical form."""
+    digest = hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class SeenIndex:
+    """
+    Persistent index of article URLs that have already been processed.
+
+    Membership is answered from an in-memory set of 64-bit canonical URL
+    hashes; the exact canonical URLs are kept in SQLite so hash collisions
+    can be confirmed and the set rebuilt on start-up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, hash INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_hash ON seen (hash)")
+        self._conn.commit()
+        self._hashes: Set[int] = {row[0] for row in self._conn.execute("SELECT hash FROM seen")}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, url: str) -> bool:
+        h = url_hash(url)
+        with self._lock:
+            if h not in self._hashes:
+                return False
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE url = ?", (canonical_url(url),)
+            ).fetchone()
+        return row is not None
+
+    def add(self, url: str) -> None:
+        """Mark a single URL as seen."""
+        self.add_many([url])
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Mark several URLs as seen in one transaction."""
+        rows = [(canonical_url(u), url_hash(u)) for u in urls if isinstance(u, str) and u]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO seen (url, hash) VALUES (?, ?)", rows)
+            self._conn.commit()
+            self._hashes.update(h for _, h in rows)
+
+
+class RejectIndex:
+    """
+    Persistent set of article URLs that were turned away, each for ``ttl`` seconds.
+
+    Unlike SeenIndex, membership is temporary: once an entry expires the URL
+    counts as new again, so a later run can reconsider it.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rejected (url TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM rejected WHERE expires_at <= ?", (time.time(),))
+        self._conn.commit()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM rejected WHERE url = ? AND expires_at > ?",
+                (canonical_url(url), time.time()),
+            ).fetchone()
+        return row is not None
+
+    def add(self, url: str) -> None:
+        """Reject a URL until ``ttl`` seconds from now."""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rejected (url, expires_at) VALUES (?, ?)",
+                (canonical_url(url), expires_at),
+            )
+            self._conn.commit()
@@ -0,0 +1,69 @@
+import os
+import json
+import time
+import logging
+import threading
+from typing import List, Dict, Optional
+
+from src.utils.atomic_file import atomic_write
+
+
+class FeedCache:
+    """
+    Persistent per-feed HTTP cache for conditional RSS fetching.
+
+    Stores the ETag, Last-Modified value and parsed entries of every feed on
+    disk so later runs can send conditional requests and reuse the entries
+    when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._feeds = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load the cache file, starting empty if it is missing or corrupt."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable feed cache {self.path}: {str(e)}")
+            return {}
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached record for a feed URL, if any."""
+        with self._lock:
+            record = self._feeds.get(url)
+            return dict(record) if record else None
+
+    def validators(self, url: str) -> Dict[str, Optional[str]]:
+        """Return the etag/modified validators to send for a feed URL."""
+        record = self.get(url) or {}
+        return {"etag": record.get("etag"), "modified": record.get("modified")}
+
+    def update(self, url: str, entries: List[Dict], etag: Optional[str] = None,
+               modified: Optional[str] = None) -> None:
+        """Store fresh entries and validators for a feed and persist the cache."""
+        with self._lock:
+            self._feeds[url] = {
+                "etag": etag,
+                "modified": modified,
+                "entries": entries,
+                "fetched_at": time.time(),
+            }
+            self._save()
+
+    def touch(self, url: str) -> None:
+        """Record that a feed was revalidated without changes."""
+        with self._lock:
+            if url in self._feeds:
+                self._feeds[url]["fetched_at"] = time.time()
+                self._save()
+
+    def _save(self) -> None:
+        """Atomically write the cache file (caller must hold the lock)."""
+        with atomic_write(self.path, "w", encoding="utf-8") as f:
+            json.dump(self._feeds, f)
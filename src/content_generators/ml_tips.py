@@ -1,9 +1,8 @@
 import os
 import csv
 import logging
-import openai
-import random
-from typing import List, Optional, Dict
+import asyncio
+from typing import List, Optional, Dict, Callable, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import uuid
@@ -16,6 +15,12 @@ from src.utils.utils import (
     with_retry,
     handle_api_error
 )
+from src.utils.llm import chat_completion, achat_completion
+from src.utils.retry import with_async_retry
+from src.utils.atomic_file import atomic_write
+from src.content_generators.topic_scheduler import TopicScheduler
+from src.storage.content_store import ContentStore
+from src.storage.post_status_store import PostStatusStore
 
 # --- SETUP ---
 setup_logging("data/logs/ml_tips.log")
@@ -30,6 +35,7 @@ class Config:
     temperature: float = 0.8
     max_retries: int = 3
     batch_size: int = 5
+    max_concurrency: int = 5
 
 # --- TOPIC AREAS ---
 TOPIC_AREAS = {
@@ -89,11 +95,7 @@ TOPIC_AREAS = {
     ]
 }
 
-def get_random_topic() -> str:
-    """Get a random topic from the topic areas."""
-    area = random.choice(list(TOPIC_AREAS.keys()))
-    topic = random.choice(TOPIC_AREAS[area])
-    return f"{area}: {topic}"
+TIPS_FIELDS = ["ID", "Posted", "Timestamp", "Topic"]
 
 # --- PROMPT ---
 PROMPT_TEMPLATE = """
@@ -122,44 +124,109 @@ class MLTipsGenerator:
         self.config = config
         validate_config(self.config.__dict__)
         ensure_directory(self.config.tips_dir)
+        self.store = ContentStore(self.config.tips_dir)
+        self.post_status = PostStatusStore()
+        self.post_status.import_csv_once()
+        self.scheduler = TopicScheduler.from_csv(TOPIC_AREAS, self.config.output_file)
     
+    def build_messages(self, topic: str) -> List[Dict]:
+        """
+        Build the chat messages that ask for a tip about a topic.
+        
+        Args:
+            topic (str): Topic of the tip
+            
+        Returns:
+            List[Dict]: Messages for the chat completion request
+        """
+        return [
+            {
+                "role": "system",
+                "content": "You are Alex Farner, a senior ML architect with 10+ years of experience in production ML systems. You share concise, high-level insights about architectural patterns and design decisions that have proven valuable in real-world scenarios. You use emojis strategically to make your posts engaging and add relevant hashtags to increase visibility.",
+            },
+            {"role": "user", "content": PROMPT_TEMPLATE.format(topic=topic)},
+        ]
+
     @with_retry(max_tries=3)
     @handle_api_error
-    def generate_tip(self) -> Optional[str]:
+    def generate_tip(self, topic: Optional[str] = None) -> Optional[str]:
         """
         Generate a single ML engineering tip using OpenAI's API.
         
+        Args:
+            topic (Optional[str]): Topic of the tip; the scheduler picks one if omitted
+            
         Returns:
             Optional[str]: The generated tip or None if generation failed
         """
-        topic = get_random_topic()
-        prompt = PROMPT_TEMPLATE.format(topic=topic)
+        response = chat_completion(
+            model=self.config.model,
+            messages=self.build_messages(topic or self.scheduler.next_topic()),
+            temperature=self.config.temperature,
+        )
+        return response.choices[0].message.content.strip()
+
+    @with_async_retry(max_tries=3)
+    async def agenerate_tip(self, topic: Optional[str] = None) -> Optional[str]:
+        """
+        Generate a single ML engineering tip with the async OpenAI client.
         
-        response = openai.chat.completions.create(
+        Args:
+            topic (Optional[str]): Topic of the tip; the scheduler picks one if omitted
+            
+        Returns:
+            Optional[str]: The generated tip or None if the model returned nothing
+        """
+        response = await achat_completion(
             model=self.config.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are Alex Farner, a senior ML architect with 10+ years of experience in production ML systems. You share concise, high-level insights about architectural patterns and design decisions that have proven valuable in real-world scenarios. You use emojis strategically to make your posts engaging and add relevant hashtags to increase visibility.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=self.build_messages(topic or self.scheduler.next_topic()),
             temperature=self.config.temperature,
         )
         return response.choices[0].message.content.strip()
 
-    def save_tips(self, tips: List[str]) -> None:
+    def _ensure_topic_column(self) -> None:
+        """Add the Topic column to a tips CSV written before topics were recorded."""
+        with open(self.config.output_file, "r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if "Topic" in (reader.fieldnames or []):
+                return
+            rows = list(reader)
+        # Rewrite through a temp file so a crash never leaves a truncated CSV
+        with atomic_write(self.config.output_file, "w", newline="\n", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TIPS_FIELDS, quoting=csv.QUOTE_ALL, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def saved_tip_ids(self) -> Set[str]:
         """
-        Save the generated tips to individual text files and metadata to CSV.
+        IDs of the tips recorded in the tips CSV.
+        
+        Returns:
+            Set[str]: Tip IDs with a metadata row
+        """
+        if not os.path.exists(self.config.output_file):
+            return set()
+        with open(self.config.output_file, "r", encoding="utf-8") as f:
+            return {row["ID"] for row in csv.DictReader(f)}
+
+    def save_tips(self, tips: List[str], topics: Optional[List[str]] = None,
+                  tip_ids: Optional[List[str]] = None) -> None:
+        """
+        Save the generated tips to the tips content store and metadata to CSV.
         
         Args:
             tips (List[str]): List of tips to save
+            topics (Optional[List[str]]): Topic of each tip, recorded for the topic scheduler
+            tip_ids (Optional[List[str]]): IDs to save the tips under (random by default)
         """
         if not tips:
             logging.warning("No tips to save.")
             return
 
+        topics = topics or [""] * len(tips)
         write_header = not os.path.exists(self.config.output_file)
+        if not write_header:
+            self._ensure_topic_column()
         timestamp = datetime.now().isoformat()
         
         try:
@@ -167,26 +234,21 @@ class MLTipsGenerator:
             with open(self.config.output_file, "a", newline="\n", encoding="utf-8") as f:
                 writer = csv.writer(f, quoting=csv.QUOTE_ALL)
                 if write_header:
-                    writer.writerow(["ID", "Posted", "Timestamp"])
+                    writer.writerow(TIPS_FIELDS)
                 
-                # Save each tip to a separate file and record metadata
-                for tip in tips:
-                    tip_id = f"TIP_{uuid.uuid4().hex[:8]}"
-                    tip_path = os.path.join(self.config.tips_dir, f"{tip_id}.txt")
-                    
-                    # Save tip content to text file
-                    with open(tip_path, "w", encoding="utf-8") as tip_file:
-                        tip_file.write(tip)
-                    
-                    # Write metadata to CSV
-                    writer.writerow([tip_id, "false", timestamp])
+                # Store the tip contents first, then record their metadata
+                tip_ids = tip_ids or [f"TIP_{uuid.uuid4().hex[:8]}" for _ in tips]
+                self.store.put_many(zip(tip_ids, tips))
+                self.post_status.register(tip_ids, "tip")
+                for tip_id, topic in zip(tip_ids, topics):
+                    writer.writerow([tip_id, "false", timestamp, topic])
                     
             logging.info(f"Successfully saved {len(tips)} tips to {self.config.tips_dir}")
         except IOError as e:
             logging.error(f"Failed to save tips: {str(e)}")
             raise
 
-    def generate_batch(self, n: int) -> List[str]:
+    def generate_batch(self, n: int) -> List[Tuple[str, str]]:
         """
         Generate a batch of ML engineering tips.
         
@@ -194,32 +256,75 @@ class MLTipsGenerator:
             n (int): Number of tips to generate
             
         Returns:
-            List[str]: List of generated tips
+            List[Tuple[str, str]]: (topic, tip) pairs; pass both to `save_tips`
+            so the topic scheduler sees them
         """
         logging.info(f"Generating {n} ML engineering tips...")
         tips = []
-        for i in range(n):
+        for i, topic in enumerate(self.scheduler.next_topics(n)):
             try:
-                tip = self.generate_tip()
+                tip = self.generate_tip(topic)
                 if tip:
-                    tips.append(tip)
+                    tips.append((topic, tip))
                     logging.debug(f"Generated tip {i+1}/{n}")
             except Exception as e:
                 logging.error(f"Failed to generate tip {i+1}: {str(e)}")
                 continue
         return tips
 
-def main(n: int = 3) -> None:
+    async def agenerate_batch(self, n: int,
+                              progress: Optional[Callable[[int, str], None]] = None) -> List[Tuple[str, str]]:
+        """
+        Generate a batch of ML engineering tips concurrently.
+        
+        Up to `max_concurrency` requests run at once. Each tip is saved as soon
+        as it completes, and a failed tip is logged without aborting the rest.
+        
+        Args:
+            n (int): Number of tips to generate
+            progress (Optional[Callable[[int, str], None]]): Called with (percent, message) as tips complete
+            
+        Returns:
+            List[Tuple[str, str]]: (topic, tip) pairs of the generated (and saved) tips
+        """
+        logging.info(f"Generating {n} ML engineering tips concurrently...")
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def generate_one(topic: str):
+            async with semaphore:
+                return topic, await self.agenerate_tip(topic)
+
+        tips = []
+        failures = 0
+        topics = self.scheduler.next_topics(n)
+        for i, task in enumerate(asyncio.as_completed([generate_one(topic) for topic in topics])):
+            try:
+                topic, tip = await task
+            except Exception as e:
+                failures += 1
+                logging.error(f"Failed to generate tip: {str(e)}")
+                tip = None
+            if tip:
+                self.save_tips([tip], [topic])
+                tips.append((topic, tip))
+                logging.debug(f"Generated tip {i+1}/{n}")
+            if progress:
+                progress(100 * (i + 1) // n, f"Generated tip {i + 1}/{n}")
+
+        logging.info(f"Generated {len(tips)}/{n} tips ({failures} failed)")
+        return tips
+
+def main(n: int = 3, progress: Optional[Callable[[int, str], None]] = None) -> None:
     """
     Main function to generate and save ML engineering tips.
     
     Args:
         n (int): Number of tips to generate
+        progress (Optional[Callable[[int, str], None]]): Called with (percent, message) as tips complete
     """
     try:
         generator = MLTipsGenerator()
-        tips = generator.generate_batch(n)
-        generator.save_tips(tips)
+        asyncio.run(generator.agenerate_batch(n, progress))
     except Exception as e:
         logging.error(f"Program failed: {str(e)}")
         raise
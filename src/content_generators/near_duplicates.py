@@ -0,0 +1,160 @@
+import os
+import re
+import zlib
+import random
+import sqlite3
+import logging
+import threading
+from array import array
+from collections import defaultdict
+from typing import List, Dict, Set, Tuple, Iterable, Iterator, Callable, Optional
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+NUM_PERM = 64
+BANDS = 16
+SIMILARITY_THRESHOLD = 0.7
+SHINGLE_SIZE = 3
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Return the hashed word shingles of a text."""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < size:
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))} if tokens else set()
+    return {
+        zlib.crc32(" ".join(tokens[i:i + size]).encode("utf-8"))
+        for i in range(len(tokens) - size + 1)
+    }
+
+
+def article_text(article: Dict) -> str:
+    """Text used to fingerprint an article (title plus extracted content)."""
+    return f"{article.get('title', '')} {article.get('content', '')}"
+
+
+class MinHasher:
+    """Computes MinHash signatures with a fixed family of universal hash functions."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        features = shingles(text)
+        if not features:
+            return tuple([_MERSENNE_PRIME] * self.num_perm)
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in features)
+            for a, b in self._params
+        )
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimate the Jaccard similarity of two documents from their signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash LSH index of articles that were already processed.
+
+    Signatures are stored in SQLite and banded into in-memory buckets on
+    start-up, so each lookup only compares against the few articles that
+    share at least one band.
+    """
+
+    def __init__(self, path: str, threshold: float = SIMILARITY_THRESHOLD,
+                 num_perm: int = NUM_PERM, bands: int = BANDS):
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS signatures (link TEXT PRIMARY KEY, signature BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        for link, blob in self._conn.execute("SELECT link, signature FROM signatures"):
+            self._insert(link, tuple(array("I", blob)))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        return [
+            (band, hash(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def _insert(self, link: str, signature: Tuple[int, ...]) -> None:
+        self._signatures[link] = signature
+        for key in self._band_keys(signature):
+            self._buckets[key].add(link)
+
+    def _matches(self, signature: Tuple[int, ...]) -> List[str]:
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        return [
+            link for link in candidates
+            if estimate_similarity(signature, self._signatures[link]) >= self.threshold
+        ]
+
+    def add_many(self, articles: Iterable[Dict]) -> None:
+        """Index processed articles so later runs recognise their near-duplicates."""
+        rows = []
+        with self._lock:
+            for article in articles:
+                signature = article.get("_signature") or self.hasher.signature(article_text(article))
+                self._insert(article["link"], signature)
+                rows.append((article["link"], array("I", signature).tobytes()))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO signatures (link, signature) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+    def iter_representatives(self, articles: Iterable[Dict],
+                             on_duplicate: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """
+        Yield one representative per story, dropping near-duplicates as articles arrive.
+
+        The first article of each story to arrive is its representative; later
+        near-duplicates within the run, and stories already in the index, are
+        passed to `on_duplicate` instead of being yielded.
+        """
+        run_signatures: Dict[int, Tuple[int, ...]] = {}
+        run_buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        dropped = 0
+        for article in articles:
+            signature = self.hasher.signature(article_text(article))
+            band_keys = self._band_keys(signature)
+            with self._lock:
+                known = bool(self._matches(signature))
+            if not known:
+                known = any(
+                    estimate_similarity(signature, run_signatures[j]) >= self.threshold
+                    for key in band_keys for j in run_buckets.get(key, ())
+                )
+            if known:
+                dropped += 1
+                if on_duplicate:
+                    on_duplicate(article)
+                continue
+
+            i = len(run_signatures)
+            run_signatures[i] = signature
+            for key in band_keys:
+                run_buckets[key].append(i)
+            yield {**article, "_signature": signature}
+
+        if dropped:
+            logging.info(f"Dropped {dropped} near-duplicate articles before scoring")
@@ -0,0 +1,98 @@
+import heapq
+import queue
+import logging
+import itertools
+import threading
+from typing import Any, Callable, Iterator, List
+
+QUEUE_SIZE = 32
+# How often a blocked `emit` (or a producer waiting on its workers) checks whether the consumer stopped
+STOP_POLL_INTERVAL = 0.5
+
+_DONE = object()
+
+
+def threaded_source(produce: Callable[[Callable[[Any], None], threading.Event], None],
+                    maxsize: int = QUEUE_SIZE, name: str = "source") -> Iterator[Any]:
+    """
+    Run a producer in a background thread and iterate over what it emits.
+
+    `produce` is called with an `emit` callback that puts items on a bounded
+    queue, and a `stop` event. When the consumer falls behind, `emit` blocks,
+    which pushes back on the producer's worker threads instead of buffering
+    results in memory. When the consumer stops iterating early (it breaks,
+    raises or drops the iterator), `stop` is set and `emit` drops items
+    instead of blocking, so the producer and its workers can wind down.
+    """
+    items: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def emit(item: Any) -> None:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=STOP_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def run():
+        try:
+            produce(emit, stop)
+        except Exception as e:
+            logging.error(f"Pipeline stage {name} failed: {str(e)}")
+        finally:
+            emit(_DONE)
+
+    threading.Thread(target=run, name=f"pipeline-{name}", daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+class IncrementalTopK:
+    """
+    Streaming top-k selector that can commit to excellent items early.
+
+    Items scoring at least `commit_score` are released immediately (up to k of
+    them), so downstream work can start before the stream ends. The remaining
+    slots go to the best of the other items once `drain` is called.
+    """
+
+    def __init__(self, k: int, commit_score: float):
+        self.k = k
+        self.commit_score = commit_score
+        self.committed = 0
+        self._heap: List = []
+        self._counter = itertools.count()
+
+    @property
+    def open_slots(self) -> int:
+        return self.k - self.committed
+
+    def push(self, score: float, item: Any) -> List[Any]:
+        """Offer an item; returns the items committed as a result (empty or [item])."""
+        if self.open_slots <= 0:
+            return []
+        if score >= self.commit_score:
+            self.committed += 1
+            self._trim()
+            return [item]
+        heapq.heappush(self._heap, (score, next(self._counter), item))
+        self._trim()
+        return []
+
+    def _trim(self) -> None:
+        while len(self._heap) > max(self.open_slots, 0):
+            heapq.heappop(self._heap)
+
+    def drain(self) -> List[Any]:
+        """Commit and return the best remaining items, highest score first."""
+        remaining = [item for _, _, item in sorted(self._heap, reverse=True)]
+        self._heap = []
+        self.committed += len(remaining)
+        return remaining
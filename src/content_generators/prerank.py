@@ -0,0 +1,145 @@
+import re
+import math
+import random
+import zlib
+from collections import Counter
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SCORE_FIELDS = ("interest", "accessibility", "relevance")
+NUM_FEATURES = 1 << 18
+
+
+def _hashed(feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8")) % NUM_FEATURES
+
+
+def extract_features(article: Dict) -> Dict[int, float]:
+    """
+    Hash an article's title, URL and source into a sparse feature vector.
+
+    Only fields stored in articles.csv are used, so training on history and
+    scoring fresh candidates see the same kind of input.
+    """
+    parts = urlsplit(str(article.get("link", "")))
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    title_tokens = _TOKEN_PATTERN.findall(str(article.get("title", "")).lower())
+
+    features = [f"t:{tok}" for tok in title_tokens]
+    features += [f"t2:{a}_{b}" for a, b in zip(title_tokens, title_tokens[1:])]
+    features += [f"p:{tok}" for tok in _TOKEN_PATTERN.findall(parts.path.lower())]
+    features += [f"host:{host}", f"src:{article.get('source', '')}"]
+
+    vector: Dict[int, float] = {}
+    for feature in features:
+        index = _hashed(feature)
+        vector[index] = vector.get(index, 0.0) + 1.0
+    norm = sum(v * v for v in vector.values()) ** 0.5 or 1.0
+    return {i: v / norm for i, v in vector.items()}
+
+
+def total_score(record: Dict) -> Optional[float]:
+    """Average of the three GPT scores, or None if any is missing."""
+    try:
+        values = [float(record[field]) for field in SCORE_FIELDS]
+    except (KeyError, TypeError, ValueError):
+        return None
+    if any(v != v for v in values):  # NaN from pandas
+        return None
+    return sum(values) / len(values)
+
+
+class HashedLinearRanker:
+    """Ridge regression over hashed features, trained with SGD on historical GPT scores."""
+
+    def __init__(self, epochs: int = 8, learning_rate: float = 0.2, l2: float = 1e-4, seed: int = 0):
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.seed = seed
+        self.weights: Dict[int, float] = {}
+        self.bias = 0.0
+
+    def fit(self, records: List[Dict]) -> "HashedLinearRanker":
+        """Train on scored article records (rows of articles.csv)."""
+        samples = [(extract_features(r), score) for r in records
+                   for score in [total_score(r)] if score is not None]
+        if not samples:
+            return self
+        self.bias = sum(score for _, score in samples) / len(samples)
+        rng = random.Random(self.seed)
+        for epoch in range(self.epochs):
+            rng.shuffle(samples)
+            rate = self.learning_rate / (1 + epoch)
+            for features, score in samples:
+                error = self._predict_features(features) - score
+                for index, value in features.items():
+                    weight = self.weights.get(index, 0.0)
+                    self.weights[index] = weight - rate * (error * value + self.l2 * weight)
+        return self
+
+    def _predict_features(self, features: Dict[int, float]) -> float:
+        return self.bias + sum(self.weights.get(i, 0.0) * v for i, v in features.items())
+
+    def predict(self, article: Dict) -> float:
+        """Predict the GPT total score of an article."""
+        return self._predict_features(extract_features(article))
+
+    def top_k(self, articles: List[Dict], k: int) -> List[Dict]:
+        """Return the k articles with the highest predicted score."""
+        return sorted(articles, key=self.predict, reverse=True)[:k]
+
+    def cutoff(self, records: List[Dict], keep_fraction: float) -> float:
+        """Predicted score above which `keep_fraction` of the given records fall."""
+        predictions = sorted((self.predict(r) for r in records), reverse=True)
+        if not predictions:
+            return float("-inf")
+        index = min(len(predictions) - 1, max(0, math.ceil(len(predictions) * keep_fraction) - 1))
+        return predictions[index]
+
+
+def recall_at_k(ranker: HashedLinearRanker, records: List[Dict], k: int, top_n: int = 5) -> float:
+    """
+    Fraction of the full scorer's top_n picks the ranker's top k would still yield.
+
+    Compares the top_n GPT scores among all records with the top_n among the
+    ranker's k candidates; articles with equal scores count as interchangeable,
+    since either would make an equally good post.
+    """
+    scored = [r for r in records if total_score(r) is not None]
+    if not scored:
+        return 1.0
+    best = Counter(sorted((total_score(r) for r in scored), reverse=True)[:top_n])
+    kept = Counter(sorted((total_score(r) for r in ranker.top_k(scored, k)), reverse=True)[:top_n])
+    return sum((best & kept).values()) / sum(best.values())
+
+
+def holdout_recall(records: List[Dict], k: Optional[int] = None, keep_fraction: Optional[float] = None,
+                   top_n: int = 5, holdout: float = 0.3, seed: int = 0) -> float:
+    """
+    Train on part of the history and report recall on the held-out rest.
+
+    The ranker keeps either a fixed `k` held-out records or `keep_fraction` of them.
+    """
+    shuffled = list(records)
+    random.Random(seed).shuffle(shuffled)
+    split = int(len(shuffled) * (1 - holdout))
+    ranker = HashedLinearRanker().fit(shuffled[:split])
+    held_out = shuffled[split:]
+    if k is None:
+        k = math.ceil(len(held_out) * keep_fraction)
+    return recall_at_k(ranker, held_out, k, top_n)
+
+
+if __name__ == "__main__":
+    import csv
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/articles.csv"
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with open(path, "r", encoding="utf-8") as f:
+        history = list(csv.DictReader(f))
+    print(f"Pre-ranker holdout recall@{k} over {len(history)} articles: {holdout_recall(history, k):.2f}")
@@ -0,0 +1,70 @@
+import re
+import json
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+SCORE_FIELDS = ("interest", "accessibility", "relevance")
+# Matches one `"A3": {...}` entry, so truncated or chatty answers still yield the complete entries
+_ENTRY_PATTERN = re.compile(r'"(A\d+)"\s*:\s*(\{[^{}]*\})')
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def article_prompt_tokens(article: Dict) -> int:
+    """Estimate the prompt tokens one article contributes to a scoring request."""
+    return estimate_tokens(f"{article['title']}\n{article['content']}\n{article['link']}") + 20
+
+
+def iter_token_batches(articles: Iterable[Dict], token_budget: int, max_batch: int) -> Iterator[List[Dict]]:
+    """
+    Group a stream of articles into batches whose estimated prompt size fits the token budget.
+
+    An article larger than the whole budget still gets a batch of its own.
+    """
+    current: List[Dict] = []
+    current_tokens = 0
+    for article in articles:
+        tokens = article_prompt_tokens(article)
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_batch):
+            yield current
+            current, current_tokens = [], 0
+        current.append(article)
+        current_tokens += tokens
+    if current:
+        yield current
+
+
+def batch_by_token_budget(articles: List[Dict], token_budget: int, max_batch: int) -> List[List[Dict]]:
+    """Split a list of articles into token-budgeted batches."""
+    return list(iter_token_batches(articles, token_budget, max_batch))
+
+
+def _clamp_score(value) -> int:
+    return max(1, min(10, int(round(float(value)))))
+
+
+def parse_batch_scores(content: str, ids: List[str]) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Parse a batched scoring answer into (interest, accessibility, relevance) per article ID.
+
+    Entries that are missing, malformed or for unknown IDs are skipped, so a
+    partial answer still returns every score it contains.
+    """
+    wanted = set(ids)
+    scores = {}
+    for article_id, body in _ENTRY_PATTERN.findall(content):
+        if article_id not in wanted:
+            continue
+        try:
+            entry = {k.lower(): v for k, v in json.loads(body).items()}
+            scores[article_id] = tuple(_clamp_score(entry[field]) for field in SCORE_FIELDS)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return scores
+
+
+def align_scores(scores: Dict[str, Tuple[int, int, int]], ids: List[str]) -> List[Optional[Tuple[int, int, int]]]:
+    """Return scores in the order of ids, with None for articles the model skipped."""
+    return [scores.get(article_id) for article_id in ids]
@@ -1,32 +1,37 @@
 import os
 import requests
 import feedparser
-import pandas as pd
 from bs4 import BeautifulSoup
 from newspaper import Article
 from dotenv import load_dotenv
 import openai
+import csv
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
-from typing import List, Dict, Tuple, Optional
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, Callable
 from dataclasses import dataclass
-import uuid
-import time
+import threading
+from urllib.parse import urlparse
 
 from src.utils.utils import (
     setup_logging,
     setup_environment,
     ensure_directory,
-    load_or_create_dataframe,
-    save_dataframe,
-    validate_config,
     with_retry,
-    with_cache,
     truncate_text,
     handle_api_error
 )
+from src.utils.llm import chat_completion
+from src.content_generators.feed_cache import FeedCache
+from src.content_generators.article_cache import ArticleCache
+from src.content_generators.dedup import SeenIndex, RejectIndex, canonical_url
+from src.content_generators.near_duplicates import NearDuplicateIndex
+from src.content_generators.prerank import HashedLinearRanker, holdout_recall
+from src.content_generators.scoring import iter_token_batches, parse_batch_scores, align_scores
+from src.content_generators.pipeline import IncrementalTopK, STOP_POLL_INTERVAL, threaded_source
+from src.storage.article_store import ArticleStore
+from src.storage.content_store import ContentStore
+from src.storage.post_status_store import PostStatusStore
 
 # --- CONFIG ---
 RSS_FEEDS = [
@@ -55,9 +60,31 @@ RSS_FEEDS = [
 GITHUB_TRENDING_URL = "https://github.com/trending/python?since=daily"
 OUTPUT_SOURCES = "data/articles.csv"
 FINAL_OUTPUT = "data/posts.csv"
+ARTICLE_STORE_FILE = "data/content.db"
+NEWS_POSTS_DIR = "data/news_posts"
+POST_FIELDS = ["ID", "Posted", "Title", "Link", "Source", "Interest", "Accessibility", "Relevance"]
 MAX_WORKERS = 5
+MAX_DOWNLOAD_WORKERS = 16
+MAX_DOWNLOADS_PER_HOST = 2
 MAX_RETRIES = 3
 CACHE_SIZE = 1000
+FEED_CACHE_FILE = "data/cache/feeds.json"
+ENTRIES_PER_FEED = 5
+ARTICLE_CACHE_FILE = "data/cache/articles.db"
+ARTICLE_CACHE_TTL = 14 * 24 * 3600
+ARTICLE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+SEEN_INDEX_FILE = "data/cache/seen_articles.db"
+NEAR_DUPLICATE_INDEX_FILE = "data/cache/near_duplicates.db"
+SCORE_TOKEN_BUDGET = 5000
+SCORE_MAX_BATCH = 10
+PRERANK_KEEP_FRACTION = 0.5
+PRERANK_MIN_HISTORY = 50
+PRERANK_MIN_RECALL = 0.8
+PRERANK_TRAINING_ROWS = 5000
+PRERANK_REJECT_FILE = "data/cache/prerank_rejects.db"
+PRERANK_REJECT_TTL = 7 * 24 * 3600
+TOP_ARTICLES = 5
+EAGER_GENERATE_SCORE = 9.0
 
 # Initialize environment variables
 load_dotenv()
@@ -66,13 +93,21 @@ openai.api_key = os.getenv("OPENAI_API_KEY")
 # Initialize environment and logging
 setup_logging("data/logs/tech_news.log")
 setup_environment()
-ensure_directory("data/news_posts")
+ensure_directory(NEWS_POSTS_DIR)
+feed_cache = FeedCache(FEED_CACHE_FILE)
+article_cache = ArticleCache(ARTICLE_CACHE_FILE, ARTICLE_CACHE_TTL, ARTICLE_CACHE_MAX_BYTES)
+seen_index = SeenIndex(SEEN_INDEX_FILE)
+prerank_rejects = RejectIndex(PRERANK_REJECT_FILE, PRERANK_REJECT_TTL)
+near_duplicate_index = NearDuplicateIndex(NEAR_DUPLICATE_INDEX_FILE)
+article_store = ArticleStore(ARTICLE_STORE_FILE)
+news_store = ContentStore(NEWS_POSTS_DIR)
+post_status = PostStatusStore()
 
 @dataclass
 class Config:
     """Configuration settings for the tech news generator."""
     output_file: str = "data/articles.csv"
-    posts_dir: str = "data/news_posts"
+    posts_dir: str = NEWS_POSTS_DIR
     model: str = "gpt-4"
     temperature: float = 0.8
     max_retries: int = 3
@@ -82,56 +117,130 @@ class Config:
 @with_retry(max_tries=MAX_RETRIES)
 @handle_api_error
 def fetch_article_content(url: str, title: str = None) -> Dict:
-    """Fetch and parse article content with retry logic."""
-    article = Article(url)
-    article.download()
-    article.parse()
+    """Fetch and parse article content with retry logic, serving repeats from the article cache."""
+    cached = article_cache.get(url)
+    if cached is None:
+        article = Article(url)
+        article.download()
+        article.parse()
+        cached = {"title": article.title, "text": article.text}
+        if article.text:
+            article_cache.put(url, article.title, article.text)
     return {
-        "title": title or article.title,
+        "title": title or cached["title"],
         "link": url,
-        "content": truncate_text(article.text)
+        "content": truncate_text(cached["text"])
     }
 
-@with_cache(maxsize=CACHE_SIZE)
 def fetch_rss_feed(url: str) -> List[Dict]:
-    """Fetch and parse RSS feed with caching."""
-    feed = feedparser.parse(url)
-    return [
+    """Fetch and parse RSS feed, revalidating against the persistent feed cache."""
+    cached = feed_cache.get(url)
+    validators = feed_cache.validators(url) if cached else {}
+    feed = feedparser.parse(url, **validators)
+
+    if cached and getattr(feed, "status", None) == 304:
+        logging.info(f"Feed not modified, using cached entries: {url}")
+        feed_cache.touch(url)
+        return cached["entries"]
+
+    entries = [
         {
             "title": entry.title,
             "link": entry.link,
             "source": url,
         }
-        for entry in feed.entries[:5]
+        for entry in feed.entries[:ENTRIES_PER_FEED]
     ]
+    if entries:
+        feed_cache.update(url, entries, etag=feed.get("etag"), modified=feed.get("modified"))
+    elif cached:
+        logging.warning(f"Feed returned no entries, falling back to cache: {url}")
+        return cached["entries"]
+    return entries
+
+def download_article(article: Dict, host_slot: threading.BoundedSemaphore) -> Dict:
+    """Download a feed entry's content while holding its host's concurrency slot."""
+    with host_slot:
+        content = fetch_article_content(article["link"], article["title"])
+    return {
+        **article,
+        "content": content["content"]
+    }
+
+def download_and_emit(article: Dict, host_slot: threading.BoundedSemaphore, emit) -> None:
+    """Download a feed entry and hand it downstream, logging failures."""
+    try:
+        emit(download_article(article, host_slot))
+    except Exception as e:
+        logging.error(f"Failed to process article from {article['source']}: {str(e)}")
+
+def is_known(link: str) -> bool:
+    """True for links already processed or recently turned away by the pre-ranker."""
+    return link in seen_index or link in prerank_rejects
+
+def iter_source_articles(include_github: bool = True) -> Iterator[Dict]:
+    """
+    Stream articles from all RSS feeds (and GitHub Trending) as they download.
+
+    Feeds are parsed on one pool and each parsed entry is handed straight to a
+    download pool, so article downloads start as soon as their feed is known.
+    Downloads against the same host are capped at MAX_DOWNLOADS_PER_HOST, and
+    entries already in the seen index are skipped before any download.
+    Finished articles flow through a bounded queue, so a slow consumer
+    throttles the downloads instead of piling articles up in memory. If the
+    consumer stops early, downloads that have not started are cancelled.
+    """
+    def produce(emit, stop: threading.Event):
+        host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        downloads = []
+        feed_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        download_executor = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+        try:
+            github = feed_executor.submit(scrape_github_trending) if include_github else None
+            future_to_url = {
+                feed_executor.submit(fetch_rss_feed, url): url
+                for url in RSS_FEEDS
+            }
+
+            for future in as_completed(future_to_url):
+                if stop.is_set():
+                    return
+                url = future_to_url[future]
+                try:
+                    feed_articles = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to process feed {url}: {str(e)}")
+                    continue
+                for article in feed_articles:
+                    if is_known(article["link"]):
+                        continue
+                    host = urlparse(article["link"]).netloc
+                    if host not in host_slots:
+                        host_slots[host] = threading.BoundedSemaphore(MAX_DOWNLOADS_PER_HOST)
+                    downloads.append(download_executor.submit(download_and_emit, article, host_slots[host], emit))
+
+            if github is not None:
+                try:
+                    for article in github.result() or []:
+                        emit(article)
+                except Exception as e:
+                    logging.error(f"Failed to scrape GitHub Trending: {str(e)}")
+
+            # Wait for the downloads, giving up on the rest as soon as the consumer stops
+            pending = set(downloads)
+            while pending and not stop.is_set():
+                _, pending = wait(pending, timeout=STOP_POLL_INTERVAL)
+        finally:
+            # Drop downloads that have not started yet if the consumer went away
+            feed_executor.shutdown(cancel_futures=True)
+            download_executor.shutdown(cancel_futures=True)
+
+    return threaded_source(produce, name="sources")
 
 def fetch_rss_articles() -> List[Dict]:
-    """Fetch articles from all RSS feeds in parallel."""
+    """Fetch articles from all RSS feeds."""
     logging.info("Fetching RSS articles...")
-    
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_url = {
-            executor.submit(fetch_rss_feed, url): url 
-            for url in RSS_FEEDS
-        }
-        
-        articles = []
-        for future in as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                feed_articles = future.result()
-                for article in feed_articles:
-                    try:
-                        content = fetch_article_content(article["link"], article["title"])
-                        articles.append({
-                            **article,
-                            "content": content["content"]
-                        })
-                    except Exception as e:
-                        logging.error(f"Failed to process article from {url}: {str(e)}")
-            except Exception as e:
-                logging.error(f"Failed to process feed {url}: {str(e)}")
-    
+    articles = list(iter_source_articles(include_github=False))
     logging.info(f"Fetched {len(articles)} articles from RSS feeds.")
     return articles
 
@@ -145,15 +254,17 @@ def scrape_github_trending() -> List[Dict]:
     soup = BeautifulSoup(res.text, "html.parser")
     repos = soup.find_all("h2", class_="h3 lh-condensed")
     
+    candidates = [
+        ("https://github.com" + repo.find("a")["href"], repo.text.strip().replace("\n", " ").strip())
+        for repo in repos[:5]
+    ]
+    candidates = [(link, title) for link, title in candidates if not is_known(link)]
+
     articles = []
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         future_to_repo = {
-            executor.submit(
-                fetch_article_content,
-                "https://github.com" + repo.find("a")["href"],
-                repo.text.strip().replace("\n", " ").strip()
-            ): repo
-            for repo in repos[:5]
+            executor.submit(fetch_article_content, link, title): link
+            for link, title in candidates
         }
         
         for future in as_completed(future_to_repo):
@@ -169,12 +280,8 @@ def scrape_github_trending() -> List[Dict]:
     logging.info(f"Scraped {len(articles)} repositories from GitHub Trending.")
     return articles
 
-@with_retry(max_tries=MAX_RETRIES)
-@handle_api_error
-def gpt_score_article(article: Dict) -> Tuple[int, int, int]:
-    """Score article using GPT with retry logic."""
-    logging.info(f"Scoring article: {article['title']}")
-    
+def score_messages(article: Dict) -> List[Dict]:
+    """Chat messages asking GPT to score a single article."""
     prompt = f"""
     Given the following article title and content, rate the article on three criteria from 1 to 10:
 
@@ -191,33 +298,135 @@ def gpt_score_article(article: Dict) -> Tuple[int, int, int]:
     Content: {article['content']}
     url: {article['link']}
     """
+    return [
+        {
+            "role": "system",
+            "content": "You evaluate and score tech articles for an editorial team.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+def parse_score_lines(content: str) -> Tuple[int, int, int]:
+    """Parse the three "Criterion: <score>" lines of a single-article score."""
+    lines = content.strip().split("\n")
+    return (
+        int(lines[0].split(":")[-1].strip()),
+        int(lines[1].split(":")[-1].strip()),
+        int(lines[2].split(":")[-1].strip())
+    )
+
+@with_retry(max_tries=MAX_RETRIES)
+@handle_api_error
+def gpt_score_article(article: Dict) -> Tuple[int, int, int]:
+    """Score article using GPT with retry logic."""
+    logging.info(f"Scoring article: {article['title']}")
 
-    response = openai.chat.completions.create(
+    response = chat_completion(
+        model="gpt-4",
+        messages=score_messages(article),
+        temperature=0.3,
+        cache=True,
+    )
+    return parse_score_lines(response.choices[0].message.content)
+
+@with_retry(max_tries=MAX_RETRIES)
+@handle_api_error
+def gpt_score_articles(articles: List[Dict]) -> List[Optional[Tuple[int, int, int]]]:
+    """
+    Score several articles in one GPT request.
+
+    Returns (interest, accessibility, relevance) per article in input order,
+    with None for any article missing from the model's answer.
+    """
+    logging.info(f"Scoring batch of {len(articles)} articles")
+    ids = [f"A{i}" for i in range(len(articles))]
+    listing = "\n\n".join(
+        f"ID: {article_id}\nTitle: {article['title']}\nContent: {article['content']}\nurl: {article['link']}"
+        for article_id, article in zip(ids, articles)
+    )
+
+    prompt = f"""
+    For each article below, rate it on three criteria from 1 to 10:
+
+    1. Interest: How novel, exciting, or valuable is it to ML or software engineering professionals?
+    2. Accessibility: How approachable and easy to understand is it for a general tech-savvy audience?
+    3. Relevance: How aligned is this article with ML engineering concepts or MLOps?
+
+    Respond with a single JSON object keyed by article ID and nothing else, e.g.
+    {{"A0": {{"interest": 7, "accessibility": 6, "relevance": 8}}}}
+
+    {listing}
+    """
+
+    response = chat_completion(
         model="gpt-4",
         messages=[
             {
                 "role": "system",
-                "content": "You evaluate and score tech articles for an editorial team.",
+                "content": "You evaluate and score tech articles for an editorial team. You answer only with JSON.",
             },
             {"role": "user", "content": prompt},
         ],
         temperature=0.3,
+        cache=True,
     )
-    
+
     content = response.choices[0].message.content.strip()
-    lines = content.split("\n")
-    return (
-        int(lines[0].split(":")[-1].strip()),
-        int(lines[1].split(":")[-1].strip()),
-        int(lines[2].split(":")[-1].strip())
-    )
+    return align_scores(parse_batch_scores(content, ids), ids)
 
-@with_retry(max_tries=MAX_RETRIES)
-@handle_api_error
-def gpt_generate_post(article: Dict) -> str:
-    """Generate LinkedIn post using GPT with retry logic."""
-    logging.info(f"Generating LinkedIn post for: {article['title']}")
-    
+def iter_scored_articles(articles: Iterable[Dict]) -> Iterator[Tuple[Dict, Tuple[int, int, int]]]:
+    """
+    Score a stream of articles in token-budgeted batches.
+
+    Each batch is sent as soon as it fills up. Articles a batch answer leaves
+    out are rescored individually; articles that still fail are logged and dropped.
+    """
+    for batch in iter_token_batches(articles, SCORE_TOKEN_BUDGET, SCORE_MAX_BATCH):
+        try:
+            scores = gpt_score_articles(batch) or [None] * len(batch)
+        except Exception as e:
+            logging.error(f"Failed to score batch of {len(batch)} articles: {str(e)}")
+            scores = [None] * len(batch)
+
+        for article, score in zip(batch, scores):
+            if score is None:
+                try:
+                    score = gpt_score_article(article)
+                except Exception as e:
+                    logging.error(f"Failed to score article {article['title']}: {str(e)}")
+                    continue
+            yield article, score
+
+def score_articles(articles: List[Dict]) -> List[Tuple[Dict, Tuple[int, int, int]]]:
+    """Score a list of articles in token-budgeted batches."""
+    return list(iter_scored_articles(articles))
+
+def build_prerank_gate(records: List[Dict]) -> Optional[Callable[[Dict], bool]]:
+    """
+    Build a filter that passes only promising candidates on to GPT scoring.
+
+    A hashed linear model is trained on the historical GPT scores and the gate
+    keeps candidates predicted to land in the top PRERANK_KEEP_FRACTION of the
+    history. The model is only trusted when its holdout recall against the full
+    scorer reaches PRERANK_MIN_RECALL; otherwise None is returned and every
+    candidate is scored.
+    """
+    if len(records) < PRERANK_MIN_HISTORY:
+        logging.info(f"Pre-ranker skipped: only {len(records)} scored articles in history")
+        return None
+
+    recall = holdout_recall(records, keep_fraction=PRERANK_KEEP_FRACTION)
+    logging.info(f"Pre-ranker holdout recall keeping {PRERANK_KEEP_FRACTION:.0%} against GPT scoring: {recall:.2f}")
+    if recall < PRERANK_MIN_RECALL:
+        logging.info(f"Pre-ranker recall below {PRERANK_MIN_RECALL}, scoring all candidates")
+        return None
+
+    ranker = HashedLinearRanker().fit(records)
+    cutoff = ranker.cutoff(records, PRERANK_KEEP_FRACTION)
+    return lambda article: ranker.predict(article) >= cutoff
+
+def post_messages(article: Dict) -> List[Dict]:
+    """Chat messages asking GPT to write a LinkedIn post about an article."""
     prompt = f"""
     Based on the title and content below, write a thoughtful LinkedIn post that feels human and conversational.
 
@@ -230,48 +439,108 @@ def gpt_generate_post(article: Dict) -> str:
     content: {article['content']}
     Link: {article['link']}
     """
-    
-    response = openai.chat.completions.create(
+    return [
+        {
+            "role": "system",
+            "content": "You are Alex Farner, an experienced machine learning engineer and software architect who shares interesting ideas and takeaways on LinkedIn. You're curious, approachable, and write for both fellow engineers and tech-savvy newcomers.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+@with_retry(max_tries=MAX_RETRIES)
+@handle_api_error
+def gpt_generate_post(article: Dict) -> str:
+    """Generate LinkedIn post using GPT with retry logic."""
+    logging.info(f"Generating LinkedIn post for: {article['title']}")
+
+    response = chat_completion(
         model="gpt-4",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are Alex Farner, an experienced machine learning engineer and software architect who shares interesting ideas and takeaways on LinkedIn. You're curious, approachable, and write for both fellow engineers and tech-savvy newcomers.",
-            },
-            {"role": "user", "content": prompt},
-        ],
+        messages=post_messages(article),
         temperature=0.7,
     )
     return response.choices[0].message.content.strip()
 
+def iter_fresh_articles(articles: Iterable[Dict]) -> Iterator[Dict]:
+    """Drop articles already in the seen index or repeated earlier in this run."""
+    run_links = set()
+    for article in articles:
+        link = canonical_url(article["link"])
+        if link in run_links or is_known(article["link"]):
+            continue
+        run_links.add(link)
+        yield article
+
+def iter_gated(articles: Iterable[Dict], gate: Callable[[Dict], bool],
+               on_rejected: Callable[[Dict], None]) -> Iterator[Dict]:
+    """Yield the articles that pass the gate, reporting the others."""
+    for article in articles:
+        if gate(article):
+            yield article
+        else:
+            on_rejected(article)
+
+def append_post_csv(post: Dict) -> None:
+    """Append one post's metadata to posts.csv, which the web app lists."""
+    write_header = not os.path.exists(FINAL_OUTPUT)
+    with open(FINAL_OUTPUT, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=POST_FIELDS)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(post)
+
+def generate_tech_news_content(progress: Optional[Callable[[int, str], None]] = None):
+    """
+    Main function to generate tech news content.
+
+    Runs as a streaming pipeline: fetch -> extract -> dedupe -> score -> select
+    -> generate. Articles flow through generators and bounded queues, only the
+    current scoring batch and the top-k candidates keep their full text, and
+    posts for excellent articles start generating before the stream ends.
+
+    `progress(percent, message)` is called at each stage boundary.
+    """
+    def report(percent: int, message: str) -> None:
+        if progress:
+            progress(percent, message)
 
-def generate_tech_news_content():
-    """Main function to generate tech news content."""
     logging.info("Starting content generation pipeline...")
+    report(5, "Loading article history...")
 
-    # Load existing data
-    articles = load_or_create_dataframe(
-        OUTPUT_SOURCES,
-        ["title", "postCreated", "link", "source", "interest", "accessibility", "relevance"]
-    )
-    posts = load_or_create_dataframe(
-        FINAL_OUTPUT,
-        ["ID", "Posted", "Title", "Link", "Source", "Interest", "Accessibility", "Relevance"]
-    )
+    # Import the legacy CSV history into the article and status stores on first use
+    if article_store.is_empty():
+        article_store.import_csv(OUTPUT_SOURCES, FINAL_OUTPUT)
+    post_status.import_csv_once()
 
-    # Fetch new articles
-    all_articles = fetch_rss_articles() + scrape_github_trending()
-    # all_articles = scrape_github_trending()
-    fresh_articles = [a for a in all_articles if a["link"] not in articles["link"].values]
+    # Seed the seen index from the article history on first use
+    if not len(seen_index):
+        seen_index.add_many(article_store.iter_links())
 
-    if not fresh_articles:
-        logging.info("No new articles to process.")
-        return
-    fresh_articles_data = []
-    for article in fresh_articles:
-        try:
-            interest, accessibility, relevance = gpt_score_article(article)
-            fresh_articles_data.append({
+    def mark_seen(article: Dict) -> None:
+        seen_index.add(article["link"])
+
+    # fetch + extract -> dedupe (exact, then near-duplicate) -> pre-rank
+    candidates = iter_fresh_articles(iter_source_articles())
+    candidates = near_duplicate_index.iter_representatives(candidates, on_duplicate=mark_seen)
+    prerank_gate = build_prerank_gate(article_store.recent_scored(PRERANK_TRAINING_ROWS))
+    if prerank_gate is not None:
+        # Rejections are only held back for PRERANK_REJECT_TTL: they were never
+        # scored, so a later run (and a retrained ranker) gets another look
+        candidates = iter_gated(candidates, prerank_gate,
+                                on_rejected=lambda article: prerank_rejects.add(article["link"]))
+
+    # score -> select -> generate
+    report(10, "Fetching and scoring articles...")
+    fresh_links = []
+    selector = IncrementalTopK(TOP_ARTICLES, commit_score=EAGER_GENERATE_SCORE)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        future_to_article = {}
+
+        def generate(selected: List[Dict]) -> None:
+            for article in selected:
+                future_to_article[executor.submit(gpt_generate_post, article)] = article
+
+        for article, (interest, accessibility, relevance) in iter_scored_articles(candidates):
+            row = {
                 "title": article["title"],
                 "postCreated": False,
                 "link": article["link"],
@@ -279,38 +548,43 @@ def generate_tech_news_content():
                 "interest": interest,
                 "accessibility": accessibility,
                 "relevance": relevance
-            })
-            time.sleep(10)
-        except Exception as e:
-            logging.error(f"Failed to score article {article['title']}: {str(e)}")
+            }
+            article_store.add_articles([row])
+            fresh_links.append(article["link"])
+            seen_index.add(article["link"])
+            near_duplicate_index.add_many([article])
+            total_score = (interest + accessibility + relevance) / 3
+            generate(selector.push(total_score, {**row, "content": article["content"]}))
+            report(10 + 60 * len(fresh_links) // (len(fresh_links) + 20),
+                   f"Scored {len(fresh_links)} new articles...")
+        generate(selector.drain())
 
-    # Update articles DataFrame
-    fresh_articles_df = pd.DataFrame(fresh_articles_data)
-    articles = pd.concat([articles, fresh_articles_df])
-    
-    # Sort and select top articles
-    articles["total_score"] = (articles["interest"] + articles["accessibility"] + articles["relevance"]) / 3
-    top_articles = articles.nlargest(5, "total_score")
+        if not fresh_links:
+            logging.info("No new articles to process.")
+            return
+
+        # Fill any remaining slots with the best unposted articles from earlier runs
+        report(70, "Selecting articles for posts...")
+        for candidate in article_store.best_unposted(selector.open_slots, exclude=fresh_links):
+            try:
+                content = fetch_article_content(candidate["link"], candidate["title"])
+                generate([{**candidate, "content": content["content"]}])
+            except Exception as e:
+                logging.error(f"Failed to fetch backlog article {candidate['title']}: {str(e)}")
+
+        report(75, f"Generating {len(future_to_article)} posts...")
 
-    # Generate posts for top articles
-    new_posts = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_article = {
-            executor.submit(gpt_generate_post, article): article 
-            for _, article in top_articles.iterrows()
-        }
-        
         for idx, future in enumerate(as_completed(future_to_article)):
             article = future_to_article[future]
             try:
                 post = future.result()
-                post_id = f"N_POST_{idx + len(posts)}"
-                
+                post_id = post_status.allocate_id("N_POST_")
+
                 # Save post draft
-                draft_path = Path("data/news_posts") / f"{post_id}.txt"
-                draft_path.write_text(post, encoding="utf-8")
-                
-                new_posts.append({
+                news_store.put(post_id, post)
+                post_status.register([post_id], "news")
+
+                new_post = {
                     "ID": post_id,
                     "Posted": False,
                     "Title": article["title"],
@@ -319,17 +593,15 @@ def generate_tech_news_content():
                     "Interest": article["interest"],
                     "Accessibility": article["accessibility"],
                     "Relevance": article["relevance"],
-                })
-                
-                articles.loc[articles["link"] == article["link"], "postCreated"] = True
+                }
+                article_store.add_post(new_post)
+                article_store.mark_post_created(article["link"])
+                append_post_csv(new_post)
             except Exception as e:
                 logging.error(f"Failed to generate post for {article['title']}: {str(e)}")
+            report(75 + 25 * (idx + 1) // len(future_to_article),
+                   f"Generated post {idx + 1}/{len(future_to_article)}")
 
-    # Save results
-    posts = pd.concat([posts, pd.DataFrame(new_posts)])
-    save_dataframe(posts, FINAL_OUTPUT)
-    save_dataframe(articles, OUTPUT_SOURCES)
-    
     logging.info("Content generation completed successfully.")
 
 if __name__ == "__main__":
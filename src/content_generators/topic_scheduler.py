@@ -0,0 +1,102 @@
+import os
+import csv
+import time
+import random
+from datetime import datetime
+from collections import defaultdict
+from typing import List, Dict, Iterable, Optional, Tuple
+
+# A topic's coverage halves every HALF_LIFE_DAYS, so old tips stop blocking a subtopic
+HALF_LIFE_DAYS = 14.0
+
+
+def _parse_timestamp(value: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def read_topic_history(path: str) -> List[Tuple[str, float]]:
+    """Read (topic, timestamp) pairs from the tips CSV, skipping rows without a topic."""
+    if not os.path.exists(path):
+        return []
+    history = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            topic = (row.get("Topic") or "").strip()
+            timestamp = _parse_timestamp(row.get("Timestamp", ""))
+            if topic and timestamp is not None:
+                history.append((topic, timestamp))
+    return history
+
+
+class TopicScheduler:
+    """
+    Coverage-aware topic picker.
+
+    Every past tip adds a decaying weight to its subtopic (and, more lightly,
+    to its area). `next_topics` returns the least covered subtopics, so
+    generation rotates through the whole catalogue instead of clustering on
+    a few subtopics, and a batch never repeats a subtopic unless it asks for
+    more tips than there are subtopics.
+    """
+
+    def __init__(self, topic_areas: Dict[str, List[str]], history: Iterable[Tuple[str, float]] = (),
+                 half_life_days: float = HALF_LIFE_DAYS, rng: Optional[random.Random] = None):
+        self.topics = [f"{area}: {topic}" for area, topics in topic_areas.items() for topic in topics]
+        self.half_life = half_life_days * 86400
+        self.rng = rng or random.Random()
+        self._history: List[Tuple[str, float]] = []
+        known = set(self.topics)
+        for topic, timestamp in history:
+            if topic in known:
+                self._history.append((topic, timestamp))
+
+    @classmethod
+    def from_csv(cls, topic_areas: Dict[str, List[str]], path: str, **kwargs) -> "TopicScheduler":
+        return cls(topic_areas, read_topic_history(path), **kwargs)
+
+    @staticmethod
+    def _area(topic: str) -> str:
+        return topic.split(":", 1)[0]
+
+    def coverage(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Decayed number of recent tips per subtopic."""
+        now = time.time() if now is None else now
+        coverage = {topic: 0.0 for topic in self.topics}
+        for topic, timestamp in self._history:
+            coverage[topic] += 0.5 ** (max(0.0, now - timestamp) / self.half_life)
+        return coverage
+
+    def next_topics(self, n: int, now: Optional[float] = None) -> List[str]:
+        """
+        Pick `n` topics for the next batch and record them as used.
+
+        Topics are distinct within each pass over the catalogue; ties are
+        broken by area coverage (to spread a batch across areas) and then at
+        random.
+        """
+        now = time.time() if now is None else now
+        coverage = self.coverage(now)
+        picked: List[str] = []
+        while len(picked) < n:
+            area_coverage: Dict[str, float] = defaultdict(float)
+            for topic, value in coverage.items():
+                area_coverage[self._area(topic)] += value
+            batch: List[str] = []
+            for _ in range(min(n - len(picked), len(self.topics))):
+                candidates = [t for t in self.topics if t not in batch]
+                best = min(
+                    candidates,
+                    key=lambda t: (round(coverage[t], 6), area_coverage[self._area(t)], self.rng.random()),
+                )
+                batch.append(best)
+                coverage[best] += 1.0
+                area_coverage[self._area(best)] += 1.0
+            picked.extend(batch)
+        self._history.extend((topic, now) for topic in picked)
+        return picked
+
+    def next_topic(self) -> str:
+        return self.next_topics(1)[0]
@@ -0,0 +1,201 @@
+import os
+import csv
+import time
+import sqlite3
+import logging
+import threading
+from typing import List, Dict, Iterable, Iterator, Optional
+
+from src.content_generators.dedup import canonical_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    canonical_link TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL,
+    title TEXT,
+    source TEXT,
+    interest REAL,
+    accessibility REAL,
+    relevance REAL,
+    total_score REAL,
+    post_created INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_candidates ON articles (post_created, total_score DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_score ON articles (total_score DESC);
+
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    posted INTEGER NOT NULL DEFAULT 0,
+    title TEXT,
+    link TEXT,
+    source TEXT,
+    interest REAL,
+    accessibility REAL,
+    relevance REAL,
+    created_at REAL NOT NULL
+);
+"""
+
+def _to_bool(value) -> bool:
+    return str(value).strip().lower() in ("true", "1", "yes")
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+def _total_score(row: Dict) -> Optional[float]:
+    scores = [_to_float(row.get(field)) for field in ("interest", "accessibility", "relevance")]
+    if any(score is None for score in scores):
+        return None
+    return sum(scores) / len(scores)
+
+
+class ArticleStore:
+    """
+    Indexed SQLite store for scored articles and generated news posts.
+
+    Writes are per row, so a run only touches the articles it scored and the
+    posts it generated. Candidate selection uses the (post_created,
+    total_score) index instead of sorting the whole history.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM articles LIMIT 1").fetchone() is None
+
+    def add_articles(self, rows: Iterable[Dict]) -> int:
+        """Insert scored articles, ignoring links already stored. Returns the number inserted."""
+        now = time.time()
+        values = [
+            (
+                canonical_url(row["link"]), row["link"], row.get("title"), row.get("source"),
+                _to_float(row.get("interest")), _to_float(row.get("accessibility")),
+                _to_float(row.get("relevance")), _total_score(row),
+                int(_to_bool(row.get("postCreated", False))), now,
+            )
+            for row in rows
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO articles (canonical_link, link, title, source, interest, "
+                "accessibility, relevance, total_score, post_created, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def mark_post_created(self, link: str) -> None:
+        """Flag the article behind a generated post."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE articles SET post_created = 1 WHERE canonical_link = ?", (canonical_url(link),)
+            )
+            self._conn.commit()
+
+    def best_unposted(self, limit: int, exclude: Iterable[str] = ()) -> List[Dict]:
+        """Return the highest scoring articles that do not have a post yet."""
+        excluded = {canonical_url(link) for link in exclude}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM articles WHERE post_created = 0 AND total_score IS NOT NULL "
+                "ORDER BY total_score DESC LIMIT ?",
+                (limit + len(excluded),),
+            ).fetchall()
+        return [dict(r) for r in rows if r["canonical_link"] not in excluded][:limit]
+
+    def recent_scored(self, limit: int) -> List[Dict]:
+        """Return the most recently stored scored articles (e.g. to train the pre-ranker)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM articles WHERE total_score IS NOT NULL ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def get_article(self, article_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_articles(self, limit: Optional[int] = None) -> List[Dict]:
+        """Return stored articles, most recent first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM articles ORDER BY id DESC LIMIT ?", (-1 if limit is None else limit,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def update_scores(self, article_id: int, interest: float, accessibility: float, relevance: float) -> None:
+        """Overwrite an article's scores (e.g. after a bulk rescoring job)."""
+        total = (interest + accessibility + relevance) / 3
+        with self._lock:
+            self._conn.execute(
+                "UPDATE articles SET interest = ?, accessibility = ?, relevance = ?, total_score = ? WHERE id = ?",
+                (interest, accessibility, relevance, total, article_id),
+            )
+            self._conn.commit()
+
+    def iter_links(self) -> Iterator[str]:
+        """Yield every stored article link."""
+        with self._lock:
+            links = [row[0] for row in self._conn.execute("SELECT link FROM articles")]
+        yield from links
+
+    def add_post(self, post: Dict) -> None:
+        """Store a generated news post (keys as in posts.csv)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posts (id, posted, title, link, source, interest, accessibility, "
+                "relevance, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    post["ID"], int(_to_bool(post.get("Posted", False))), post.get("Title"), post.get("Link"),
+                    post.get("Source"), _to_float(post.get("Interest")), _to_float(post.get("Accessibility")),
+                    _to_float(post.get("Relevance")), time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def count_posts(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def import_csv(self, articles_csv: str, posts_csv: str) -> None:
+        """One-shot import of the legacy articles.csv and posts.csv files."""
+        if os.path.exists(articles_csv):
+            with open(articles_csv, "r", encoding="utf-8") as f:
+                inserted = self.add_articles(csv.DictReader(f))
+            logging.info(f"Imported {inserted} articles from {articles_csv}")
+        if os.path.exists(posts_csv):
+            with open(posts_csv, "r", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            for post in rows:
+                self.add_post(post)
+                if post.get("Link"):
+                    self.mark_post_created(post["Link"])
+            logging.info(f"Imported {len(rows)} posts from {posts_csv}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    store_path = sys.argv[1] if len(sys.argv) > 1 else "data/content.db"
+    store = ArticleStore(store_path)
+    store.import_csv("data/articles.csv", "data/posts.csv")
+    print(f"Imported legacy CSVs into {store_path}")
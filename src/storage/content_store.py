@@ -0,0 +1,267 @@
+import os
+import glob
+import mmap
+import struct
+import sqlite3
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_FILE = "index.db"
+SEGMENT_PATTERN = "segment-{:06d}.dat"
+
+# Record layout: magic, id length, body length, then the UTF-8 id and body.
+# The header makes segments self-describing, so the index can be rebuilt from them.
+_HEADER = struct.Struct("<4sHI")
+_MAGIC = b"CSR1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id TEXT PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+"""
+
+
+class ContentStore:
+    """
+    Append-only packed store for post drafts.
+
+    Drafts are appended to segment files in `root` and located through an
+    id -> (segment, offset, length) index in SQLite, so listing thousands of
+    drafts is one index query plus slices of memory-mapped segments instead
+    of one open() per file. Rewriting a draft appends a new record; the old
+    bytes are reclaimed by `compact`. Appends happen inside an IMMEDIATE
+    transaction, which also serialises writers from different processes.
+
+    Legacy one-file-per-draft `<id>.txt` files in `root` are still read until
+    `migrate_files` imports them.
+    """
+
+    def __init__(self, root: str, segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.root = root
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+        self._maps: Dict[int, Tuple[mmap.mmap, object]] = {}
+        os.makedirs(root, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(root, INDEX_FILE), check_same_thread=False,
+                                     isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.root, SEGMENT_PATTERN.format(segment))
+
+    def _segments(self) -> List[int]:
+        paths = glob.glob(os.path.join(self.root, "segment-*.dat"))
+        return sorted(int(os.path.basename(p)[8:14]) for p in paths)
+
+    def _legacy_path(self, content_id: str) -> str:
+        return os.path.join(self.root, f"{content_id}.txt")
+
+    # --- writes ---
+
+    def _append(self, records: Iterable[Tuple[str, str]], segment: Optional[int] = None) -> List[Tuple[str, int, int, int]]:
+        """Append records to the active (or given) segment. Caller holds the write transaction."""
+        segments = self._segments()
+        if segment is None:
+            segment = segments[-1] if segments else 0
+        entries = []
+        f = open(self._segment_path(segment), "ab")
+        try:
+            offset = f.seek(0, os.SEEK_END)
+            for content_id, text in records:
+                if offset >= self.segment_max_bytes:
+                    f.close()
+                    segment += 1
+                    f = open(self._segment_path(segment), "ab")
+                    offset = f.seek(0, os.SEEK_END)
+                key = content_id.encode("utf-8")
+                body = text.encode("utf-8")
+                f.write(_HEADER.pack(_MAGIC, len(key), len(body)) + key + body)
+                entries.append((content_id, segment, offset + _HEADER.size + len(key), len(body)))
+                offset += _HEADER.size + len(key) + len(body)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            f.close()
+        return entries
+
+    def put_many(self, records: Iterable[Tuple[str, str]]) -> None:
+        """Store (id, text) pairs, replacing earlier versions."""
+        records = list(records)
+        if not records:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                entries = self._append(records)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records (id, segment, offset, length) VALUES (?, ?, ?, ?)", entries
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def put(self, content_id: str, text: str) -> None:
+        self.put_many([(content_id, text)])
+
+    # --- reads ---
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """Return a read-only map of a segment covering at least `end` bytes."""
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped[0]) < end:
+            if mapped is not None:
+                mapped[0].close()
+                mapped[1].close()
+            f = open(self._segment_path(segment), "rb")
+            mapped = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), f)
+            self._maps[segment] = mapped
+        return mapped[0]
+
+    def _read(self, segment: int, offset: int, length: int) -> str:
+        data = self._map(segment, offset + length)
+        return data[offset:offset + length].decode("utf-8")
+
+    def _lookup(self, ids: List[str]) -> Dict[str, Tuple[int, int, int]]:
+        locations = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT id, segment, offset, length FROM records WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            locations.update({row[0]: row[1:] for row in rows})
+        return locations
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, str]:
+        """Return the stored text for every id that exists (missing ids are omitted)."""
+        ids = list(ids)
+        with self._lock:
+            locations = self._lookup(ids)
+            contents = {}
+            for content_id, location in locations.items():
+                try:
+                    contents[content_id] = self._read(*location)
+                except (OSError, ValueError):
+                    # A concurrent compaction moved the record; look it up again
+                    self._close_maps()
+                    location = self._lookup([content_id]).get(content_id)
+                    if location:
+                        contents[content_id] = self._read(*location)
+        for content_id in ids:
+            if content_id not in contents and os.path.exists(self._legacy_path(content_id)):
+                with open(self._legacy_path(content_id), "r", encoding="utf-8") as f:
+                    contents[content_id] = f.read()
+        return contents
+
+    def get(self, content_id: str) -> Optional[str]:
+        return self.get_many([content_id]).get(content_id)
+
+    def __contains__(self, content_id: str) -> bool:
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM records WHERE id = ?", (content_id,)).fetchone():
+                return True
+        return os.path.exists(self._legacy_path(content_id))
+
+    def existing(self, ids: Iterable[str]) -> Set[str]:
+        """Return the subset of ids that have content, without reading any bodies."""
+        ids = list(ids)
+        with self._lock:
+            found = set(self._lookup(ids))
+        found.update(i for i in ids if i not in found and os.path.exists(self._legacy_path(i)))
+        return found
+
+    def version(self) -> Tuple:
+        """Cheap change marker: sizes and mtimes of the index files and the directory."""
+        marker = []
+        for path in (self.root, os.path.join(self.root, INDEX_FILE), os.path.join(self.root, INDEX_FILE + "-wal")):
+            try:
+                stat = os.stat(path)
+                marker.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                marker.append(None)
+        return tuple(marker)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    # --- maintenance ---
+
+    def _close_maps(self) -> None:
+        for data, f in self._maps.values():
+            data.close()
+            f.close()
+        self._maps.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Live versus total segment bytes, to decide when to compact."""
+        with self._lock:
+            live = self._conn.execute("SELECT COALESCE(SUM(length), 0), COUNT(*) FROM records").fetchone()
+        total = sum(os.path.getsize(self._segment_path(s)) for s in self._segments())
+        return {"records": live[1], "live_bytes": live[0], "segment_bytes": total}
+
+    def compact(self) -> None:
+        """Rewrite live records into fresh segments and drop the old ones."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                old_segments = self._segments()
+                rows = self._conn.execute(
+                    "SELECT id, segment, offset, length FROM records ORDER BY segment, offset"
+                ).fetchall()
+                records = [(row[0], self._read(*row[1:])) for row in rows]
+                first_new = old_segments[-1] + 1 if old_segments else 0
+                entries = self._append(records, segment=first_new) if records else []
+                self._conn.executemany(
+                    "UPDATE records SET segment = ?, offset = ?, length = ? WHERE id = ?",
+                    [(segment, offset, length, content_id) for content_id, segment, offset, length in entries],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._close_maps()
+            for segment in old_segments:
+                os.remove(self._segment_path(segment))
+        logging.info(f"Compacted {len(records)} records in {self.root}")
+
+    def migrate_files(self, remove: bool = False) -> int:
+        """Import legacy `<id>.txt` drafts from `root`. Returns the number imported."""
+        paths = sorted(glob.glob(os.path.join(self.root, "*.txt")))
+        records = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                records.append((os.path.basename(path)[:-4], f.read()))
+        with self._lock:
+            known = set(self._lookup([content_id for content_id, _ in records]))
+        new_records = [record for record in records if record[0] not in known]
+        self.put_many(new_records)
+        if remove:
+            for path in paths:
+                os.remove(path)
+        logging.info(f"Migrated {len(new_records)} drafts into {self.root}")
+        return len(new_records)
+
+
+if __name__ == "__main__":
+    import sys
+
+    usage = "Usage: python -m src.storage.content_store migrate|compact|stats <dir> [--remove]"
+    if len(sys.argv) < 3 or sys.argv[1] not in ("migrate", "compact", "stats"):
+        print(usage)
+        sys.exit(1)
+    store = ContentStore(sys.argv[2])
+    if sys.argv[1] == "migrate":
+        print(f"Migrated {store.migrate_files(remove='--remove' in sys.argv)} drafts into {sys.argv[2]}")
+    elif sys.argv[1] == "compact":
+        store.compact()
+        print(store.stats())
+    else:
+        print(store.stats())
@@ -0,0 +1,194 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    strategy TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_strategy ON jobs (strategy, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (strategy, status);
+
+CREATE TABLE IF NOT EXISTS job_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_strategy ON job_events (strategy, id);
+CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id, id);
+"""
+
+# A running job that has not reported or sent a heartbeat for this long is treated as dead
+STALE_AFTER = 120.0
+# Events of jobs older than this are pruned when a new job is created
+EVENT_RETENTION = 7 * 24 * 3600
+# Statuses after which a job emits no more events
+FINISHED_STATUSES = ("completed", "error")
+
+
+class JobStore:
+    """
+    SQLite record of background generation jobs and their progress.
+
+    Every web worker process opens the same database, so any of them can
+    answer status requests, and the per-strategy running limit is checked
+    inside a write transaction across processes. Status, progress and log
+    changes are also appended to an event log with increasing ids, which
+    the SSE endpoint streams and resumes from. Readers blocked in
+    `wait_for_events` are woken as soon as this process appends an event.
+    """
+
+    def __init__(self, path: str, stale_after: float = STALE_AFTER):
+        self.path = path
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._changed = threading.Condition()
+        self._change_count = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def create(self, strategy: str, message: str = "Queued") -> str:
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM job_events WHERE created_at < ?", (now - EVENT_RETENTION,)
+            )
+            self._conn.execute(
+                "INSERT INTO jobs (id, strategy, status, progress, message, created_at, updated_at) "
+                "VALUES (?, ?, 'queued', 0, ?, ?, ?)",
+                (job_id, strategy, message, now, now),
+            )
+            self._add_event(job_id, strategy, "status", {"status": "queued", "progress": 0, "message": message})
+        self._notify()
+        return job_id
+
+    def _add_event(self, job_id: str, strategy: str, event_type: str, data: Dict) -> None:
+        self._conn.execute(
+            "INSERT INTO job_events (job_id, strategy, type, data, created_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, strategy, event_type, json.dumps({"job_id": job_id, **data}), time.time()),
+        )
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._change_count += 1
+            self._changed.notify_all()
+
+    def try_start(self, job_id: str, strategy: str, limit: int) -> bool:
+        """Mark a queued job as running if fewer than `limit` live jobs of its strategy are running."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                running = self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE strategy = ? AND status = 'in_progress' AND updated_at > ?",
+                    (strategy, time.time() - self.stale_after),
+                ).fetchone()[0]
+                started = running < limit
+                if started:
+                    message = "Starting content generation..."
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'in_progress', message = ?, updated_at = ? WHERE id = ?",
+                        (message, time.time(), job_id),
+                    )
+                    self._add_event(job_id, strategy, "status",
+                                    {"status": "in_progress", "progress": 0, "message": message})
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if started:
+            self._notify()
+        return started
+
+    def update(self, job_id: str, status: Optional[str] = None, progress: Optional[int] = None,
+               message: Optional[str] = None) -> None:
+        """Record progress (emitting a status or progress event); without arguments it is a heartbeat."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = COALESCE(?, status), progress = COALESCE(?, progress), "
+                "message = COALESCE(?, message), updated_at = ? WHERE id = ?",
+                (status, progress, message, time.time(), job_id),
+            )
+            if status is None and progress is None and message is None:
+                return
+            row = self._conn.execute(
+                "SELECT strategy, status, progress, message FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row:
+                self._add_event(job_id, row["strategy"], "status" if status else "progress",
+                                {"status": row["status"], "progress": row["progress"], "message": row["message"]})
+        self._notify()
+
+    def log(self, job_id: str, level: str, message: str) -> None:
+        """Append a log line to a job's event stream."""
+        with self._lock:
+            row = self._conn.execute("SELECT strategy FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row:
+                self._add_event(job_id, row["strategy"], "log", {"level": level, "message": message})
+        self._notify()
+
+    def events_since(self, strategy: str, last_event_id: int, job_id: Optional[str] = None,
+                     limit: int = 200) -> List[Dict]:
+        """Events of a strategy (optionally of one job) with ids greater than `last_event_id`."""
+        query = "SELECT id, type, data FROM job_events WHERE strategy = ? AND id > ?"
+        params = [strategy, last_event_id]
+        if job_id:
+            query += " AND job_id = ?"
+            params.append(job_id)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id LIMIT ?", params + [limit]).fetchall()
+        return [{"id": row["id"], "type": row["type"], "data": row["data"]} for row in rows]
+
+    def wait_for_events(self, strategy: str, last_event_id: int, job_id: Optional[str] = None,
+                        timeout: float = 15.0, poll_interval: float = 5.0) -> List[Dict]:
+        """
+        Like `events_since`, but waits up to `timeout` seconds for new events.
+
+        Events written by this process wake the caller immediately; events
+        written by other processes are found by re-checking every `poll_interval`.
+        """
+        deadline = time.time() + timeout
+        while True:
+            with self._changed:
+                seen = self._change_count
+            events = self.events_since(strategy, last_event_id, job_id)
+            remaining = deadline - time.time()
+            if events or remaining <= 0:
+                return events
+            with self._changed:
+                if self._change_count == seen:
+                    self._changed.wait(min(remaining, poll_interval))
+
+    def first_event_id(self, job_id: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(id) FROM job_events WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def latest(self, strategy: str) -> Optional[Dict]:
+        """The most recently created job of a strategy."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE strategy = ? ORDER BY created_at DESC LIMIT 1", (strategy,)
+            ).fetchone()
+        return dict(row) if row else None
@@ -0,0 +1,150 @@
+import os
+import csv
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+POST_STATUS_FILE = "data/post_status.db"
+LEGACY_CSV_FILES = {"tip": "data/ml_engineering_tips.csv", "news": "data/posts.csv"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS post_status (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    posted INTEGER NOT NULL DEFAULT 0,
+    posted_at REAL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_post_status_unposted ON post_status (kind, posted, created_at);
+CREATE TABLE IF NOT EXISTS id_counters (
+    prefix TEXT PRIMARY KEY,
+    next_value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class PostStatusStore:
+    """
+    Posted/draft status of every post, plus sequential post id allocation.
+
+    Publishing flips one row instead of rewriting a metadata CSV, and every
+    write is its own SQLite transaction, so generators appending drafts and
+    the web app publishing them can run at the same time (also across
+    processes). The metadata CSVs remain the source of titles and
+    timestamps; their Posted column is only read by the one-time import.
+    """
+
+    def __init__(self, path: str = POST_STATUS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def register(self, ids: Iterable[str], kind: str) -> None:
+        """Record new drafts (ids already known keep their status)."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO post_status (id, kind, posted, created_at) VALUES (?, ?, 0, ?)",
+                [(post_id, kind, now) for post_id in ids],
+            )
+
+    def mark_posted(self, post_id: str, kind: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO post_status (id, kind, posted, posted_at, created_at) VALUES (?, ?, 1, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET posted = 1, posted_at = excluded.posted_at",
+                (post_id, kind, now, now),
+            )
+
+    def statuses(self) -> Dict[str, bool]:
+        """Posted flag of every known post."""
+        with self._lock:
+            return {row[0]: bool(row[1]) for row in self._conn.execute("SELECT id, posted FROM post_status")}
+
+    def unposted(self, kind: str, limit: int) -> List[str]:
+        """Ids of up to `limit` unposted posts of a kind, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM post_status WHERE kind = ? AND posted = 0 "
+                "ORDER BY created_at DESC, rowid DESC LIMIT ?",
+                (kind, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def allocate_id(self, prefix: str) -> str:
+        """
+        Atomically reserve the next `<prefix><n>` id.
+
+        The first allocation for a prefix starts after the highest id of that
+        form already registered.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT next_value FROM id_counters WHERE prefix = ?", (prefix,)).fetchone()
+                if row:
+                    value = row[0]
+                else:
+                    highest = self._conn.execute(
+                        "SELECT MAX(CAST(SUBSTR(id, ?) AS INTEGER)) FROM post_status WHERE id GLOB ?",
+                        (len(prefix) + 1, f"{prefix}[0-9]*"),
+                    ).fetchone()[0]
+                    value = 0 if highest is None else highest + 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO id_counters (prefix, next_value) VALUES (?, ?)", (prefix, value + 1)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return f"{prefix}{value}"
+
+    def import_csv_once(self, csv_files: Dict[str, str] = LEGACY_CSV_FILES) -> None:
+        """One-time import of the Posted flags in the legacy metadata CSVs ({kind: path})."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT 1 FROM meta WHERE key = 'csv_imported'").fetchone():
+                    self._conn.execute("COMMIT")
+                    return
+                now = time.time()
+                imported = 0
+                for kind, path in csv_files.items():
+                    if not os.path.exists(path):
+                        continue
+                    with open(path, "r", encoding="utf-8") as f:
+                        rows = [
+                            (row["ID"], kind, int((row.get("Posted") or "").lower() == "true"), now)
+                            for row in csv.DictReader(f)
+                        ]
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO post_status (id, kind, posted, created_at) VALUES (?, ?, ?, ?)", rows
+                    )
+                    imported += len(rows)
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('csv_imported', ?)", (str(now),))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        logging.info(f"Imported the status of {imported} posts into {self.path}")
+
+    def version(self) -> Tuple:
+        """Cheap change marker (mtimes and sizes of the database files)."""
+        marker = []
+        for path in (self.path, self.path + "-wal"):
+            try:
+                stat = os.stat(path)
+                marker.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                marker.append(None)
+        return tuple(marker)
@@ -0,0 +1,121 @@
+import os
+import time
+import uuid
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posting_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posting_items_status ON posting_items (status, id);
+CREATE INDEX IF NOT EXISTS idx_posting_items_batch ON posting_items (batch_id, id);
+
+CREATE TABLE IF NOT EXISTS posting_lease (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class PostingStore:
+    """
+    Shared SQLite queue of posts waiting to be published, with per-item results.
+
+    Any web worker can enqueue and read results. A lease row makes sure only
+    one consumer (and so one browser session) publishes at a time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def enqueue(self, items: List[Dict]) -> str:
+        """Queue (post_id, content_type) items in order and return their batch id."""
+        batch_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO posting_items (batch_id, post_id, content_type, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(batch_id, item["post_id"], item["content_type"], now, now) for item in items],
+            )
+        return batch_id
+
+    def acquire_lease(self, owner: str, ttl: float) -> bool:
+        """Take or renew the consumer lease; False while another live consumer holds it."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT owner, expires_at FROM posting_lease WHERE name = 'consumer'").fetchone()
+                acquired = row is None or row["owner"] == owner or row["expires_at"] < now
+                if acquired:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO posting_lease (name, owner, expires_at) VALUES ('consumer', ?, ?)",
+                        (owner, now + ttl),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return acquired
+
+    def claim_next(self) -> Optional[Dict]:
+        """Mark the oldest queued item as publishing and return it."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM posting_items WHERE status = 'queued' ORDER BY id LIMIT 1"
+                ).fetchone()
+                if row:
+                    self._conn.execute(
+                        "UPDATE posting_items SET status = 'publishing', updated_at = ? WHERE id = ?",
+                        (time.time(), row["id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return dict(row, status="publishing") if row else None
+
+    def fail_interrupted(self) -> None:
+        """
+        Fail items a dead consumer left in 'publishing'.
+
+        They are not re-queued because the post may already be live.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE posting_items SET status = 'failed', error = ?, updated_at = ? WHERE status = 'publishing'",
+                ("Interrupted while publishing; check LinkedIn before retrying", time.time()),
+            )
+
+    def finish(self, item_id: int, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE posting_items SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                ("failed" if error else "published", error, time.time(), item_id),
+            )
+
+    def batch(self, batch_id: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM posting_items WHERE batch_id = ? ORDER BY id", (batch_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,33 @@
+import os
+import stat
+import uuid
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w", new_file_mode: int = 0o666, **open_kwargs) -> Iterator[IO]:
+    """
+    Open a temp file next to `path` and move it over `path` once the block succeeds.
+
+    Readers see either the old or the new file, never a partial write; on
+    error the temp file is removed and `path` is left untouched. The new file
+    keeps the permission bits of the file it replaces. A file created for the
+    first time gets `new_file_mode` minus the umask (pass 0o600 for secrets).
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, new_file_mode)
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
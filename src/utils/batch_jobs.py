@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import logging
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import openai
+
+from src.utils.atomic_file import atomic_write
+from src.utils.llm import chat_completion
+
+CHAT_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+# Terminal statuses without usable results; the job is submitted again on the next run
+RETRY_STATUSES = ("failed", "expired", "cancelled")
+
+
+class OpenAIBatchBackend:
+    """Submits job files to the OpenAI Batch API (24h completion window, discounted pricing)."""
+
+    name = "openai"
+
+    def submit(self, requests_path: str) -> str:
+        with open(requests_path, "rb") as f:
+            input_file = openai.files.create(file=f, purpose="batch")
+        batch = openai.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> Tuple[str, Optional[str]]:
+        batch = openai.batches.retrieve(batch_id)
+        return batch.status, batch.output_file_id
+
+    def download(self, output_file_id: str, results_path: str) -> None:
+        content = openai.files.content(output_file_id)
+        with open(results_path, "wb") as f:
+            f.write(content.read())
+
+
+class LocalBatchBackend:
+    """
+    Local stand-in for the Batch API.
+
+    Runs every request through the rate-limited `chat_completion` at submit
+    time and writes results in the Batch API output format. Requests already
+    present in the results file are not sent again.
+    """
+
+    name = "local"
+
+    def submit(self, requests_path: str) -> str:
+        results_path = requests_path.replace("requests.jsonl", "local_results.jsonl")
+        done = {k for k, v in BatchJob.read_results(results_path).items() if v is not None}
+        with open(requests_path, "r", encoding="utf-8") as f, \
+                open(results_path, "a", encoding="utf-8") as out:
+            for line in f:
+                request = json.loads(line)
+                if request["custom_id"] in done:
+                    continue
+                try:
+                    response = chat_completion(**request["body"])
+                    result = {"custom_id": request["custom_id"],
+                              "response": {"status_code": 200, "body": response.model_dump()},
+                              "error": None}
+                except Exception as e:
+                    logging.error(f"Local batch request {request['custom_id']} failed: {str(e)}")
+                    result = {"custom_id": request["custom_id"], "response": None,
+                              "error": {"message": str(e)}}
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+        return f"local:{results_path}"
+
+    def status(self, batch_id: str) -> Tuple[str, Optional[str]]:
+        return "completed", batch_id.split(":", 1)[1]
+
+    def download(self, output_file_id: str, results_path: str) -> None:
+        if os.path.abspath(output_file_id) != os.path.abspath(results_path):
+            with open(output_file_id, "rb") as src, open(results_path, "wb") as dst:
+                dst.write(src.read())
+
+
+BACKENDS = {"openai": OpenAIBatchBackend, "local": LocalBatchBackend}
+
+
+class BatchJob:
+    """
+    A resumable bulk job of chat completion requests stored in a job directory.
+
+    The directory holds requests.jsonl (one Batch API request per line),
+    results.jsonl (the downloaded output), state.json (batch id and status)
+    and merged.txt (an append-only log of merged custom_ids). Every step checks the state first,
+    so re-running a job after a crash picks up where it stopped and never
+    submits or merges a request twice.
+    """
+
+    def __init__(self, job_dir: str):
+        self.job_dir = job_dir
+        os.makedirs(job_dir, exist_ok=True)
+        self.requests_path = os.path.join(job_dir, "requests.jsonl")
+        self.results_path = os.path.join(job_dir, "results.jsonl")
+        self.state_path = os.path.join(job_dir, "state.json")
+        self.merged_path = os.path.join(job_dir, "merged.txt")
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"batch_id": None, "status": "new"}
+
+    def save_state(self) -> None:
+        with atomic_write(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+
+    @property
+    def has_requests(self) -> bool:
+        return os.path.exists(self.requests_path)
+
+    def write_requests(self, requests: Iterable[Tuple[str, Dict]]) -> int:
+        """Write (custom_id, chat request body) pairs, skipping duplicate ids. Returns the count."""
+        seen: Set[str] = set()
+        with atomic_write(self.requests_path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests:
+                if custom_id in seen:
+                    continue
+                seen.add(custom_id)
+                f.write(json.dumps({"custom_id": custom_id, "method": "POST",
+                                    "url": CHAT_ENDPOINT, "body": body}) + "\n")
+        self.state["status"] = "created"
+        self.save_state()
+        return len(seen)
+
+    @property
+    def needs_submit(self) -> bool:
+        """True until a batch is submitted, and again once it failed, expired or was cancelled."""
+        return not self.state.get("batch_id") or self.state.get("status") in RETRY_STATUSES
+
+    def submit(self, backend) -> str:
+        """Submit the job unless a batch for it is pending or completed."""
+        if not self.needs_submit:
+            return self.state["batch_id"]
+        if self.state.get("batch_id"):
+            logging.warning(f"Batch {self.state['batch_id']} of {self.job_dir} ended {self.state['status']}, resubmitting")
+        self.state["batch_id"] = backend.submit(self.requests_path)
+        self.state["backend"] = backend.name
+        self.state["status"] = "submitted"
+        self.save_state()
+        logging.info(f"Submitted batch job {self.job_dir} as {self.state['batch_id']}")
+        return self.state["batch_id"]
+
+    def wait(self, backend, poll_interval: float = 60.0) -> str:
+        """Poll until the batch reaches a terminal status and download its results."""
+        while True:
+            status, output_file_id = backend.status(self.state["batch_id"])
+            self.state["status"] = status
+            self.save_state()
+            if status in TERMINAL_STATUSES:
+                break
+            logging.info(f"Batch {self.state['batch_id']} is {status}, checking again in {poll_interval:.0f}s")
+            time.sleep(poll_interval)
+        if status == "completed" and output_file_id:
+            backend.download(output_file_id, self.results_path)
+        return status
+
+    @staticmethod
+    def read_results(results_path: str) -> Dict[str, Optional[str]]:
+        """Map custom_id to the assistant message content (None for failed requests)."""
+        results: Dict[str, Optional[str]] = {}
+        if not os.path.exists(results_path):
+            return results
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                body = response.get("body") or {}
+                choices = body.get("choices") or []
+                content = choices[0]["message"]["content"] if choices else None
+                results[record["custom_id"]] = content.strip() if content else None
+        return results
+
+    def merged_ids(self) -> Set[str]:
+        if not os.path.exists(self.merged_path):
+            return set()
+        with open(self.merged_path, "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def pending_results(self) -> Dict[str, Optional[str]]:
+        """Results that have not been merged into the stores yet."""
+        merged = self.merged_ids()
+        return {k: v for k, v in self.read_results(self.results_path).items() if k not in merged}
+
+    def mark_merged(self, custom_id: str) -> None:
+        """Record that a result was merged; appended immediately so a crash cannot merge it twice."""
+        with open(self.merged_path, "a", encoding="utf-8") as f:
+            f.write(custom_id + "\n")
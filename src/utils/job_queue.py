@@ -0,0 +1,84 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from src.storage.job_store import JobStore
+
+# Job functions receive a progress(percent, message) callback
+Job = Callable[[Callable[[int, str], None]], None]
+
+HEARTBEAT_INTERVAL = 30.0
+RETRY_INTERVAL = 2.0
+
+
+class _JobLogHandler(logging.Handler):
+    """Copies log records emitted on a job's thread into the job's event stream."""
+
+    def __init__(self, store: JobStore, job_id: str, thread_id: int):
+        super().__init__(logging.INFO)
+        self.store = store
+        self.job_id = job_id
+        self.thread_id = thread_id
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.thread != self.thread_id:
+            return
+        try:
+            self.store.log(self.job_id, record.levelname, record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+
+class JobQueue:
+    """
+    Runs generation jobs on a worker pool and records their progress in a JobStore.
+
+    `submit` returns a job id immediately. A job whose strategy is already at
+    its concurrency limit (counted across processes through the store) is
+    re-scheduled instead of blocking a worker thread.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 4, limits: Dict[str, int] = None,
+                 default_limit: int = 1):
+        self.store = store
+        self.limits = limits or {}
+        self.default_limit = default_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    def submit(self, strategy: str, job: Job) -> str:
+        job_id = self.store.create(strategy)
+        self._executor.submit(self._run, job_id, strategy, job)
+        return job_id
+
+    def _retry_later(self, job_id: str, strategy: str, job: Job) -> None:
+        timer = threading.Timer(RETRY_INTERVAL, self._executor.submit,
+                                (self._run, job_id, strategy, job, True))
+        timer.daemon = True
+        timer.start()
+
+    def _run(self, job_id: str, strategy: str, job: Job, waiting: bool = False) -> None:
+        if not self.store.try_start(job_id, strategy, self.limits.get(strategy, self.default_limit)):
+            if not waiting:
+                self.store.update(job_id, message="Waiting for a running job to finish...")
+            self._retry_later(job_id, strategy, job)
+            return
+
+        stop_heartbeat = threading.Event()
+
+        def heartbeat() -> None:
+            while not stop_heartbeat.wait(HEARTBEAT_INTERVAL):
+                self.store.update(job_id)
+
+        threading.Thread(target=heartbeat, daemon=True).start()
+        log_handler = _JobLogHandler(self.store, job_id, threading.get_ident())
+        logging.getLogger().addHandler(log_handler)
+        try:
+            job(lambda progress, message: self.store.update(job_id, progress=progress, message=message))
+            self.store.update(job_id, status="completed", progress=100, message="Content generation completed!")
+        except Exception as e:
+            logging.error(f"Job {job_id} ({strategy}) failed: {str(e)}")
+            self.store.update(job_id, status="error", message=f"Error: {str(e)}")
+        finally:
+            logging.getLogger().removeHandler(log_handler)
+            stop_heartbeat.set()
@@ -0,0 +1,126 @@
+import os
+import asyncio
+import weakref
+from typing import Dict, List, Optional
+
+import openai
+from openai.types.chat import ChatCompletion
+from dotenv import load_dotenv
+
+from src.utils.rate_limiter import RateLimiter
+from src.utils.llm_cache import LLMCache, LLMCacheMiss, request_key
+
+load_dotenv()
+
+# --- CONFIG ---
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "30000"))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+DEFAULT_COMPLETION_TOKENS = 500
+LLM_CACHE_FILE = os.getenv("LLM_CACHE_FILE", "data/cache/llm_responses.db")
+LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "on")
+
+# Shared by every OpenAI call in the process
+rate_limiter = RateLimiter(OPENAI_RPM, OPENAI_TPM, OPENAI_MAX_CONCURRENCY)
+llm_cache = LLMCache(LLM_CACHE_FILE, LLM_CACHE_MODE)
+
+# Async clients hold connections bound to an event loop, so keep one per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def estimate_request_tokens(messages: List[Dict], max_tokens: Optional[int] = None) -> int:
+    """Estimate prompt plus completion tokens for a chat request."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt_chars // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+def _usage_tokens(response) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", None) if usage else None
+
+
+def _record_rate_limit(error: Exception) -> None:
+    response = getattr(error, "response", None)
+    if response is not None:
+        rate_limiter.update_from_headers(response.headers)
+
+
+def _cached_response(key: str, cache: bool) -> Optional[ChatCompletion]:
+    """Look a request up in the response cache according to the cache mode."""
+    if not llm_cache.should_read(cache):
+        return None
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return ChatCompletion.model_validate_json(cached)
+    if llm_cache.mode == "replay":
+        raise LLMCacheMiss(f"No cached response for request {key[:12]} in replay mode")
+    return None
+
+
+def _store_response(key: str, cache: bool, response: ChatCompletion) -> None:
+    if llm_cache.should_write(cache):
+        llm_cache.put(key, response.model, response.model_dump_json())
+
+
+def chat_completion(cache: bool = False, **kwargs):
+    """
+    Rate-limited drop-in for `openai.chat.completions.create`.
+
+    Waits for the shared limiter before sending, then feeds the response's
+    rate-limit headers and token usage back into it. Pass ``cache=True`` for
+    deterministic-enough calls (e.g. scoring) to reuse earlier responses.
+    """
+    key = request_key(kwargs)
+    cached = _cached_response(key, cache)
+    if cached is not None:
+        return cached
+
+    estimated = estimate_request_tokens(kwargs["messages"], kwargs.get("max_tokens"))
+    rate_limiter.acquire(estimated)
+    actual = None
+    try:
+        raw = openai.chat.completions.with_raw_response.create(**kwargs)
+        rate_limiter.update_from_headers(raw.headers)
+        response = raw.parse()
+        actual = _usage_tokens(response)
+    except openai.RateLimitError as e:
+        _record_rate_limit(e)
+        raise
+    finally:
+        rate_limiter.release(estimated, actual)
+    _store_response(key, cache, response)
+    return response
+
+
+def get_async_client() -> openai.AsyncOpenAI:
+    """Return the async OpenAI client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = openai.AsyncOpenAI(api_key=openai.api_key or os.getenv("OPENAI_API_KEY"))
+        _async_clients[loop] = client
+    return client
+
+
+async def achat_completion(cache: bool = False, **kwargs):
+    """Async counterpart of `chat_completion`, sharing the same limiter and cache."""
+    key = request_key(kwargs)
+    cached = _cached_response(key, cache)
+    if cached is not None:
+        return cached
+
+    estimated = estimate_request_tokens(kwargs["messages"], kwargs.get("max_tokens"))
+    await rate_limiter.aacquire(estimated)
+    actual = None
+    try:
+        raw = await get_async_client().chat.completions.with_raw_response.create(**kwargs)
+        rate_limiter.update_from_headers(raw.headers)
+        response = raw.parse()
+        actual = _usage_tokens(response)
+    except openai.RateLimitError as e:
+        _record_rate_limit(e)
+        raise
+    finally:
+        rate_limiter.release(estimated, actual)
+    _store_response(key, cache, response)
+    return response
@@ -0,0 +1,85 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Optional
+
+# Cache modes:
+#   off    - never read or write the cache
+#   on     - calls that opt in (cache=True) are served from and stored in the cache
+#   record - like "on", and every other call is stored too (for building replay fixtures)
+#   replay - every call is served from the cache only; a miss raises LLMCacheMiss
+CACHE_MODES = ("off", "on", "record", "replay")
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+def request_key(request: Dict) -> str:
+    """Hash the parts of a chat request that determine its response."""
+    relevant = {
+        "model": request.get("model"),
+        "messages": request.get("messages"),
+        "temperature": request.get("temperature"),
+        "max_tokens": request.get("max_tokens"),
+        "response_format": request.get("response_format"),
+    }
+    payload = json.dumps(relevant, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed store of chat completion responses keyed by request hash."""
+
+    def __init__(self, path: str, mode: str = "on"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode {mode!r}, expected one of {CACHE_MODES}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database lazily so mode "off" never touches disk."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def should_read(self, opted_in: bool) -> bool:
+        return self.mode == "replay" or (opted_in and self.mode in ("on", "record"))
+
+    def should_write(self, opted_in: bool) -> bool:
+        return self.mode == "record" or (opted_in and self.mode == "on")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response JSON for a request key, if any."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response_json: str) -> None:
+        """Store the response JSON for a request key."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created_at) VALUES (?, ?, ?, ?)",
+                (key, model, response_json, time.time()),
+            )
+            conn.commit()
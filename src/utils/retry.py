@@ -0,0 +1,29 @@
+import asyncio
+import logging
+from functools import wraps
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def with_async_retry(max_tries: int = 3, base_delay: float = 1.0):
+    """
+    Coroutine counterpart of `with_retry` from src.utils.utils.
+
+    Awaits the decorated coroutine function up to `max_tries` times,
+    sleeping `base_delay * 2 ** attempt` seconds between attempts without
+    blocking the event loop, and re-raises the last error.
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            for attempt in range(max_tries):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_tries - 1:
+                        raise
+                    logging.warning(f"{func.__name__} attempt {attempt + 1} failed: {str(e)}")
+                    await asyncio.sleep(base_delay * 2 ** attempt)
+        return wrapper
+    return decorator
@@ -1,16 +1,13 @@
-from flask import Flask, render_template, jsonify, request, redirect, url_for
+from flask import Flask, render_template, jsonify, request, redirect, url_for, Response, stream_with_context
 import sys
 import os
 from datetime import datetime
 import importlib.util
 import glob
-import csv
 import logging
 import json
-import asyncio
+import time
 from bs4 import BeautifulSoup
-import yaml
-from pathlib import Path
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,6 +17,20 @@ sys.path.append(project_root)
 src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(src_dir)
 
+from src.web.post_index import PostIndex, PostSource
+from src.config.strategy_registry import StrategyRegistry
+from src.storage.job_store import FINISHED_STATUSES
+from src.automation.jobs import (
+    DATA_DIR,
+    GENERATION_STRATEGIES,
+    content_stores,
+    job_store,
+    post_status,
+    posting_queue,
+    queue_posts,
+    submit_generation,
+)
+
 # from agents.strategy_agent import StrategyAgent
 
 # Configure logging
@@ -28,11 +39,33 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Global variable to track generation status
-generation_progress = {
-    'ml_tips': {'status': 'idle', 'progress': 0, 'message': ''},
-    'tech_news': {'status': 'idle', 'progress': 0, 'message': ''}
-}
+# Generation jobs, draft stores, post status and the posting queue come from
+# src.automation.jobs, shared with the scheduler daemon
+# Server-Sent Events: streams wake on job store writes in this process; events
+# written by other processes (e.g. the scheduler's jobs) are picked up by
+# re-checking every EVENTS_FALLBACK_POLL seconds. A keep-alive comment is sent
+# after EVENTS_KEEPALIVE idle seconds, and a stream stays open for at most
+# EVENTS_STREAM_LIFETIME before the browser reconnects with Last-Event-ID.
+EVENTS_FALLBACK_POLL = 5.0
+EVENTS_KEEPALIVE = 15.0
+EVENTS_STREAM_LIFETIME = 300.0
+
+# Posted flags live in the status store; the metadata CSVs are only read for titles and timestamps
+post_status.import_csv_once({
+    'tip': os.path.join(DATA_DIR, 'ml_engineering_tips.csv'),
+    'news': os.path.join(DATA_DIR, 'posts.csv'),
+})
+
+# Post metadata index shared by the listing routes
+post_index = PostIndex([
+    PostSource('ML Tip', os.path.join(DATA_DIR, 'ml_engineering_tips.csv'),
+               content_stores['ml_tips']),
+    PostSource('Tech News', os.path.join(DATA_DIR, 'posts.csv'),
+               content_stores['tech_news'], {'title': 'Title', 'source': 'Source'}),
+], status_store=post_status)
+STRATEGY_POST_TYPES = {'ml_tips': 'ML Tip', 'tech_news': 'Tech News'}
+# Largest page /posts returns when a limit is given; without one it returns every match
+POSTS_MAX_PAGE_SIZE = 500
 
 # Initialize strategy agent
 # strategy_agent = StrategyAgent()
@@ -57,78 +90,28 @@ def load_script(script_name):
         logger.error(f"Error loading script {script_name}: {str(e)}")
         raise
 
-def get_posts():
-    posts = []
-    
-    # Get ML Tips posts
-    tips_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                           'data', 'tips_posts')
-    tips_metadata = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                                'data', 'ml_engineering_tips.csv')
-    
-    if os.path.exists(tips_metadata):
-        with open(tips_metadata, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                post_id = row['ID']
-                post_file = os.path.join(tips_dir, f"{post_id}.txt")
-                if os.path.exists(post_file):
-                    with open(post_file, 'r', encoding='utf-8') as pf:
-                        content = pf.read()
-                        posts.append({
-                            'id': post_id,
-                            'type': 'ML Tip',
-                            'content': content,
-                            'timestamp': row.get('Timestamp', ''),
-                            'posted': row.get('Posted', '').lower() == 'true'
-                        })
-    
-    # Get Tech News posts
-    news_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                           'data', 'news_posts')
-    news_metadata = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                                'data', 'posts.csv')
-    
-    if os.path.exists(news_metadata):
-        with open(news_metadata, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                post_id = row['ID']
-                post_file = os.path.join(news_dir, f"{post_id}.txt")
-                if os.path.exists(post_file):
-                    with open(post_file, 'r', encoding='utf-8') as pf:
-                        content = pf.read()
-                        posts.append({
-                            'id': post_id,
-                            'type': 'Tech News',
-                            'content': content,
-                            'title': row.get('Title', ''),
-                            'source': row.get('Source', ''),
-                            'timestamp': row.get('Timestamp', ''),
-                            'posted': row.get('Posted', '').lower() == 'true'
-                        })
-    
-    return sorted(posts, key=lambda x: x.get('timestamp', ''), reverse=True)
+def get_posts(post_type=None, posted=None, limit=None, offset=0, include_content=True):
+    """Return (total, page) of posts, newest first, from the in-memory post index."""
+    total, posts = post_index.query(post_type, posted, limit, offset)
+    if include_content:
+        post_index.with_content(posts)
+    return total, posts
+
+# Cached content strategies (re-parsed only when the YAML file changes)
+strategy_registry = StrategyRegistry("src/config/content_strategies.yaml")
 
 # Load content strategies
 def load_strategies():
     try:
-        config_path = Path("src/config/content_strategies.yaml")
-        if not config_path.exists():
-            return {}
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return strategy_registry.load()
     except Exception as e:
         logging.error(f"Error loading strategies: {str(e)}")
         return {}
 
-# Save content strategies
-def save_strategies(strategies):
+# Apply a change to the latest strategies and save them in one step
+def update_strategies(change):
     try:
-        config_path = Path("src/config/content_strategies.yaml")
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            yaml.dump(strategies, f, default_flow_style=False)
+        strategy_registry.update(change)
         return True
     except Exception as e:
         logging.error(f"Error saving strategies: {str(e)}")
@@ -156,18 +139,16 @@ def view_strategy(strategy_name):
 @app.route('/strategy/<strategy_name>/edit', methods=['GET', 'POST'])
 def edit_strategy(strategy_name):
     """Edit a specific strategy."""
-    strategies = load_strategies()
-    
     if request.method == 'POST':
         # Update strategy
         strategy_data = request.form.to_dict()
-        strategies[strategy_name] = strategy_data
         
-        if save_strategies(strategies):
+        if update_strategies(lambda strategies: strategies.__setitem__(strategy_name, strategy_data)):
             return redirect(url_for('view_strategy', strategy_name=strategy_name))
         else:
             return "Error saving strategy", 500
     
+    strategies = load_strategies()
     strategy = strategies.get('content_types', {}).get(strategy_name, {})
     return render_template('edit_strategy.html', 
                          strategy_name=strategy_name, 
@@ -177,46 +158,19 @@ def edit_strategy(strategy_name):
 @app.route('/strategy/<strategy_name>/content')
 def view_content(strategy_name):
     """View content for a specific strategy."""
-    content_items = []
-    
-    # Map strategy names to their respective directories and metadata files
-    strategy_configs = {
-        'ml_tips': {
-            'content_dir': 'data/tips_posts',
-            'metadata_file': 'data/ml_engineering_tips.csv'
-        },
-        'tech_news': {
-            'content_dir': 'data/news_posts',
-            'metadata_file': 'data/posts.csv'
-        }
-    }
-    
-    config = strategy_configs.get(strategy_name)
-    if not config:
+    post_type = STRATEGY_POST_TYPES.get(strategy_name)
+    if not post_type:
         return "Strategy not found", 404
     
-    # Load content from the appropriate directory
-    content_dir = Path(config['content_dir'])
-    metadata_file = Path(config['metadata_file'])
-    
-    if metadata_file.exists():
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                post_id = row['ID']
-                post_file = content_dir / f"{post_id}.txt"
-                
-                if post_file.exists():
-                    with open(post_file, 'r', encoding='utf-8') as pf:
-                        content = pf.read()
-                        content_items.append({
-                            'id': post_id,
-                            'title': row.get('Title', 'Untitled'),
-                            'content': content,
-                            'created_at': row.get('Timestamp', ''),
-                            'status': 'posted' if row.get('Posted', '').lower() == 'true' else 'draft',
-                            'source': row.get('Source', '') if strategy_name == 'tech_news' else None
-                        })
+    _, posts = get_posts(post_type)
+    content_items = [{
+        'id': post['id'],
+        'title': post.get('title') or 'Untitled',
+        'content': post['content'],
+        'created_at': post['timestamp'],
+        'status': 'posted' if post['posted'] else 'draft',
+        'source': post.get('source', '') if strategy_name == 'tech_news' else None
+    } for post in posts]
     
     return render_template('content_list.html', 
                          strategy_name=strategy_name, 
@@ -262,146 +216,201 @@ def trigger_script(script_name):
 
 @app.route('/posts')
 def get_posts_route():
-    return jsonify(get_posts())
+    """
+    List posts, newest first.
+    
+    Query parameters: limit (max 500; all matches if omitted), offset, type
+    ("ML Tip" or "Tech News"), posted (true/false) and fields=preview to leave
+    out the post bodies. The total number of matches is returned in
+    X-Total-Count.
+    """
+    try:
+        limit = request.args.get('limit')
+        limit = None if limit is None else min(int(limit), POSTS_MAX_PAGE_SIZE)
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'limit and offset must be integers'}), 400
+    if (limit is not None and limit < 0) or offset < 0:
+        return jsonify({'status': 'error', 'message': 'limit and offset must not be negative'}), 400
+    posted = request.args.get('posted')
+    if posted is not None:
+        posted = posted.lower() == 'true'
+    
+    total, posts = get_posts(request.args.get('type'), posted, limit, offset,
+                             include_content=request.args.get('fields') != 'preview')
+    response = jsonify(posts)
+    response.headers['X-Total-Count'] = str(total)
+    return response
+
+def post_type_of(post_id):
+    return 'ML Tip' if post_id.startswith('TIP_') else 'Tech News'
 
 @app.route('/post/<post_id>', methods=['POST'])
 def post_to_linkedin_endpoint(post_id):
+    """Queue a post for publishing, optionally saving edited content first."""
     try:
-        logger.debug(f"Attempting to post {post_id} to LinkedIn")
-        
-        # Get the post content
-        post_type = 'ML Tip' if post_id.startswith('TIP_') else 'Tech News'
-        content_type = "Tip" if post_type == 'ML Tip' else "News"
+        post_type = post_type_of(post_id)
         
         # Get the content from the request
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if data and 'content' in data:
             # Use the edited content
             content = data['content']
-            # Save the edited content to the file
-            posts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                                   'data', 'tips_posts' if post_type == 'ML Tip' else 'news_posts')
-            post_file = os.path.join(posts_dir, f"{post_id}.txt")
-            
             # Convert HTML content to plain text
             soup = BeautifulSoup(content, 'html.parser')
             plain_text = '\n'.join([p.get_text() for p in soup.find_all('p')])
             
-            with open(post_file, 'w', encoding='utf-8') as f:
-                f.write(plain_text)
+            # Save the edited content to the content store
+            content_stores['ml_tips' if post_type == 'ML Tip' else 'tech_news'].put(post_id, plain_text)
             
             logger.info(f"Saved edited content for {post_id}")
         
-        # Post to LinkedIn using the existing function
-        success = asyncio.run(post_to_linkedin(post_id, content_type))
-        
-        if not success:
-            error_msg = f"Failed to post {post_id} to LinkedIn"
-            logger.error(error_msg)
-            return jsonify({'status': 'error', 'message': error_msg}), 500
-            
-        # Mark the post as posted in the metadata
-        metadata_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                                   'data', 'ml_engineering_tips.csv' if post_type == 'ML Tip' else 'posts.csv')
-        
-        # Read the CSV file
-        rows = []
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            for row in reader:
-                if row['ID'] == post_id:
-                    row['Posted'] = 'true'
-                rows.append(row)
-        
-        # Write back to CSV
-        with open(metadata_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-        
-        logger.info(f"Successfully posted {post_id} to LinkedIn")
+        batch_id = queue_posts([post_id])
+        logger.info(f"Queued {post_id} for publishing (batch {batch_id})")
         return jsonify({
             'status': 'success',
-            'message': f'Successfully posted {post_id} to LinkedIn'
-        })
+            'message': f'Queued {post_id} for publishing',
+            'batch_id': batch_id
+        }), 202
     except Exception as e:
-        error_msg = f"Error posting to LinkedIn: {str(e)}"
+        error_msg = f"Error queueing post: {str(e)}"
         logger.error(error_msg)
         return jsonify({'status': 'error', 'message': error_msg}), 500
 
+@app.route('/posts/publish', methods=['POST'])
+def publish_selected():
+    """Queue several posts ({"post_ids": [...]}) to be published in order."""
+    data = request.get_json(silent=True) or {}
+    post_ids = data.get('post_ids')
+    if not isinstance(post_ids, list) or not post_ids or not all(isinstance(i, str) for i in post_ids):
+        return jsonify({'status': 'error', 'message': 'post_ids must be a non-empty list of post IDs'}), 400
+    
+    batch_id = queue_posts(post_ids)
+    logger.info(f"Queued {len(post_ids)} posts for publishing (batch {batch_id})")
+    return jsonify({
+        'status': 'success',
+        'message': f'Queued {len(post_ids)} posts for publishing',
+        'batch_id': batch_id
+    }), 202
+
+@app.route('/posts/publish/<batch_id>')
+def publish_status(batch_id):
+    """Per-post results of a publishing batch."""
+    items = posting_queue.store.batch(batch_id)
+    if not items:
+        return jsonify({'status': 'error', 'message': f'Unknown batch: {batch_id}'}), 404
+    return jsonify({
+        'batch_id': batch_id,
+        'items': [{'post_id': item['post_id'], 'status': item['status'], 'error': item['error']}
+                  for item in items]
+    })
+
 @app.route('/strategy/<strategy_name>/generate', methods=['POST'])
 def generate_content(strategy_name):
-    """Generate new content for a specific strategy."""
-    try:
-        if strategy_name not in ['ml_tips', 'tech_news']:
-            return jsonify({
-                'status': 'error',
-                'message': f'Unknown strategy: {strategy_name}'
-            }), 400
+    """Queue content generation for a strategy and return the job id immediately."""
+    if strategy_name not in GENERATION_STRATEGIES:
+        return jsonify({
+            'status': 'error',
+            'message': f'Unknown strategy: {strategy_name}'
+        }), 400
 
-        # Reset status
-        generation_progress[strategy_name] = {
-            'status': 'in_progress',
-            'progress': 0,
-            'message': 'Starting content generation...'
-        }
-
-        if strategy_name == 'ml_tips':
-            from src.content_generators.ml_tips import main as generate_ml_tips
-            # Update status for each tip
-            for i in range(3):
-                generation_progress[strategy_name].update({
-                    'progress': (i + 1) * 33,
-                    'message': f'Generating tip {i + 1}/3...'
-                })
-                generate_ml_tips(n=1)
-        else:  # tech_news
-            from src.content_generators.tech_news import generate_tech_news_content
-            generation_progress[strategy_name].update({
-                'progress': 20,
-                'message': 'Fetching articles...'
-            })
-            generate_tech_news_content()
+    job_id = submit_generation(strategy_name)
+    return jsonify({
+        'status': 'success',
+        'message': f'Queued content generation for {strategy_name}',
+        'job_id': job_id
+    }), 202
 
-        generation_progress[strategy_name].update({
-            'status': 'completed',
-            'progress': 100,
-            'message': 'Content generation completed!'
-        })
+def job_status(job):
+    return {
+        'job_id': job['id'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'message': job['message']
+    }
 
-        return jsonify({
-            'status': 'success',
-            'message': f'Successfully generated new content for {strategy_name}'
-        })
-    except Exception as e:
-        logging.error(f"Error generating content: {str(e)}")
-        generation_progress[strategy_name].update({
-            'status': 'error',
-            'message': f'Error: {str(e)}'
-        })
-        return jsonify({
-            'status': 'error',
-            'message': f'Error generating content: {str(e)}'
-        }), 500
+@app.route('/jobs/<job_id>')
+def get_job_status(job_id):
+    """Get the status of a generation job."""
+    job = job_store.get(job_id)
+    if not job:
+        return jsonify({'status': 'error', 'message': f'Unknown job: {job_id}'}), 404
+    return jsonify(job_status(job))
 
 @app.route('/strategy/<strategy_name>/status')
 def get_generation_status(strategy_name):
-    """Get the current status of content generation."""
-    if strategy_name not in generation_progress:
+    """Get the status of the most recent generation job of a strategy."""
+    if strategy_name not in GENERATION_STRATEGIES:
+        return jsonify({
+            'status': 'error',
+            'message': f'Unknown strategy: {strategy_name}'
+        }), 400
+    
+    job = job_store.latest(strategy_name)
+    if not job:
+        return jsonify({'status': 'idle', 'progress': 0, 'message': ''})
+    return jsonify(job_status(job))
+
+@app.route('/strategy/<strategy_name>/events')
+def stream_generation_events(strategy_name):
+    """
+    Server-Sent Events stream of generation status, progress and log events.
+    
+    Resumes after the Last-Event-ID header (or ?last_event_id=). A new stream
+    replays the events of ?job_id= or of the strategy's latest job. A ?job_id=
+    stream ends once that job has finished, and answers 204 (so the browser
+    stops reconnecting) if it had already finished with nothing left to send.
+    """
+    if strategy_name not in GENERATION_STRATEGIES:
         return jsonify({
             'status': 'error',
             'message': f'Unknown strategy: {strategy_name}'
         }), 400
     
-    return jsonify(generation_progress[strategy_name])
+    job_id = request.args.get('job_id')
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid Last-Event-ID'}), 400
+    if last_event_id is None:
+        replay_job = job_id or (job_store.latest(strategy_name) or {}).get('id')
+        first_id = job_store.first_event_id(replay_job) if replay_job else None
+        last_event_id = first_id - 1 if first_id else 0
+    
+    if job_id:
+        job = job_store.get(job_id)
+        if (job is None or job['status'] in FINISHED_STATUSES) and \
+                not job_store.events_since(strategy_name, last_event_id, job_id, limit=1):
+            return Response(status=204)
+    
+    def events():
+        nonlocal last_event_id
+        started = time.time()
+        yield 'retry: 3000\n\n'
+        while time.time() - started < EVENTS_STREAM_LIFETIME:
+            batch = job_store.wait_for_events(strategy_name, last_event_id, job_id,
+                                              timeout=EVENTS_KEEPALIVE, poll_interval=EVENTS_FALLBACK_POLL)
+            if not batch:
+                yield ': keep-alive\n\n'
+                continue
+            finished = False
+            for event in batch:
+                last_event_id = event['id']
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {event['data']}\n\n"
+                if event['type'] == 'status' and json.loads(event['data'])['status'] in FINISHED_STATUSES:
+                    finished = True
+            if job_id and finished:
+                return
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/strategy/new', methods=['GET', 'POST'])
 def new_strategy():
     """Create a new content strategy."""
     if request.method == 'POST':
         try:
-            strategies = load_strategies()
             strategy_name = request.form.get('strategy_name', '').lower().replace(' ', '_')
             
             if not strategy_name:
@@ -409,12 +418,6 @@ def new_strategy():
                     'status': 'error',
                     'message': 'Strategy name is required'
                 }), 400
-                
-            if strategy_name in strategies.get('content_types', {}):
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Strategy "{strategy_name}" already exists'
-                }), 400
             
             # Create new strategy with default values
             new_strategy = {
@@ -434,31 +437,30 @@ def new_strategy():
                 'topics': ['AI/ML', 'Cloud Computing', 'Data Engineering']
             }
             
-            # Add to content types
-            if 'content_types' not in strategies:
-                strategies['content_types'] = {}
-            strategies['content_types'][strategy_name] = new_strategy
+            def add_strategy(strategies):
+                # Checked under the registry lock, so two requests can't both create the same name
+                if strategy_name in strategies.get('content_types', {}):
+                    raise ValueError(f'Strategy "{strategy_name}" already exists')
+                strategies.setdefault('content_types', {})[strategy_name] = new_strategy
+                strategies.setdefault('posting_schedule', {})[strategy_name] = [
+                    {'day': 'monday', 'time': '09:00'},
+                    {'day': 'wednesday', 'time': '09:00'},
+                    {'day': 'friday', 'time': '09:00'}
+                ]
             
-            # Add to posting schedule
-            if 'posting_schedule' not in strategies:
-                strategies['posting_schedule'] = {}
-            strategies['posting_schedule'][strategy_name] = [
-                {'day': 'monday', 'time': '09:00'},
-                {'day': 'wednesday', 'time': '09:00'},
-                {'day': 'friday', 'time': '09:00'}
-            ]
-            
-            if save_strategies(strategies):
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Successfully created strategy "{strategy_name}"',
-                    'redirect': url_for('view_strategy', strategy_name=strategy_name)
-                })
-            else:
+            try:
+                strategy_registry.update(add_strategy)
+            except ValueError as e:
                 return jsonify({
                     'status': 'error',
-                    'message': 'Failed to save strategy'
-                }), 500
+                    'message': str(e)
+                }), 400
+            
+            return jsonify({
+                'status': 'success',
+                'message': f'Successfully created strategy "{strategy_name}"',
+                'redirect': url_for('view_strategy', strategy_name=strategy_name)
+            })
                 
         except Exception as e:
             logging.error(f"Error creating strategy: {str(e)}")
@@ -505,4 +507,8 @@ def strategy_chat():
         }), 500
 
 if __name__ == '__main__':
+    # The web app hosts the posting consumer. With debug=True the reloader
+    # re-runs this module in a child process, and only that child consumes.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        posting_queue.start()
     app.run(debug=True, port=5003) 
\ No newline at end of file
@@ -0,0 +1,119 @@
+import os
+import csv
+import threading
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+
+from src.storage.content_store import ContentStore
+from src.storage.post_status_store import PostStatusStore
+
+
+@dataclass
+class PostSource:
+    """One kind of post: its metadata CSV, its draft store and the CSV columns it exposes."""
+    type: str
+    metadata_file: str
+    store: ContentStore
+    columns: Dict[str, str] = field(default_factory=dict)
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PostIndex:
+    """
+    In-process index of post metadata for the web app.
+
+    Metadata CSVs are parsed once and re-parsed only when their mtime or size
+    changes; draft presence is re-checked only when a content store changes.
+    Queries filter and page the sorted index and never read post bodies.
+    With a status store, its posted flags override the CSV Posted column.
+    """
+
+    def __init__(self, sources: List[PostSource], status_store: Optional[PostStatusStore] = None):
+        self.sources = sources
+        self.status_store = status_store
+        self._lock = threading.Lock()
+        self._rows: Dict[str, List[Dict]] = {s.type: [] for s in sources}
+        self._present: Dict[str, set] = {s.type: set() for s in sources}
+        self._signatures: Dict[str, Tuple] = {}
+        self._status_version: Optional[Tuple] = None
+        self._entries: List[Dict] = []
+
+    def _load_rows(self, source: PostSource) -> List[Dict]:
+        if not os.path.exists(source.metadata_file):
+            return []
+        with open(source.metadata_file, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        entries = []
+        for row in rows:
+            entry = {
+                "id": row["ID"],
+                "type": source.type,
+                "timestamp": row.get("Timestamp", ""),
+                "posted": (row.get("Posted") or "").lower() == "true",
+            }
+            entry.update({key: row.get(column, "") for key, column in source.columns.items()})
+            entries.append(entry)
+        return entries
+
+    def refresh(self) -> None:
+        """Reload whatever changed since the last refresh."""
+        with self._lock:
+            changed = False
+            for source in self.sources:
+                csv_signature = _file_signature(source.metadata_file)
+                store_signature = source.store.version()
+                old_csv, old_store = self._signatures.get(source.type, (False, False))
+                if csv_signature != old_csv:
+                    self._rows[source.type] = self._load_rows(source)
+                if csv_signature != old_csv or store_signature != old_store:
+                    self._present[source.type] = source.store.existing(e["id"] for e in self._rows[source.type])
+                    self._signatures[source.type] = (csv_signature, store_signature)
+                    changed = True
+            if self.status_store is not None:
+                status_version = self.status_store.version()
+                if changed or status_version != self._status_version:
+                    statuses = self.status_store.statuses()
+                    for rows in self._rows.values():
+                        for entry in rows:
+                            entry["posted"] = statuses.get(entry["id"], entry["posted"])
+                    self._status_version = status_version
+            if changed:
+                entries = [
+                    entry for source in self.sources for entry in self._rows[source.type]
+                    if entry["id"] in self._present[source.type]
+                ]
+                self._entries = sorted(entries, key=lambda x: x.get("timestamp", ""), reverse=True)
+
+    def query(self, post_type: Optional[str] = None, posted: Optional[bool] = None,
+              limit: Optional[int] = None, offset: int = 0) -> Tuple[int, List[Dict]]:
+        """Return the number of matching posts and the requested page of their metadata."""
+        self.refresh()
+        entries = self._entries
+        if post_type is not None:
+            entries = [e for e in entries if e["type"] == post_type]
+        if posted is not None:
+            entries = [e for e in entries if e["posted"] == posted]
+        end = None if limit is None else offset + limit
+        return len(entries), [dict(e) for e in entries[offset:end]]
+
+    def store_for(self, post_type: str) -> ContentStore:
+        return next(s.store for s in self.sources if s.type == post_type)
+
+    def with_content(self, entries: List[Dict]) -> List[Dict]:
+        """Attach post bodies to a page of entries (one store lookup per post type)."""
+        for source in self.sources:
+            ids = [e["id"] for e in entries if e["type"] == source.type]
+            if not ids:
+                continue
+            contents = source.store.get_many(ids)
+            for e in entries:
+                if e["type"] == source.type:
+                    e["content"] = contents.get(e["id"], "")
+        return entries
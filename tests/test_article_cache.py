@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.article_cache import ArticleCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def _count(cache):
+    return cache._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    """An entry is served until it is ttl seconds old, then dropped on read."""
+    cache = ArticleCache(str(tmp_path / "articles.db"), ttl=3600, max_bytes=1024)
+    cache.put("https://example.com/a", "Serving LLMs", "Body")
+
+    clock[0] += 3600
+    assert cache.get("http://www.example.com/a/?utm_source=rss") == {"title": "Serving LLMs", "text": "Body"}
+
+    clock[0] += 1
+    assert cache.get("https://example.com/a") is None
+    assert _count(cache) == 0
+
+
+def test_expired_entries_are_purged_on_write(tmp_path, clock):
+    """Writing a new entry removes the expired ones, whether or not they were read."""
+    cache = ArticleCache(str(tmp_path / "articles.db"), ttl=3600, max_bytes=1024)
+    cache.put("https://example.com/a", "A", "Old body")
+
+    clock[0] += 3601
+    cache.put("https://example.com/b", "B", "New body")
+    assert _count(cache) == 1
+    assert cache.get("https://example.com/b")["text"] == "New body"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    """Over max_bytes, the entries read longest ago go first."""
+    cache = ArticleCache(str(tmp_path / "articles.db"), ttl=3600, max_bytes=20)
+    cache.put("https://example.com/a", "A", "x" * 9)
+    clock[0] += 1
+    cache.put("https://example.com/b", "B", "x" * 9)
+    clock[0] += 1
+    cache.get("https://example.com/a")
+    clock[0] += 1
+    cache.put("https://example.com/c", "C", "x" * 9)
+
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/a") is not None
+    assert cache.get("https://example.com/c") is not None
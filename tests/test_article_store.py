@@ -0,0 +1,59 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.storage.article_store import ArticleStore
+
+
+def _article(name, score=None):
+    row = {"link": f"https://example.com/{name}", "title": name, "source": "test"}
+    if score is not None:
+        row.update(interest=score, accessibility=score, relevance=score)
+    return row
+
+
+def test_recent_scored_returns_newest_scored_articles(tmp_path):
+    """Unscored and half-scored articles are skipped; the newest come first, up to the limit."""
+    store = ArticleStore(str(tmp_path / "content.db"))
+    store.add_articles([_article("a", 5), _article("b"), _article("c", 7)])
+    store.add_articles([{**_article("d", 9), "relevance": "nan"}, _article("e", 3)])
+
+    assert [a["title"] for a in store.recent_scored(10)] == ["e", "c", "a"]
+    assert [a["title"] for a in store.recent_scored(2)] == ["e", "c"]
+    assert store.recent_scored(1)[0]["total_score"] == 3
+
+
+def test_recent_scored_includes_rescored_articles(tmp_path):
+    """An article scored later by a bulk job becomes training data."""
+    store = ArticleStore(str(tmp_path / "content.db"))
+    store.add_articles([_article("a"), _article("b", 4)])
+    unscored = next(a for a in store.list_articles() if a["title"] == "a")
+
+    store.update_scores(unscored["id"], 8, 6, 7)
+    assert [(a["title"], a["total_score"]) for a in store.recent_scored(10)] == [("b", 4), ("a", 7)]
+
+
+def test_iter_links_yields_each_stored_link_once(tmp_path):
+    """Every article is listed, scored or not; a canonical duplicate is not stored twice."""
+    store = ArticleStore(str(tmp_path / "content.db"))
+    assert store.add_articles([_article("a", 5), _article("b")]) == 2
+    assert store.add_articles([{**_article("a", 9), "link": "http://www.example.com/a/?utm_source=rss"}]) == 0
+
+    assert sorted(store.iter_links()) == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_iter_links_can_be_consumed_while_writing(tmp_path):
+    """The links are read up front, so storing articles mid-iteration neither blocks nor changes it."""
+    store = ArticleStore(str(tmp_path / "content.db"))
+    store.add_articles([_article("a"), _article("b")])
+
+    links = []
+    for link in store.iter_links():
+        links.append(link)
+        store.add_articles([_article(f"new-{len(links)}")])
+
+    assert sorted(links) == ["https://example.com/a", "https://example.com/b"]
+    assert len(list(store.iter_links())) == 4
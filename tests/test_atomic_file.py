@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.utils.atomic_file import atomic_write
+
+
+def _mode(path):
+    return os.stat(path).st_mode & 0o777
+
+
+def test_replacement_keeps_the_original_permissions(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+    with atomic_write(str(path), "w", encoding="utf-8") as f:
+        f.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert _mode(path) == 0o640
+
+
+def test_new_files_follow_the_umask_unless_a_mode_is_given(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        with atomic_write(str(tmp_path / "sub" / "public.json")) as f:
+            f.write("{}")
+        with atomic_write(str(tmp_path / "secret.json"), new_file_mode=0o600) as f:
+            f.write("{}")
+    finally:
+        os.umask(umask)
+    assert _mode(tmp_path / "sub" / "public.json") == 0o644
+    assert _mode(tmp_path / "secret.json") == 0o600
+
+
+def test_failed_write_leaves_the_file_and_no_temp_file(tmp_path):
+    path = tmp_path / "tips.csv"
+    path.write_text("ID\n", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path)) as f:
+            f.write("partial")
+            raise RuntimeError("crash")
+    assert path.read_text(encoding="utf-8") == "ID\n"
+    assert os.listdir(tmp_path) == ["tips.csv"]
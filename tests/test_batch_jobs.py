@@ -0,0 +1,87 @@
+import os
+import sys
+import json
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+    def model_dump(self):
+        return {"choices": [{"message": {"role": "assistant", "content": self.content}}]}
+
+
+@pytest.fixture
+def batch_jobs(generator_modules, monkeypatch):
+    module = generator_modules("src.utils.batch_jobs")
+    calls = []
+
+    def chat_completion(**body):
+        calls.append(body["messages"][0]["content"])
+        if body["messages"][0]["content"] == "boom":
+            raise RuntimeError("API error")
+        return _Response(" answer to " + body["messages"][0]["content"])
+
+    monkeypatch.setattr(module, "chat_completion", chat_completion)
+    module.calls = calls
+    return module
+
+
+def _requests(*prompts):
+    return [(f"id:{p}", {"model": "gpt-4", "messages": [{"role": "user", "content": p}]}) for p in prompts]
+
+
+def test_local_job_runs_once_and_resumes(batch_jobs, tmp_path):
+    """Each request is sent once; a re-opened job reuses its batch and skips merged results."""
+    job = batch_jobs.BatchJob(str(tmp_path / "job"))
+    assert job.write_requests(_requests("a", "b", "a")) == 2
+
+    backend = batch_jobs.LocalBatchBackend()
+    batch_id = job.submit(backend)
+    assert job.wait(backend, poll_interval=0) == "completed"
+    assert job.pending_results() == {"id:a": "answer to a", "id:b": "answer to b"}
+    job.mark_merged("id:a")
+
+    resumed = batch_jobs.BatchJob(str(tmp_path / "job"))
+    assert not resumed.needs_submit
+    assert resumed.submit(backend) == batch_id
+    assert resumed.pending_results() == {"id:b": "answer to b"}
+    assert batch_jobs.calls == ["a", "b"]
+
+
+def test_failed_requests_are_retried_on_resubmit(batch_jobs, tmp_path):
+    """The local backend records failures as empty results and only resends those."""
+    job = batch_jobs.BatchJob(str(tmp_path / "job"))
+    job.write_requests(_requests("a", "boom"))
+    backend = batch_jobs.LocalBatchBackend()
+    job.submit(backend)
+    job.wait(backend, poll_interval=0)
+    assert job.pending_results() == {"id:a": "answer to a", "id:boom": None}
+
+    backend.submit(job.requests_path)
+    assert batch_jobs.calls == ["a", "boom", "boom"]
+
+
+@pytest.mark.parametrize("status", ["failed", "expired", "cancelled"])
+def test_unsuccessful_batches_are_resubmitted(batch_jobs, tmp_path, status):
+    """A batch that ended without results no longer pins the job directory."""
+    job = batch_jobs.BatchJob(str(tmp_path / "job"))
+    job.write_requests(_requests("a"))
+    job.state.update({"batch_id": "batch_123", "backend": "openai", "status": status})
+    job.save_state()
+
+    resumed = batch_jobs.BatchJob(str(tmp_path / "job"))
+    assert resumed.needs_submit
+    batch_id = resumed.submit(batch_jobs.LocalBatchBackend())
+
+    assert batch_id != "batch_123"
+    with open(resumed.state_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"batch_id": batch_id, "backend": "local", "status": "submitted"}
+    assert resumed.wait(batch_jobs.LocalBatchBackend(), poll_interval=0) == "completed"
+    assert resumed.pending_results() == {"id:a": "answer to a"}
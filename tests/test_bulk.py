@@ -0,0 +1,85 @@
+import os
+import sys
+import csv
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+ARTICLES = [
+    {"link": "https://example.com/serving", "title": "Serving LLMs", "source": "test",
+     "interest": 9, "accessibility": 8, "relevance": 9},
+    {"link": "https://example.com/features", "title": "Feature stores", "source": "test",
+     "interest": 5, "accessibility": 5, "relevance": 5},
+]
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+    def model_dump(self):
+        return {"choices": [{"message": {"role": "assistant", "content": self.content}}]}
+
+
+def _chat_completion(calls):
+    def chat_completion(**body):
+        prompt = body["messages"][-1]["content"]
+        calls.append(prompt)
+        if "Interest" in prompt:
+            return _Response("Interest: 7\nAccessibility: 6\nRelevance: 8")
+        return _Response("Generated: " + prompt.strip().splitlines()[0][:40])
+    return chat_completion
+
+
+@pytest.fixture
+def bulk(generator_modules, monkeypatch):
+    module = generator_modules("src.content_generators.bulk")
+    batch_jobs = generator_modules("src.utils.batch_jobs")
+    module.calls = []
+    monkeypatch.setattr(batch_jobs, "chat_completion", _chat_completion(module.calls))
+    monkeypatch.setattr(module, "fetch_article_content",
+                        lambda url, title=None: {"title": title, "content": f"Body of {title}"})
+    module.article_store.add_articles(ARTICLES)
+    return module
+
+
+def test_score_job_updates_scores_once(bulk):
+    """Scores are merged into the store, and re-running the job sends and merges nothing again."""
+    bulk.run_job("score", "rescore", backend_name="local", limit=10, poll_interval=0)
+    assert {a["link"]: (a["interest"], a["accessibility"], a["relevance"])
+            for a in bulk.article_store.list_articles()} == {a["link"]: (7, 6, 8) for a in ARTICLES}
+    assert len(bulk.calls) == 2
+
+    bulk.run_job("score", "rescore", backend_name="local", limit=10, poll_interval=0)
+    assert len(bulk.calls) == 2
+    with open(os.path.join(bulk.JOBS_DIR, "rescore", "merged.txt"), "r", encoding="utf-8") as f:
+        assert len(f.read().split()) == 2
+
+
+def test_posts_job_creates_one_post_per_article(bulk):
+    """Post results become drafts with a status entry and a posts.csv row, and are not merged twice."""
+    bulk.run_job("posts", "backfill", backend_name="local", limit=1, poll_interval=0)
+    bulk.run_job("posts", "backfill", backend_name="local", limit=1, poll_interval=0)
+
+    assert list(bulk.post_status.statuses()) == ["N_POST_0"]
+    assert bulk.news_store.get("N_POST_0").startswith("Generated: ")
+    assert [a["link"] for a in bulk.article_store.best_unposted(10)] == ["https://example.com/features"]
+    with open("data/posts.csv", "r", encoding="utf-8") as f:
+        assert [row["Link"] for row in csv.DictReader(f)] == ["https://example.com/serving"]
+
+
+def test_tip_merge_is_idempotent(bulk):
+    """Merging the same tip result twice, e.g. after a crash before it was logged, saves it once."""
+    bulk.run_job("tips", "tips-batch", backend_name="local", limit=2, poll_interval=0)
+    merge_tip = bulk.tip_merger("tips-batch")
+    for custom_id in bulk.BatchJob(os.path.join(bulk.JOBS_DIR, "tips-batch")).merged_ids():
+        merge_tip(custom_id, "A repeated tip")
+
+    with open("data/ml_engineering_tips.csv", "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert len({row["ID"] for row in rows}) == 2
+    assert all(row["Topic"] for row in rows)
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.dedup import SeenIndex, RejectIndex, canonical_url
+
+
+def test_canonical_url_strips_tracking_and_variants():
+    """Tracking params, www, scheme, ports, fragments and trailing slashes are ignored."""
+    expected = "https://example.com/post?a=1&b=2"
+    assert canonical_url("http://www.Example.com/post/?utm_source=rss&b=2&a=1#top") == expected
+    assert canonical_url("https://example.com:443/post?a=1&b=2") == expected
+    assert canonical_url("https://towardsdatascience.com/x/?source=rss----7f60cf5620c9---4") == \
+        "https://towardsdatascience.com/x"
+
+
+def test_canonical_url_keeps_meaningful_parts():
+    """Non-tracking query params, custom ports and the root path survive."""
+    assert canonical_url("https://example.com/?id=7") == "https://example.com/?id=7"
+    assert canonical_url("https://example.com:8080/a") == "https://example.com:8080/a"
+
+
+def test_seen_index_persists_canonical_urls(tmp_path):
+    """URLs are matched by canonical form and survive reopening the index."""
+    path = str(tmp_path / "seen.db")
+    index = SeenIndex(path)
+    index.add_many(["http://example.com/a/", "https://example.com/b"])
+
+    reopened = SeenIndex(path)
+    assert len(reopened) == 2
+    assert "https://www.example.com/a?utm_medium=email" in reopened
+    assert "https://example.com/c" not in reopened
+
+
+def test_reject_index_entries_expire(tmp_path, monkeypatch):
+    """Rejected URLs are matched by canonical form until their TTL runs out."""
+    path = str(tmp_path / "rejects.db")
+    index = RejectIndex(path, ttl=60)
+    index.add("http://www.example.com/a/")
+    assert "https://example.com/a" in RejectIndex(path, ttl=60)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert "https://example.com/a" not in index
+    assert "https://example.com/a" not in RejectIndex(path, ttl=60)
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.feed_cache import FeedCache
+
+FEED_URL = "https://example.com/feed"
+
+
+class _Entry:
+    def __init__(self, title, link):
+        self.title = title
+        self.link = link
+
+
+class _Feed(dict):
+    """The parts of a feedparser result fetch_rss_feed reads."""
+
+    def __init__(self, status, entries=(), etag=None, modified=None):
+        super().__init__(etag=etag, modified=modified)
+        self.status = status
+        self.entries = list(entries)
+
+
+@pytest.fixture
+def tech_news(generator_modules, tmp_path, monkeypatch):
+    module = generator_modules("src.content_generators.tech_news")
+    monkeypatch.setattr(module, "feed_cache", FeedCache(str(tmp_path / "feeds.json")))
+    module.requests_made = []
+    module.responses = []
+
+    def parse(url, **validators):
+        module.requests_made.append(validators)
+        return module.responses.pop(0)
+
+    monkeypatch.setattr(module.feedparser, "parse", parse)
+    return module
+
+
+def test_not_modified_feed_reuses_cached_entries(tech_news, tmp_path, monkeypatch):
+    """A 304 answer to the conditional request returns the stored entries and refreshes fetched_at."""
+    tech_news.responses = [
+        _Feed(200, [_Entry("Serving LLMs", "https://example.com/a")], etag='"v1"', modified="Mon, 06 Oct 2025 08:00:00 GMT"),
+        _Feed(304),
+    ]
+    first = tech_news.fetch_rss_feed(FEED_URL)
+    fetched_at = tech_news.feed_cache.get(FEED_URL)["fetched_at"]
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert tech_news.fetch_rss_feed(FEED_URL) == first == [
+        {"title": "Serving LLMs", "link": "https://example.com/a", "source": FEED_URL}
+    ]
+    assert tech_news.requests_made == [{}, {"etag": '"v1"', "modified": "Mon, 06 Oct 2025 08:00:00 GMT"}]
+
+    reopened = FeedCache(str(tmp_path / "feeds.json"))
+    assert reopened.get(FEED_URL)["entries"] == first
+    assert reopened.get(FEED_URL)["fetched_at"] > fetched_at
+
+
+def test_changed_feed_replaces_cached_entries(tech_news):
+    """A 200 answer stores the new entries and validators; an empty one falls back to the cache."""
+    tech_news.responses = [
+        _Feed(200, [_Entry("Old", "https://example.com/old")], etag='"v1"'),
+        _Feed(200, [_Entry("New", "https://example.com/new")], etag='"v2"'),
+        _Feed(200, []),
+    ]
+    tech_news.fetch_rss_feed(FEED_URL)
+    assert [e["title"] for e in tech_news.fetch_rss_feed(FEED_URL)] == ["New"]
+    assert tech_news.feed_cache.validators(FEED_URL) == {"etag": '"v2"', "modified": None}
+    assert [e["title"] for e in tech_news.fetch_rss_feed(FEED_URL)] == ["New"]
@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import threading
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.storage.job_store import JobStore
+from src.utils.job_queue import JobQueue
+
+
+def _wait_for(store, job_id, status, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = store.get(job_id)
+        if job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} is {store.get(job_id)['status']}, expected {status}")
+
+
+def test_job_progress_is_recorded(tmp_path):
+    """Progress reported by a job is visible through the store until completion."""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    queue = JobQueue(store)
+    release = threading.Event()
+
+    def job(progress):
+        progress(40, "Halfway there")
+        release.wait(5)
+
+    job_id = queue.submit("ml_tips", job)
+    job = _wait_for(store, job_id, "in_progress")
+    deadline = time.time() + 5
+    while job["progress"] != 40 and time.time() < deadline:
+        time.sleep(0.05)
+        job = store.get(job_id)
+    assert (job["progress"], job["message"]) == (40, "Halfway there")
+    release.set()
+    assert _wait_for(store, job_id, "completed")["progress"] == 100
+    assert store.latest("ml_tips")["id"] == job_id
+
+
+def test_failed_job_records_error(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job_id = JobQueue(store).submit("tech_news", lambda progress: 1 / 0)
+    assert "division by zero" in _wait_for(store, job_id, "error")["message"]
+
+
+def test_strategy_limit_is_shared_through_the_store(tmp_path):
+    """A second store on the same file sees the running job and refuses to start another."""
+    path = str(tmp_path / "jobs.db")
+    first, second = JobStore(path), JobStore(path)
+    a, b = first.create("tech_news"), second.create("tech_news")
+    assert first.try_start(a, "tech_news", limit=1)
+    assert not second.try_start(b, "tech_news", limit=1)
+    first.update(a, status="completed")
+    assert second.try_start(b, "tech_news", limit=1)
+
+
+def test_events_resume_after_last_event_id(tmp_path):
+    """Status, progress and log events get increasing ids and can be resumed from any of them."""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job_id = store.create("tech_news")
+    assert store.try_start(job_id, "tech_news", limit=1)
+    store.update(job_id, progress=10, message="Fetching and scoring articles...")
+    store.log(job_id, "INFO", "Dropped 3 near-duplicate articles before scoring")
+    store.update(job_id)  # heartbeat, no event
+    events = store.events_since("tech_news", store.first_event_id(job_id) - 1)
+    assert [e["type"] for e in events] == ["status", "status", "progress", "log"]
+    assert [e["id"] for e in store.events_since("tech_news", events[1]["id"])] == [e["id"] for e in events[2:]]
+    assert store.events_since("ml_tips", 0) == []
+
+
+def test_waiting_for_events_wakes_on_update(tmp_path):
+    """A waiting reader returns as soon as this process writes an event, long before the poll interval."""
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job_id = store.create("ml_tips")
+    last_id = store.events_since("ml_tips", 0)[-1]["id"]
+    threading.Timer(0.1, store.update, args=(job_id,), kwargs={"progress": 30}).start()
+
+    started = time.time()
+    events = store.wait_for_events("ml_tips", last_id, job_id, timeout=10, poll_interval=10)
+    assert [e["type"] for e in events] == ["progress"]
+    assert time.time() - started < 5
+
+
+def test_waiting_for_events_sees_other_processes_by_polling(tmp_path):
+    """Events written through another connection are found on the fallback poll, and an idle wait times out."""
+    path = str(tmp_path / "jobs.db")
+    reader, writer = JobStore(path), JobStore(path)
+    job_id = writer.create("ml_tips")
+    last_id = reader.events_since("ml_tips", 0)[-1]["id"]
+    assert reader.wait_for_events("ml_tips", last_id, timeout=0.2, poll_interval=0.05) == []
+
+    threading.Timer(0.1, writer.log, args=(job_id, "INFO", "Generating tips")).start()
+    events = reader.wait_for_events("ml_tips", last_id, timeout=10, poll_interval=0.05)
+    assert [e["type"] for e in events] == ["log"]
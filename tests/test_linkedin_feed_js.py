@@ -0,0 +1,100 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+sync_api = pytest.importorskip("playwright.sync_api")
+
+FEED_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "linkedin_feed.html")
+
+
+@pytest.fixture(scope="module")
+def browser():
+    with sync_api.sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except sync_api.Error as e:
+            pytest.skip(f"Chromium is not available to Playwright: {e}")
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def agents(generator_modules):
+    return generator_modules("src.automation.linkedin_agents")
+
+
+@pytest.fixture
+def feed(browser):
+    page = browser.new_page()
+    with open(FEED_FIXTURE, "r", encoding="utf-8") as f:
+        page.set_content(f.read())
+    yield page
+    page.close()
+
+
+def _selectors(agents):
+    return {
+        "post": agents.FEED_POST_SELECTOR,
+        "text": agents.POST_TEXT_SELECTOR,
+        "likes": agents.REACTIONS_SELECTOR,
+        "comments": agents.COMMENTS_SELECTOR,
+    }
+
+
+def _add_post(page, author, delay_ms=0):
+    page.evaluate(
+        """([author, delay]) => setTimeout(() => {
+            const post = document.createElement("div");
+            post.className = "feed-shared-update-v2";
+            post.innerText = author;
+            document.getElementById("feed").appendChild(post);
+        }, delay)""",
+        [author, delay_ms],
+    )
+
+
+def test_extract_posts_keeps_posts_without_urn_or_text(agents, feed):
+    """Re-rendered copies are dropped, but image-only posts without any key are all kept."""
+    posts = feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": _selectors(agents), "limit": 10})
+
+    assert [post["content"] for post in posts] == [
+        "Shipping a feature store to production", "Compilers all the way down", "", "",
+    ]
+    assert posts[0] == {"urn": "urn:li:activity:1", "content": "Shipping a feature store to production",
+                        "likes": "42", "comments": "7 comments"}
+    assert posts[1]["urn"] == "urn:li:aggregate:2"
+    assert len({post["urn"] for post in posts}) == 4
+
+
+def test_extract_posts_only_returns_new_posts(agents, feed):
+    """A second call skips collected nodes and respects the limit."""
+    selectors = _selectors(agents)
+    assert len(feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": selectors, "limit": 1})) == 1
+    assert len(feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": selectors, "limit": 10})) == 3
+    assert feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": selectors, "limit": 10}) == []
+
+    _add_post(feed, "Barbara Liskov")
+    posts = feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": selectors, "limit": 10})
+    assert [post["content"] for post in posts] == [""]
+
+
+def test_scroll_and_wait_resolves_when_a_post_renders(agents, feed):
+    """The scroll wait returns as soon as an uncollected post has text, and times out otherwise."""
+    args = {"selector": agents.FEED_POST_SELECTOR, "timeout": 5000}
+    assert feed.evaluate(agents.SCROLL_AND_WAIT_JS, args)["loaded"]
+
+    feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": _selectors(agents), "limit": 10})
+    _add_post(feed, "Barbara Liskov", delay_ms=100)
+    result = feed.evaluate(agents.SCROLL_AND_WAIT_JS, args)
+    assert result["loaded"]
+    assert result["elapsed"] < 5000
+
+    feed.evaluate(agents.EXTRACT_POSTS_JS, {"selectors": _selectors(agents), "limit": 10})
+    result = feed.evaluate(agents.SCROLL_AND_WAIT_JS, {**args, "timeout": 200})
+    assert not result["loaded"]
+    assert result["elapsed"] >= 200
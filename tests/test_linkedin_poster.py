@@ -0,0 +1,34 @@
+import os
+import sys
+import asyncio
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+def test_poster_reads_drafts_from_the_data_dir(generator_modules, tmp_path, monkeypatch):
+    """Drafts and the session file live under CONTENT_DATA_DIR, not the working directory."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("CONTENT_DATA_DIR", str(data_dir))
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    poster = generator_modules("src.automation.linkedin_poster")
+    jobs = generator_modules("src.automation.jobs")
+
+    assert poster.content_stores["Tip"] is jobs.content_stores["ml_tips"]
+    assert poster.content_stores["News"].root == str(data_dir / "news_posts")
+    assert poster.browser_pool.storage_state_path == str(data_dir / "cache" / "linkedin_state.json")
+
+    published = []
+
+    async def run(action):
+        published.append(action)
+
+    jobs.content_stores["ml_tips"].put("TIP_1", "A tip")
+    monkeypatch.setattr(poster.browser_pool, "run", run)
+    assert asyncio.run(poster.post_to_linkedin("TIP_1", "Tip"))
+    assert asyncio.run(poster.post_to_linkedin("TIP_2", "Tip")) is False
+    assert len(published) == 1
+    assert not os.path.exists(elsewhere / "data")
@@ -0,0 +1,98 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.utils import llm
+from src.utils.llm_cache import LLMCache, LLMCacheMiss, request_key
+
+MESSAGES = [{"role": "user", "content": "Score this article"}]
+
+
+def _completion(content):
+    return ChatCompletion.model_validate({
+        "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+    })
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Stand-in for the OpenAI client that counts the requests that reach it."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        response = _completion(f"response {len(calls)}")
+        return SimpleNamespace(headers={}, parse=lambda: response)
+
+    completions = SimpleNamespace(with_raw_response=SimpleNamespace(create=create))
+    monkeypatch.setattr(llm, "openai", SimpleNamespace(
+        chat=SimpleNamespace(completions=completions), RateLimitError=llm.openai.RateLimitError,
+    ))
+    return calls
+
+
+def _use_cache(monkeypatch, tmp_path, mode):
+    cache = LLMCache(str(tmp_path / "llm.db"), mode)
+    monkeypatch.setattr(llm, "llm_cache", cache)
+    return cache
+
+
+def _ask(cache=False):
+    return llm.chat_completion(model="gpt-4", messages=MESSAGES, temperature=0, cache=cache)
+
+
+def test_request_key_covers_only_response_relevant_fields():
+    """Transport options don't change the key; the prompt and sampling settings do."""
+    request = {"model": "gpt-4", "messages": MESSAGES, "temperature": 0}
+    assert request_key(request) == request_key({**request, "timeout": 30})
+    assert request_key(request) != request_key({**request, "temperature": 0.7})
+    assert request_key(request) != request_key({**request, "messages": [{"role": "user", "content": "Other"}]})
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LLMCache(str(tmp_path / "llm.db"), "sometimes")
+
+
+def test_off_mode_never_touches_disk(api, monkeypatch, tmp_path):
+    _use_cache(monkeypatch, tmp_path, "off")
+    assert _ask(cache=True).choices[0].message.content == "response 1"
+    assert _ask(cache=True).choices[0].message.content == "response 2"
+    assert not os.path.exists(tmp_path / "llm.db")
+
+
+def test_on_mode_caches_only_opted_in_calls(api, monkeypatch, tmp_path):
+    """Calls with cache=True are answered from disk the second time; others always reach the API."""
+    _use_cache(monkeypatch, tmp_path, "on")
+    assert _ask().choices[0].message.content == "response 1"
+    assert _ask().choices[0].message.content == "response 2"
+    assert _ask(cache=True).choices[0].message.content == "response 3"
+    assert _ask(cache=True).choices[0].message.content == "response 3"
+    assert len(api) == 3
+
+
+def test_recorded_responses_replay_without_the_api(api, monkeypatch, tmp_path):
+    """Record stores every call, opted in or not, and replay serves them from a fresh cache."""
+    _use_cache(monkeypatch, tmp_path, "record")
+    recorded = _ask()
+
+    _use_cache(monkeypatch, tmp_path, "replay")
+    replayed = _ask()
+    assert replayed == recorded
+    assert len(api) == 1
+
+
+def test_replay_miss_raises_instead_of_calling_the_api(api, monkeypatch, tmp_path):
+    _use_cache(monkeypatch, tmp_path, "replay")
+    with pytest.raises(LLMCacheMiss):
+        _ask(cache=True)
+    assert api == []
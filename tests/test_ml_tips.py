@@ -0,0 +1,56 @@
+import os
+import sys
+import csv
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def ml_tips(generator_modules, monkeypatch):
+    module = generator_modules("src.content_generators.ml_tips")
+
+    def prompt_topic(messages):
+        return messages[-1]["content"].split("tip about ", 1)[1].split(",", 1)[0]
+
+    async def achat_completion(model, messages, **kwargs):
+        return _response(f"Tip on {prompt_topic(messages)}")
+
+    monkeypatch.setattr(module, "chat_completion",
+                        lambda model, messages, **kwargs: _response(f"Tip on {prompt_topic(messages)}"))
+    monkeypatch.setattr(module, "achat_completion", achat_completion)
+    return module
+
+
+def _csv_topics():
+    with open("data/ml_engineering_tips.csv", "r", encoding="utf-8") as f:
+        return [row["Topic"] for row in csv.DictReader(f)]
+
+
+def test_sync_batch_keeps_the_scheduled_topics(ml_tips):
+    """generate_batch returns (topic, tip) pairs, so saving them records each tip's topic."""
+    generator = ml_tips.MLTipsGenerator()
+    pairs = generator.generate_batch(3)
+
+    assert len(pairs) == 3
+    assert all(tip == f"Tip on {topic}" for topic, tip in pairs)
+    topics, tips = zip(*pairs)
+    generator.save_tips(list(tips), list(topics))
+    assert _csv_topics() == list(topics)
+
+
+def test_async_batch_saves_tips_with_topics(ml_tips):
+    generator = ml_tips.MLTipsGenerator()
+    pairs = asyncio.run(generator.agenerate_batch(3))
+
+    assert all(tip == f"Tip on {topic}" for topic, tip in pairs)
+    assert sorted(_csv_topics()) == sorted(topic for topic, _ in pairs)
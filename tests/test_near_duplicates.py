@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.near_duplicates import NearDuplicateIndex
+
+STORY = (
+    "Google DeepMind today announced Gemini 2.5 Flash, a new hybrid reasoning model that lets "
+    "developers turn thinking on or off and set a thinking budget to trade quality for cost and "
+    "latency. The model is available in preview through the Gemini API in Google AI Studio and Vertex AI."
+)
+
+
+def _article(link, title, content):
+    return {"link": link, "title": title, "content": content, "source": "test"}
+
+
+def test_syndicated_copies_collapse_to_one_representative(tmp_path):
+    """Near-identical copies of a story keep only the first to arrive."""
+    index = NearDuplicateIndex(str(tmp_path / "nd.db"))
+    articles = [
+        _article("https://deepmind.google/a", "Introducing Gemini 2.5 Flash", STORY),
+        _article("https://research.google/b", "Introducing Gemini 2.5 Flash", STORY + " Read more on our blog."),
+        _article("https://example.com/c", "Scaling feature stores at Uber", "A deep dive into how we rebuilt our online feature store for low latency serving."),
+    ]
+    duplicates = []
+    representatives = list(index.iter_representatives(articles, on_duplicate=duplicates.append))
+
+    assert [a["link"] for a in representatives] == ["https://deepmind.google/a", "https://example.com/c"]
+    assert [a["link"] for a in duplicates] == ["https://research.google/b"]
+    assert all("_signature" in a for a in representatives)
+
+
+def test_representatives_are_yielded_as_articles_arrive(tmp_path):
+    """A representative is available before later articles are read."""
+    index = NearDuplicateIndex(str(tmp_path / "nd.db"))
+    read = []
+
+    def articles():
+        for link in ("https://deepmind.google/a", "https://research.google/b"):
+            read.append(link)
+            yield _article(link, "Introducing Gemini 2.5 Flash", STORY)
+
+    stream = index.iter_representatives(articles())
+    assert next(stream)["link"] == "https://deepmind.google/a"
+    assert read == ["https://deepmind.google/a"]
+    assert list(stream) == []
+
+
+def test_previously_indexed_stories_are_dropped(tmp_path):
+    """A story seen in an earlier run is dropped even under a new URL."""
+    path = str(tmp_path / "nd.db")
+    NearDuplicateIndex(path).add_many([_article("https://deepmind.google/a", "Introducing Gemini 2.5 Flash", STORY)])
+
+    duplicates = []
+    representatives = list(NearDuplicateIndex(path).iter_representatives(
+        [_article("https://towardsdatascience.com/x", "Introducing Gemini 2.5 Flash", STORY)],
+        on_duplicate=duplicates.append,
+    ))
+    assert representatives == []
+    assert [a["link"] for a in duplicates] == ["https://towardsdatascience.com/x"]
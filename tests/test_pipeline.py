@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.pipeline import IncrementalTopK, threaded_source
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_threaded_source_yields_everything_in_order():
+    def produce(emit, stop):
+        for i in range(100):
+            emit(i)
+
+    assert list(threaded_source(produce, maxsize=4)) == list(range(100))
+
+
+def test_threaded_source_stops_producer_when_consumer_gives_up():
+    """A consumer that raises mid-stream leaves no producer or worker thread blocked."""
+    executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="test-download")
+    finished = threading.Event()
+
+    def produce(emit, stop):
+        try:
+            futures = [executor.submit(emit, i) for i in range(1000)]
+            while not stop.is_set() and not all(f.done() for f in futures):
+                time.sleep(0.01)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            finished.set()
+
+    def consume():
+        for item in threaded_source(produce, maxsize=2, name="early-exit"):
+            if item >= 3:
+                raise ValueError("scoring failed")
+
+    try:
+        consume()
+    except ValueError:
+        pass
+    assert finished.wait(5.0)
+    assert _wait_until(lambda: not any(
+        t.name == "pipeline-early-exit" or t.name.startswith("test-download") for t in threading.enumerate()
+    ))
+
+
+def test_incremental_top_k_commits_excellent_items_early():
+    selector = IncrementalTopK(3, commit_score=9.0)
+    assert selector.push(9.5, "great") == ["great"]
+    assert selector.push(5.0, "ok") == []
+    assert selector.push(7.0, "good") == []
+    assert selector.push(1.0, "bad") == []
+    assert selector.drain() == ["good", "ok"]
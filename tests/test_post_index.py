@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.storage.content_store import ContentStore
+from src.web.post_index import PostIndex, PostSource
+
+
+def _index(tmp_path):
+    tips_csv = tmp_path / "tips.csv"
+    tips_csv.write_text(
+        '"ID","Posted","Timestamp"\n'
+        '"TIP_a","false","2025-05-01T10:00:00"\n'
+        '"TIP_b","true","2025-05-02T10:00:00"\n'
+        '"TIP_missing","false","2025-05-03T10:00:00"\n',
+        encoding="utf-8",
+    )
+    store = ContentStore(str(tmp_path / "tips"))
+    store.put_many([("TIP_a", "tip a"), ("TIP_b", "tip b")])
+    return PostIndex([PostSource("ML Tip", str(tips_csv), store)]), tips_csv, store
+
+
+def test_query_pages_and_filters_without_bodies(tmp_path):
+    """Posts without a draft are skipped; pages carry metadata only."""
+    index, _, _ = _index(tmp_path)
+    total, page = index.query(limit=1)
+    assert total == 2
+    assert [p["id"] for p in page] == ["TIP_b"]
+    assert "content" not in page[0]
+    total, page = index.query(posted=False)
+    assert [p["id"] for p in page] == ["TIP_a"]
+    assert index.with_content(page)[0]["content"] == "tip a"
+
+
+def test_refreshes_when_metadata_or_store_changes(tmp_path):
+    """Rewritten CSVs and newly stored drafts show up on the next query."""
+    index, tips_csv, store = _index(tmp_path)
+    index.query()
+    store.put("TIP_missing", "now stored")
+    assert index.query()[0] == 3
+    tips_csv.write_text(
+        tips_csv.read_text(encoding="utf-8").replace('"TIP_a","false"', '"TIP_a","true"'),
+        encoding="utf-8",
+    )
+    os.utime(tips_csv, ns=(0, 10 ** 18))
+    assert [p["id"] for p in index.query(posted=False)[1]] == ["TIP_missing"]
@@ -0,0 +1,58 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.storage.content_store import ContentStore
+from src.storage.post_status_store import PostStatusStore
+from src.web.post_index import PostIndex, PostSource
+
+
+def test_allocates_unique_ids_after_existing_ones(tmp_path):
+    """Concurrent allocations never collide and continue after imported ids."""
+    posts_csv = tmp_path / "posts.csv"
+    posts_csv.write_text('"ID","Posted"\n"N_POST_0","true"\n"N_POST_7","false"\n', encoding="utf-8")
+    store = PostStatusStore(str(tmp_path / "status.db"))
+    store.import_csv_once({"news": str(posts_csv)})
+    other = PostStatusStore(str(tmp_path / "status.db"))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ids = list(pool.map(lambda i: (store if i % 2 else other).allocate_id("N_POST_"), range(20)))
+    assert sorted(ids, key=lambda x: int(x.rsplit("_", 1)[1])) == [f"N_POST_{i}" for i in range(8, 28)]
+
+
+def test_mark_posted_and_import_once(tmp_path):
+    """The CSV Posted column is imported once; later updates only touch the store."""
+    tips_csv = tmp_path / "tips.csv"
+    tips_csv.write_text('"ID","Posted"\n"TIP_a","false"\n"TIP_b","true"\n', encoding="utf-8")
+    store = PostStatusStore(str(tmp_path / "status.db"))
+    store.import_csv_once({"tip": str(tips_csv)})
+    store.register(["TIP_b", "TIP_c"], "tip")
+    store.mark_posted("TIP_a", "tip")
+    tips_csv.write_text('"ID","Posted"\n"TIP_a","false"\n"TIP_b","false"\n', encoding="utf-8")
+    store.import_csv_once({"tip": str(tips_csv)})
+    assert store.statuses() == {"TIP_a": True, "TIP_b": True, "TIP_c": False}
+
+
+def test_post_index_uses_status_store(tmp_path):
+    """Marking a post as posted shows up in the index without touching the CSV."""
+    tips_csv = tmp_path / "tips.csv"
+    tips_csv.write_text('"ID","Posted","Timestamp"\n"TIP_a","false","2025-05-01T10:00:00"\n', encoding="utf-8")
+    content = ContentStore(str(tmp_path / "tips"))
+    content.put("TIP_a", "tip a")
+    status = PostStatusStore(str(tmp_path / "status.db"))
+    index = PostIndex([PostSource("ML Tip", str(tips_csv), content)], status_store=status)
+    assert index.query(posted=False)[0] == 1
+    status.mark_posted("TIP_a", "tip")
+    assert index.query(posted=True)[0] == 1
+
+
+def test_unposted_lists_newest_drafts_of_a_kind(tmp_path):
+    store = PostStatusStore(str(tmp_path / "status.db"))
+    store.register(["N_POST_0", "N_POST_1", "N_POST_2"], "news")
+    store.register(["TIP_a"], "tip")
+    store.mark_posted("N_POST_2", "news")
+    assert store.unposted("news", 10) == ["N_POST_1", "N_POST_0"]
+    assert store.unposted("tip", 10) == ["TIP_a"]
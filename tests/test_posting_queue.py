@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import asyncio
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.storage.posting_store import PostingStore
+from src.automation import posting_queue
+from src.automation.posting_queue import PostingQueue
+
+
+def _wait_for_batch(store, batch_id, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        items = store.batch(batch_id)
+        if all(item["status"] in ("published", "failed") for item in items):
+            return items
+        time.sleep(0.05)
+    raise AssertionError(f"batch {batch_id} did not finish: {store.batch(batch_id)}")
+
+
+def test_publishes_in_order_and_reports_each_item(tmp_path):
+    """Items run one at a time in submission order; failures are reported per item."""
+    store = PostingStore(str(tmp_path / "posting.db"))
+    published, recorded = [], []
+
+    async def publish(post_id, content_type):
+        published.append(post_id)
+        return post_id != "TIP_bad"
+
+    queue = PostingQueue(store, publish, on_published=lambda post_id, _: recorded.append(post_id), interval=0)
+    queue.start()
+    batch_id = queue.submit([
+        {"post_id": "N_POST_1", "content_type": "News"},
+        {"post_id": "TIP_bad", "content_type": "Tip"},
+        {"post_id": "TIP_ok", "content_type": "Tip"},
+    ])
+    items = _wait_for_batch(store, batch_id)
+    assert published == ["N_POST_1", "TIP_bad", "TIP_ok"]
+    assert [item["status"] for item in items] == ["published", "failed", "published"]
+    assert recorded == ["N_POST_1", "TIP_ok"]
+
+
+def test_only_one_consumer_holds_the_lease(tmp_path):
+    store = PostingStore(str(tmp_path / "posting.db"))
+    assert store.acquire_lease("worker-1", ttl=60)
+    assert not store.acquire_lease("worker-2", ttl=60)
+    assert store.acquire_lease("worker-1", ttl=60)
+    assert store.acquire_lease("worker-2", ttl=-1) is False
+    assert store.acquire_lease("worker-1", ttl=-1)
+    assert store.acquire_lease("worker-2", ttl=60)
+
+
+def test_lease_is_renewed_during_a_long_publish(tmp_path, monkeypatch):
+    """A publish that outlasts the lease TTL keeps the lease, so no other consumer takes over."""
+    monkeypatch.setattr(posting_queue, "LEASE_TTL", 0.2)
+    monkeypatch.setattr(posting_queue, "LEASE_RENEW_INTERVAL", 0.05)
+    store = PostingStore(str(tmp_path / "posting.db"))
+    other_consumer = PostingStore(str(tmp_path / "posting.db"))
+    taken_over = []
+
+    async def publish(post_id, content_type):
+        for _ in range(8):
+            await asyncio.sleep(0.1)
+            taken_over.append(other_consumer.acquire_lease("worker-2", ttl=0.2))
+        return True
+
+    queue = PostingQueue(store, publish, interval=0)
+    queue.start()
+    items = _wait_for_batch(store, queue.submit([{"post_id": "N_POST_1", "content_type": "News"}]))
+    assert [item["status"] for item in items] == ["published"]
+    assert not any(taken_over)
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import asyncio
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.utils.rate_limiter import RateLimiter, parse_reset_duration
+
+
+def test_parse_reset_duration():
+    """OpenAI reset header formats are converted to seconds."""
+    assert parse_reset_duration("6m0s") == 360
+    assert parse_reset_duration("1.5s") == 1.5
+    assert parse_reset_duration("20ms") == 0.02
+    assert parse_reset_duration("2") == 2
+    assert parse_reset_duration("") is None
+
+
+def test_token_budget_is_consumed_and_corrected():
+    """Acquiring takes the estimate; releasing corrects it with actual usage."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000, max_concurrency=2)
+    limiter.acquire(400)
+    assert limiter.in_flight == 1
+    assert 599 <= limiter.tokens.level <= 601
+    limiter.release(estimated_tokens=400, actual_tokens=100)
+    assert limiter.in_flight == 0
+    assert limiter.tokens.level >= 899
+
+
+def test_headers_block_until_reset():
+    """Exhausted server quota blocks new requests until the reported reset."""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=100000, max_concurrency=4)
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "200ms"})
+    start = time.monotonic()
+    limiter.acquire(1)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_async_concurrency_is_bounded():
+    """No more than max_concurrency asyncio tasks hold a slot at once."""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=100000, max_concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.alimit(1):
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
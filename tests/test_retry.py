@@ -0,0 +1,39 @@
+import os
+import sys
+import asyncio
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.utils.retry import with_async_retry
+
+
+def test_retries_until_success():
+    """A coroutine that fails transiently is awaited again until it succeeds."""
+    attempts = []
+
+    @with_async_retry(max_tries=3, base_delay=0)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert len(attempts) == 3
+
+
+def test_reraises_after_max_tries():
+    attempts = []
+
+    @with_async_retry(max_tries=2, base_delay=0)
+    async def broken():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(broken())
+    assert len(attempts) == 2
@@ -0,0 +1,86 @@
+import os
+import sys
+from datetime import datetime
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.automation.scheduler import PostingScheduler, parse_slots
+
+# 2025-05-05 is a Monday
+MONDAY_0859 = datetime(2025, 5, 5, 8, 59).timestamp()
+
+
+class _Registry:
+    def __init__(self, strategies):
+        self.strategies = strategies
+        self.revision = 0
+
+    def load(self):
+        return self.strategies
+
+    def version(self):
+        return self.revision
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(tmp_path, strategies, clock, fired, **kwargs):
+    actions = {
+        "post": lambda strategy: fired.append(("post", strategy)),
+        "generate": lambda strategy: fired.append(("generate", strategy)),
+    }
+    return PostingScheduler(_Registry(strategies), actions, state_path=str(tmp_path / "state.json"),
+                            max_jitter=0, clock=clock, **kwargs)
+
+
+def test_parse_slots():
+    """Posting slots come from posting_schedule, generation slots from frequency."""
+    slots = parse_slots({
+        "content_types": {"tips": {"frequency": "weekly"}},
+        "posting_schedule": {"tips": [{"day": "Tuesday", "time": 600}, {"day": "friday", "time": "09:30"}]},
+    })
+    assert sorted((s.action, s.weekday, s.hour, s.minute) for s in slots) == [
+        ("generate", 0, 6, 0), ("post", 1, 10, 0), ("post", 4, 9, 30),
+    ]
+
+
+def test_fires_each_slot_once_per_week(tmp_path):
+    """Due slots of every strategy fire once and are rescheduled a week later."""
+    strategies = {"posting_schedule": {f"s{i}": [{"day": "monday", "time": "09:00"}] for i in range(20)}}
+    clock, fired = _Clock(MONDAY_0859), []
+    scheduler = _scheduler(tmp_path, strategies, clock, fired)
+    assert scheduler.run_pending() == 30.0 and fired == []
+    clock.now += 60
+    assert scheduler.run_pending() > 0
+    assert sorted(fired) == sorted(("post", f"s{i}") for i in range(20))
+    clock.now += 3600
+    scheduler.run_pending()
+    assert len(fired) == 20
+
+
+def test_missed_slots_catch_up_or_skip(tmp_path):
+    """After downtime a recent missed slot runs once unless its strategy skips missed slots."""
+    strategies = {
+        "content_types": {"late": {"missed_slots": "skip"}},
+        "posting_schedule": {
+            "news": [{"day": "monday", "time": "09:00"}],
+            "late": [{"day": "monday", "time": "09:00"}],
+        },
+    }
+    clock, fired = _Clock(MONDAY_0859), []
+    _scheduler(tmp_path, strategies, clock, fired).run_pending()
+    # Restart ten minutes after the slot
+    clock.now += 11 * 60
+    restarted = _scheduler(tmp_path, strategies, clock, fired)
+    restarted.run_pending()
+    assert fired == [("post", "news")]
+    restarted.run_pending()
+    assert fired == [("post", "news")]
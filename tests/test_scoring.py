@@ -0,0 +1,37 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.scoring import align_scores, batch_by_token_budget, parse_batch_scores
+
+
+def _article(i, content_len=100):
+    return {"title": f"Title {i}", "content": "x" * content_len, "link": f"https://example.com/{i}"}
+
+
+def test_batches_respect_token_budget_and_max_size():
+    """Batches never exceed the max size, and oversized articles get their own batch."""
+    articles = [_article(i) for i in range(7)]
+    batches = batch_by_token_budget(articles, token_budget=10_000, max_batch=3)
+    assert [len(b) for b in batches] == [3, 3, 1]
+
+    big = [_article(0, content_len=40_000), _article(1)]
+    assert [len(b) for b in batch_by_token_budget(big, token_budget=1_000, max_batch=10)] == [1, 1]
+
+
+def test_parse_batch_scores_handles_full_answer():
+    """A well-formed JSON answer yields one score tuple per ID."""
+    content = '{"A0": {"interest": 7, "accessibility": 6, "relevance": 8}, "A1": {"Interest": 3, "Accessibility": 4, "Relevance": 5}}'
+    scores = parse_batch_scores(content, ["A0", "A1"])
+    assert scores == {"A0": (7, 6, 8), "A1": (3, 4, 5)}
+
+
+def test_parse_batch_scores_tolerates_partial_answers():
+    """Truncated, chatty or out-of-range answers keep every complete entry."""
+    content = 'Sure!\n{"A0": {"interest": 12, "accessibility": 6, "relevance": 8}, "A1": {"interest": 3}, "A9": {"interest": 1, "accessibility": 1, "relevance": 1}, "A2": {"inter'
+    scores = parse_batch_scores(content, ["A0", "A1", "A2"])
+    assert scores == {"A0": (10, 6, 8)}
+    assert align_scores(scores, ["A0", "A1", "A2"]) == [(10, 6, 8), None, None]
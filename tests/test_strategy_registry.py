@@ -0,0 +1,73 @@
+import os
+import sys
+import multiprocessing
+
+import pytest
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.config.strategy_registry import StrategyRegistry
+
+
+def test_load_returns_a_shared_read_only_snapshot(tmp_path):
+    """Loads share one cached snapshot that cannot be mutated; update works on a copy."""
+    path = tmp_path / "strategies.yaml"
+    path.write_text("content_types:\n  ml_tips:\n    tone: professional\n    topics: [mlops]\n", encoding="utf-8")
+    registry = StrategyRegistry(str(path))
+    strategies = registry.load()
+    assert registry.load() is strategies
+    with pytest.raises(TypeError):
+        strategies["content_types"]["ml_tips"]["tone"] = "casual"
+    assert strategies["content_types"]["ml_tips"]["topics"] == ("mlops",)
+
+    registry.update(lambda s: s["content_types"]["ml_tips"]["topics"].append("serving"))
+    assert registry.load()["content_types"]["ml_tips"]["topics"] == ("mlops", "serving")
+    assert strategies["content_types"]["ml_tips"]["topics"] == ("mlops",)
+
+
+def test_save_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "strategies.yaml"
+    path.write_text("content_types: {}\n", encoding="utf-8")
+    os.chmod(path, 0o644)
+    registry = StrategyRegistry(str(path))
+    registry.update(lambda s: s["content_types"].__setitem__("ml_tips", {"tone": "casual"}))
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+def test_reloads_after_external_change(tmp_path):
+    """Edits made outside the registry are picked up."""
+    path = tmp_path / "strategies.yaml"
+    path.write_text("posting_schedule: {}\n", encoding="utf-8")
+    registry = StrategyRegistry(str(path))
+    assert registry.load() == {"posting_schedule": {}}
+    path.write_text("posting_schedule:\n  ml_tips: []\n", encoding="utf-8")
+    assert registry.load() == {"posting_schedule": {"ml_tips": ()}}
+
+
+def test_update_saves_atomically(tmp_path):
+    """Updates land in the file without leaving temp files behind."""
+    path = tmp_path / "strategies.yaml"
+    registry = StrategyRegistry(str(path))
+    assert registry.load() == {}
+    registry.update(lambda s: s.setdefault("content_types", {}).update({"news": {"tone": "curious"}}))
+    assert StrategyRegistry(str(path)).load() == {"content_types": {"news": {"tone": "curious"}}}
+    assert sorted(os.listdir(tmp_path)) == ["strategies.yaml", "strategies.yaml.lock"]
+
+
+def _add_counter(path, n):
+    registry = StrategyRegistry(path)
+    for _ in range(n):
+        registry.update(lambda s: s.update({"counter": s.get("counter", 0) + 1}))
+
+
+def test_updates_from_several_processes_are_not_lost(tmp_path):
+    """Read-modify-write updates are serialized across processes by the lock file."""
+    path = str(tmp_path / "strategies.yaml")
+    processes = [multiprocessing.Process(target=_add_counter, args=(path, 20)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert StrategyRegistry(path).load() == {"counter": 80}
@@ -0,0 +1,84 @@
+import os
+import re
+import sys
+import json
+from types import SimpleNamespace
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import pytest
+
+from src.content_generators.dedup import SeenIndex, RejectIndex
+from src.content_generators.near_duplicates import NearDuplicateIndex
+from src.storage.article_store import ArticleStore
+from src.storage.content_store import ContentStore
+from src.storage.post_status_store import PostStatusStore
+
+FEED_URL = "https://example.com/feed"
+ARTICLES = {
+    "https://example.com/transformers": "Serving transformer models with dynamic batching and paged attention caches.",
+    "https://example.com/feature-store": "Why our feature store moved from nightly batch jobs to streaming upserts.",
+}
+
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _chat_completion(model, messages, **kwargs):
+    prompt = messages[-1]["content"]
+    if "JSON" in messages[0]["content"]:
+        ids = re.findall(r"ID: (A\d+)", prompt)
+        return _response(json.dumps({i: {"interest": 9, "accessibility": 9, "relevance": 9} for i in ids}))
+    return _response("A post about " + re.search(r"Title: (.*)", prompt).group(1))
+
+
+@pytest.fixture
+def tech_news(tmp_path, monkeypatch, generator_modules):
+    tech_news = generator_modules("src.content_generators.tech_news")
+    monkeypatch.setattr(tech_news, "RSS_FEEDS", [FEED_URL])
+    monkeypatch.setattr(tech_news, "fetch_rss_feed", lambda url: [
+        {"title": link.rsplit("/", 1)[1], "link": link, "source": url} for link in ARTICLES
+    ])
+    monkeypatch.setattr(tech_news, "scrape_github_trending", lambda: [])
+    monkeypatch.setattr(tech_news, "fetch_article_content",
+                        lambda url, title=None: {"title": title, "content": ARTICLES[url]})
+    monkeypatch.setattr(tech_news, "chat_completion", _chat_completion)
+    monkeypatch.setattr(tech_news, "OUTPUT_SOURCES", str(tmp_path / "articles.csv"))
+    monkeypatch.setattr(tech_news, "FINAL_OUTPUT", str(tmp_path / "posts.csv"))
+    monkeypatch.setattr(tech_news, "seen_index", SeenIndex(str(tmp_path / "seen.db")))
+    monkeypatch.setattr(tech_news, "prerank_rejects", RejectIndex(str(tmp_path / "rejects.db"), ttl=3600))
+    monkeypatch.setattr(tech_news, "near_duplicate_index", NearDuplicateIndex(str(tmp_path / "near.db")))
+    monkeypatch.setattr(tech_news, "article_store", ArticleStore(str(tmp_path / "content.db")))
+    monkeypatch.setattr(tech_news, "news_store", ContentStore(str(tmp_path / "news_posts")))
+    post_status = PostStatusStore(str(tmp_path / "post_status.db"))
+    monkeypatch.setattr(tech_news, "post_status", post_status)
+    return tech_news
+
+
+def test_generate_tech_news_content_end_to_end(tech_news):
+    """The whole pipeline runs with fetches and LLM calls stubbed and produces one post per article."""
+    progress = []
+
+    tech_news.generate_tech_news_content(progress=lambda percent, message: progress.append(percent))
+
+    assert set(tech_news.post_status.statuses()) == {"N_POST_0", "N_POST_1"}
+    posts = tech_news.news_store.get_many(["N_POST_0", "N_POST_1"])
+    assert sorted(posts.values()) == ["A post about feature-store", "A post about transformers"]
+    assert progress[-1] == 100
+    assert all(link in tech_news.seen_index for link in ARTICLES)
+
+
+def test_prerank_rejections_are_not_marked_seen(tech_news, monkeypatch):
+    """Articles the pre-ranker turns away are held back for a while, not forgotten for good."""
+    rejected = "https://example.com/feature-store"
+    monkeypatch.setattr(tech_news, "build_prerank_gate", lambda records: lambda article: article["link"] != rejected)
+
+    tech_news.generate_tech_news_content()
+
+    assert rejected not in tech_news.seen_index
+    assert rejected in tech_news.prerank_rejects
+    assert [row["link"] for row in tech_news.article_store.list_articles()] == ["https://example.com/transformers"]
+    assert list(tech_news.iter_fresh_articles([{"link": rejected}])) == []
@@ -0,0 +1,52 @@
+import os
+import sys
+import random
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.content_generators.topic_scheduler import TopicScheduler, read_topic_history
+
+AREAS = {
+    "Data": ["Pipelines", "Quality", "Versioning"],
+    "Models": ["Tuning", "Compression"],
+}
+NOW = 1_750_000_000.0
+
+
+def test_batch_draws_distinct_topics():
+    """A batch never repeats a subtopic while unused ones remain."""
+    scheduler = TopicScheduler(AREAS, rng=random.Random(0))
+    topics = scheduler.next_topics(5, now=NOW)
+    assert len(set(topics)) == 5
+
+
+def test_recently_covered_topics_are_picked_last():
+    """Subtopics with recent tips are scheduled after uncovered ones."""
+    history = [("Data: Pipelines", NOW - 3600), ("Models: Tuning", NOW - 7200)]
+    scheduler = TopicScheduler(AREAS, history, rng=random.Random(0))
+    topics = scheduler.next_topics(3, now=NOW)
+    assert "Data: Pipelines" not in topics
+    assert "Models: Tuning" not in topics
+
+
+def test_consecutive_batches_rotate_through_catalogue():
+    """The scheduler remembers its own picks between batches."""
+    scheduler = TopicScheduler(AREAS, rng=random.Random(0))
+    first = scheduler.next_topics(3, now=NOW)
+    second = scheduler.next_topics(2, now=NOW + 60)
+    assert set(first) | set(second) == {f"{a}: {t}" for a, ts in AREAS.items() for t in ts}
+
+
+def test_read_topic_history_skips_rows_without_topic(tmp_path):
+    """Legacy rows without a Topic column are ignored."""
+    path = tmp_path / "tips.csv"
+    path.write_text(
+        '"ID","Posted","Timestamp","Topic"\n'
+        '"TIP_1","false","2025-05-23T14:34:16","Data: Quality"\n'
+        '"TIP_2","false","2025-05-23T14:34:16",""\n',
+        encoding="utf-8",
+    )
+    history = read_topic_history(str(path))
+    assert [topic for topic, _ in history] == ["Data: Quality"]
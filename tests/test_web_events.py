@@ -0,0 +1,68 @@
+import os
+import sys
+import json
+import time
+import threading
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+def _events(body):
+    events = []
+    for chunk in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in chunk.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_pushes_job_events_and_closes_when_done(web, monkeypatch):
+    """Events arrive as the job reports them, without waiting for the fallback poll, and the stream ends with the job."""
+    monkeypatch.setattr(web, "EVENTS_FALLBACK_POLL", 30.0)
+    store = web.job_store
+    job_id = store.create("ml_tips")
+    assert store.try_start(job_id, "ml_tips", limit=1)
+
+    def run_job():
+        time.sleep(0.2)
+        store.update(job_id, progress=50, message="Halfway")
+        time.sleep(0.2)
+        store.update(job_id, status="completed", progress=100, message="Done")
+
+    threading.Thread(target=run_job).start()
+    started = time.time()
+    response = web.app.test_client().get(f"/strategy/ml_tips/events?job_id={job_id}")
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    assert time.time() - started < 10
+    events = _events(body)
+    assert [(kind, data["status"], data["progress"]) for _, kind, data in events] == [
+        ("status", "queued", 0), ("status", "in_progress", 0), ("progress", "in_progress", 50),
+        ("status", "completed", 100),
+    ]
+    assert [event_id for event_id, _, _ in events] == sorted(event_id for event_id, _, _ in events)
+
+
+def test_reconnect_to_a_finished_job_gets_no_content(web):
+    """Once every event of a finished job was delivered, a reconnect is answered with 204 so the browser stops."""
+    store = web.job_store
+    job_id = store.create("tech_news")
+    store.update(job_id, status="error", message="Error: boom")
+    last_id = store.events_since("tech_news", 0)[-1]["id"]
+    client = web.app.test_client()
+
+    response = client.get(f"/strategy/tech_news/events?job_id={job_id}", headers={"Last-Event-ID": str(last_id)})
+    assert response.status_code == 204
+
+    replay = client.get(f"/strategy/tech_news/events?job_id={job_id}")
+    assert [data["status"] for _, _, data in _events(replay.get_data(as_text=True))] == ["queued", "error"]
+
+
+def test_stream_rejects_unknown_strategy_and_bad_event_id(web):
+    client = web.app.test_client()
+    assert client.get("/strategy/nope/events").status_code == 400
+    assert client.get("/strategy/ml_tips/events", headers={"Last-Event-ID": "abc"}).status_code == 400
@@ -0,0 +1,39 @@
+import os
+import sys
+import csv
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+def _write_tips(web, count):
+    """Tip drafts plus their metadata rows, oldest first."""
+    web.content_stores["ml_tips"].put_many((f"TIP_{i:04d}", f"Tip {i}") for i in range(count))
+    with open(os.path.join(web.DATA_DIR, "ml_engineering_tips.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(["ID", "Posted", "Timestamp", "Topic"])
+        for i in range(count):
+            writer.writerow([f"TIP_{i:04d}", "false", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}", "Caching"])
+
+
+def test_posts_without_limit_returns_every_post(web):
+    """Existing consumers that pass no limit still get the full list."""
+    _write_tips(web, 120)
+    response = web.app.test_client().get("/posts?fields=preview")
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 120
+    assert response.headers["X-Total-Count"] == "120"
+
+
+def test_posts_pages_with_limit_and_offset(web):
+    _write_tips(web, 120)
+    client = web.app.test_client()
+
+    page = client.get("/posts?fields=preview&limit=50&offset=100")
+    assert [post["id"] for post in page.get_json()] == [f"TIP_{i:04d}" for i in range(19, -1, -1)]
+    assert page.headers["X-Total-Count"] == "120"
+    assert len(client.get("/posts?fields=preview&limit=1000").get_json()) == 120
+    assert client.get("/posts?limit=-1").status_code == 400
+    assert client.get("/posts?limit=ten").status_code == 400